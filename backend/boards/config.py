@@ -96,6 +96,9 @@ class BoardsPluginConfig(BaseSettings):
     # 댓글 최대 길이
     max_comment_length: int = 2000
 
+    # 댓글 최대 깊이 (초과하는 답글은 마지막 깊이에 모아서 표시, 0이면 제한 없음)
+    max_comment_depth: int = 5
+
     # ========================================
     # 기능 토글
     # ========================================
@@ -112,6 +115,26 @@ class BoardsPluginConfig(BaseSettings):
     # 이미지 업로드 기능 활성화
     enable_images: bool = True
 
+    # ========================================
+    # 금칙어 설정
+    # ========================================
+
+    # 게시글/댓글 작성 시 금칙어 처리 방식
+    # - filter: 치환어로 바꿔서 저장
+    # - reject: 작성 거부 (400)
+    # - off: 검사하지 않음
+    forbidden_word_action: str = "filter"
+
+    # ========================================
+    # 조회수 설정
+    # ========================================
+
+    # 같은 조회자의 반복 조회를 1회로 집계하는 시간 (초)
+    view_dedupe_window: int = 600
+
+    # 누적 조회수 DB 반영 주기 (초)
+    view_count_flush_interval: int = 10
+
     class Config:
         env_prefix = "BOARDS_"
         env_file = ".env"
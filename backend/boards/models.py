@@ -104,7 +104,10 @@ class Post(Base):
     # 관계
     board = relationship("Board", back_populates="posts")
     author = relationship("User", backref="posts")
-    images = relationship("PostImage", back_populates="post", cascade="all, delete-orphan")
+    images = relationship(
+        "PostImage", back_populates="post", cascade="all, delete-orphan",
+        order_by="PostImage.sort_order",
+    )
     attachments = relationship("PostAttachment", back_populates="post", cascade="all, delete-orphan")
     comments = relationship("Comment", back_populates="post", cascade="all, delete-orphan")
     likes = relationship("PostLike", back_populates="post", cascade="all, delete-orphan")
@@ -2,11 +2,12 @@
 게시판 공개 라우터 (사용자용)
 """
 
-from fastapi import APIRouter, Depends, Query, HTTPException
+from fastapi import APIRouter, Depends, Query, HTTPException, Request
 from sqlalchemy.orm import Session
 from typing import Optional, List
 
 from core.database import get_db
+from core.cache import cached_response
 from core.security import (
     get_current_user_from_cookie,
     get_current_user_from_cookie_optional,
@@ -20,7 +21,8 @@ from .schemas import (
     CommentCreate, CommentUpdate, CommentResponse,
     LikeToggleResponse,
 )
-from .service import BoardService
+from .service import BoardService, BOARD_LIST_CACHE_NAMESPACE
+from .view_counter import get_viewer_key
 from .models import Board
 
 router = APIRouter(prefix="/public/boards", tags=["게시판 (공개)"])
@@ -32,13 +34,23 @@ router = APIRouter(prefix="/public/boards", tags=["게시판 (공개)"])
 
 @router.get("", response_model=SuccessResponse[List[BoardListResponse]])
 async def get_public_board_list(
+    request: Request,
     db: Session = Depends(get_db),
 ):
-    """활성 게시판 목록 조회 (공개)"""
-    service = BoardService(db)
-    pagination = PaginationParams(page=1, page_size=100)
-    result = service.get_board_list(pagination, is_active=True)
-    return SuccessResponse(data=result.items)
+    """활성 게시판 목록 조회 (공개, 캐시)"""
+
+    def build():
+        service = BoardService(db)
+        pagination = PaginationParams(page=1, page_size=100)
+        result = service.get_board_list(pagination, is_active=True)
+        return SuccessResponse(data=result.items)
+
+    return cached_response(
+        request,
+        namespaces=[BOARD_LIST_CACHE_NAMESPACE],
+        params={"is_active": True},
+        build=build,
+    )
 
 
 @router.get("/{board_name}", response_model=SuccessResponse[BoardResponse])
@@ -67,6 +79,7 @@ async def get_public_post_list(
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
     title: Optional[str] = None,
+    q: Optional[str] = Query(None, description="통합 검색 (제목+내용+댓글, 관련도순)"),
     current_user: Optional[dict] = Depends(get_current_user_from_cookie_optional),
     db: Session = Depends(get_db),
 ):
@@ -81,8 +94,11 @@ async def get_public_post_list(
         raise ForbiddenException(detail="이 게시판에 접근할 권한이 없습니다")
 
     pagination = PaginationParams(page=page, page_size=page_size)
-    search = PostSearchParams(title=title)
-    result = service.get_post_list(board.id, pagination, search)
+    search = PostSearchParams(title=title, q=q.strip() if q and q.strip() else None)
+    result = service.get_post_list(
+        board.id, pagination, search,
+        current_user_id=current_user.get("id") if current_user else None,
+    )
 
     return PaginatedResponse(
         data=result.items,
@@ -99,6 +115,7 @@ async def get_public_post_list(
 
 @router.get("/{board_name}/posts/{post_id}", response_model=SuccessResponse[PostResponse])
 async def get_public_post(
+    request: Request,
     board_name: str,
     post_id: int,
     current_user: Optional[dict] = Depends(get_current_user_from_cookie_optional),
@@ -114,7 +131,9 @@ async def get_public_post(
     if not service.check_read_permission(board, current_user):
         raise ForbiddenException(detail="이 게시판에 접근할 권한이 없습니다")
 
-    post = service.get_post(post_id, current_user)
+    post = service.get_post(
+        post_id, current_user, viewer_key=get_viewer_key(request, current_user)
+    )
     return SuccessResponse(data=post)
 
 
@@ -189,6 +208,38 @@ async def get_comments(
     return SuccessResponse(data=comments)
 
 
+@router.get("/{board_name}/posts/{post_id}/comments/threads", response_model=PaginatedResponse[CommentResponse])
+async def get_comment_threads(
+    board_name: str,
+    post_id: int,
+    page: int = Query(1, ge=1),
+    page_size: int = Query(20, ge=1, le=100),
+    current_user: Optional[dict] = Depends(get_current_user_from_cookie_optional),
+    db: Session = Depends(get_db),
+):
+    """댓글 목록 조회 (최상위 댓글 기준 페이지네이션, 답글 포함)"""
+    service = BoardService(db)
+
+    board = db.query(Board).filter(Board.name == board_name).first()
+    if not board or not service.check_read_permission(board, current_user):
+        raise ForbiddenException(detail="접근 권한이 없습니다")
+
+    pagination = PaginationParams(page=page, page_size=page_size)
+    result = service.get_comment_threads(post_id, pagination)
+
+    return PaginatedResponse(
+        data=result.items,
+        meta=PaginationMeta(
+            page=result.page,
+            page_size=result.page_size,
+            total_count=result.total_count,
+            total_pages=result.total_pages,
+            has_next=result.has_next,
+            has_prev=result.has_prev,
+        ),
+    )
+
+
 @router.post("/{board_name}/posts/{post_id}/comments", response_model=SuccessResponse[CommentResponse])
 async def create_comment(
     board_name: str,
@@ -250,6 +301,32 @@ async def toggle_like(
     return SuccessResponse(message=result.message, data=result)
 
 
+@router.put("/{board_name}/posts/{post_id}/like", response_model=SuccessResponse[LikeToggleResponse])
+async def like_post(
+    board_name: str,
+    post_id: int,
+    current_user: dict = Depends(get_current_user_from_cookie),
+    db: Session = Depends(get_db),
+):
+    """좋아요 (멱등, 여러 번 요청해도 한 번만 반영)"""
+    service = BoardService(db)
+    result = service.set_like(post_id, current_user["id"], liked=True)
+    return SuccessResponse(message=result.message, data=result)
+
+
+@router.delete("/{board_name}/posts/{post_id}/like", response_model=SuccessResponse[LikeToggleResponse])
+async def unlike_post(
+    board_name: str,
+    post_id: int,
+    current_user: dict = Depends(get_current_user_from_cookie),
+    db: Session = Depends(get_db),
+):
+    """좋아요 취소 (멱등)"""
+    service = BoardService(db)
+    result = service.set_like(post_id, current_user["id"], liked=False)
+    return SuccessResponse(message=result.message, data=result)
+
+
 @router.get("/{board_name}/posts/{post_id}/like", response_model=SuccessResponse[dict])
 async def get_like_status(
     board_name: str,
@@ -131,6 +131,7 @@ async def get_post_list_admin(
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
     title: Optional[str] = None,
+    q: Optional[str] = Query(None, description="통합 검색 (제목+내용+댓글, 관련도순)"),
     status: Optional[str] = None,
     is_pinned: Optional[bool] = None,
     is_notice: Optional[bool] = None,
@@ -141,6 +142,7 @@ async def get_post_list_admin(
     service = BoardService(db)
     pagination = PaginationParams(page=page, page_size=page_size)
     search = PostSearchParams(
+        q=q.strip() if q and q.strip() else None,
         title=title,
         status=status,
         is_pinned=is_pinned,
@@ -180,6 +180,9 @@ class PostListResponse(BaseModel):
     comment_count: int
     has_images: bool = False
     has_attachments: bool = False
+    is_liked: Optional[bool] = None  # 로그인 사용자의 좋아요 여부 (비로그인 시 None)
+    title_highlight: Optional[str] = None  # 통합 검색 시 제목 하이라이트
+    highlight: Optional[str] = None  # 통합 검색 시 본문/댓글 발췌문
     created_at: datetime
 
     class Config:
@@ -188,6 +191,7 @@ class PostListResponse(BaseModel):
 
 class PostSearchParams(BaseModel):
     """게시글 검색 파라미터"""
+    q: Optional[str] = None  # 통합 검색 (제목+내용+댓글, 관련도순)
     title: Optional[str] = None
     content: Optional[str] = None
     author_name: Optional[str] = None
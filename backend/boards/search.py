@@ -0,0 +1,204 @@
+"""
+게시글 검색
+
+제목/본문/댓글 통합 검색과 관련도 정렬을 제공한다.
+- PostgreSQL: pg_trgm GIN 인덱스를 사용하는 ILIKE 필터 + similarity() 정렬
+  (scripts/migrate_board_search.py로 확장/인덱스 생성)
+- 그 외(SQLite 등): 프로세스 내 n-gram 역색인 (common.search.NgramIndex)
+  + ILIKE 재확인, 색인은 백그라운드 작업(INDEX_TASK_NAME)에서 재생성
+
+검색 대상 필드: "title", "content", "comments"
+"""
+
+from abc import ABC, abstractmethod
+from typing import Iterable, Optional
+from sqlalchemy import exists, func, or_
+from sqlalchemy.orm import Query, Session
+
+from core.config import settings
+from common.search import (
+    BackgroundNgramIndex,
+    NgramIndex,
+    filter_by_candidates,
+    order_by_candidates,
+    strip_html,
+)
+from .models import Comment, Post
+
+ALL_FIELDS = ("title", "content", "comments")
+
+
+class PostSearchBackend(ABC):
+    """게시글 검색 백엔드 추상 베이스 클래스"""
+
+    @abstractmethod
+    def filter(self, query: Query, term: str, fields: Iterable[str] = ALL_FIELDS) -> Query:
+        """검색어와 일치하는 게시글만 남기도록 필터 적용"""
+        pass
+
+    @abstractmethod
+    def order_by_relevance(self, query: Query, term: str, fields: Iterable[str] = ALL_FIELDS) -> Query:
+        """관련도 내림차순 정렬 추가"""
+        pass
+
+    def index_post(self, post_id: int, title: Optional[str], content: Optional[str]) -> None:
+        """게시글 색인 갱신 (색인을 유지하는 백엔드만 구현)"""
+        pass
+
+    def index_comments(self, post_id: int) -> None:
+        """게시글 댓글 색인 갱신 (색인을 유지하는 백엔드만 구현)"""
+        pass
+
+
+def _substring_condition(term: str, fields: Iterable[str]):
+    """필드 중 하나라도 검색어를 포함하는 조건 (ILIKE), 대상 필드가 없으면 None"""
+    pattern = f"%{term}%"
+    conditions = []
+    if "title" in fields:
+        conditions.append(Post.title.ilike(pattern))
+    if "content" in fields:
+        conditions.append(Post.content.ilike(pattern))
+    if "comments" in fields:
+        conditions.append(
+            exists().where(
+                Comment.post_id == Post.id,
+                Comment.is_deleted == False,
+                Comment.content.ilike(pattern),
+            )
+        )
+    return or_(*conditions) if conditions else None
+
+
+class PostgresPostSearch(PostSearchBackend):
+    """PostgreSQL pg_trgm 기반 게시글 검색"""
+
+    def filter(self, query: Query, term: str, fields: Iterable[str] = ALL_FIELDS) -> Query:
+        condition = _substring_condition(term, fields)
+        return query.filter(condition) if condition is not None else query
+
+    def order_by_relevance(self, query: Query, term: str, fields: Iterable[str] = ALL_FIELDS) -> Query:
+        # 제목 일치에 가중치, 본문은 word_similarity(부분 일치 유사도)
+        score = func.similarity(Post.title, term) * 2 if "title" in fields else None
+        if "content" in fields:
+            content_score = func.word_similarity(term, Post.content)
+            score = content_score if score is None else score + content_score
+        if score is None:
+            return query
+        return query.order_by(score.desc())
+
+
+# 색인 재생성 백그라운드 작업 이름 (main.py에서 등록)
+INDEX_TASK_NAME = "post_search_index"
+
+
+def _comment_text(db: Session, post_id: int) -> str:
+    rows = db.query(Comment.content).filter(
+        Comment.post_id == post_id,
+        Comment.is_deleted == False,
+    ).all()
+    return " ".join(content for (content,) in rows)
+
+
+def _build_post_index(db: Session) -> dict[str, NgramIndex]:
+    """제목/본문/댓글 별도 색인 생성"""
+    titles = NgramIndex(n=2)
+    # 본문/댓글은 크기가 커서 원문을 저장하지 않음 (한 글자 검색은 제목만 지원)
+    contents = NgramIndex(n=2, store_text=False)
+    comments = NgramIndex(n=2, store_text=False)
+
+    for post_id, title, content in db.query(Post.id, Post.title, Post.content).yield_per(500):
+        titles.add(post_id, title)
+        contents.add(post_id, strip_html(content))
+
+    comment_texts: dict[int, list[str]] = {}
+    rows = db.query(Comment.post_id, Comment.content).filter(
+        Comment.is_deleted == False,
+    ).yield_per(1000)
+    for post_id, content in rows:
+        comment_texts.setdefault(post_id, []).append(content)
+    for post_id, texts in comment_texts.items():
+        comments.add(post_id, " ".join(texts))
+
+    return {"title": titles, "content": contents, "comments": comments}
+
+
+# 프로세스 공유 게시글 색인
+# 같은 프로세스의 변경은 BoardService가 증분 반영, 다른 프로세스의 변경은 주기적 재생성으로 반영한다.
+# 삭제는 상태 변경(소프트 삭제)이므로 색인에 남기고 조회 시 상태로 거른다.
+_post_ngram_index = BackgroundNgramIndex(INDEX_TASK_NAME, _build_post_index)
+
+
+def refresh_post_search_index_job() -> None:
+    """백그라운드 작업용 진입점 (검색이 있었을 때만 색인 재생성)"""
+    _post_ngram_index.refresh_if_requested()
+
+
+class NgramPostSearch(PostSearchBackend):
+    """
+    인메모리 n-gram 역색인 기반 게시글 검색 (SQLite 등)
+
+    색인으로 찾은 후보를 게시판/상태 등 다른 조건과 함께 거르고,
+    n-gram만 겹치고 검색어를 그대로 포함하지 않는 게시글은 ILIKE로 다시 확인해 제외한다.
+    색인이 아직 없거나 (첫 재생성 전) 후보가 너무 많으면 ILIKE만으로 검색한다
+    (common.search.filter_by_candidates).
+    """
+
+    # 필드별 점수 가중치 (필드 일치 자체에 기본 점수를 주어 제목 > 본문 > 댓글 순으로 우선)
+    FIELD_WEIGHTS = {"title": 2.0, "content": 1.0, "comments": 0.5}
+
+    def __init__(self, db: Session):
+        self.db = db
+        self._results: dict[tuple, Optional[list[tuple[int, float]]]] = {}
+
+    def _search(self, term: str, fields: Iterable[str]) -> Optional[list[tuple[int, float]]]:
+        """색인 검색 결과 (점수 내림차순), 색인이 없으면 None"""
+        key = (term, tuple(sorted(fields)))
+        if key not in self._results:
+            indexes = _post_ngram_index.get()
+            if indexes is None:
+                self._results[key] = None
+                return None
+            scores: dict[int, float] = {}
+            for field in key[1]:
+                weight = self.FIELD_WEIGHTS[field]
+                for post_id, score in indexes[field].search(term):
+                    scores[post_id] = scores.get(post_id, 0.0) + (1.0 + score) * weight
+            self._results[key] = sorted(scores.items(), key=lambda r: (-r[1], -r[0]))
+        return self._results[key]
+
+    def filter(self, query: Query, term: str, fields: Iterable[str] = ALL_FIELDS) -> Query:
+        fields = tuple(fields)
+        substring = _substring_condition(term, fields)
+        if substring is None:
+            return query
+        return filter_by_candidates(query, Post.id, self._search(term, fields), substring)
+
+    def order_by_relevance(self, query: Query, term: str, fields: Iterable[str] = ALL_FIELDS) -> Query:
+        return order_by_candidates(query, Post.id, self._search(term, fields))
+
+    def index_post(self, post_id: int, title: Optional[str], content: Optional[str]) -> None:
+        plain = strip_html(content)
+
+        def change(indexes: dict[str, NgramIndex]) -> None:
+            indexes["title"].add(post_id, title)
+            indexes["content"].add(post_id, plain)
+
+        _post_ngram_index.update(change)
+        self._results.clear()
+
+    def index_comments(self, post_id: int) -> None:
+        text = _comment_text(self.db, post_id)
+        _post_ngram_index.update(lambda indexes: indexes["comments"].add(post_id, text))
+        self._results.clear()
+
+
+def get_post_search(db: Session) -> PostSearchBackend:
+    """설정과 DB 종류에 따라 적절한 검색 백엔드 반환"""
+    backend = settings.SEARCH_BACKEND.lower()
+
+    if backend == "auto":
+        backend = "postgres" if db.get_bind().dialect.name == "postgresql" else "ngram"
+
+    if backend == "postgres":
+        return PostgresPostSearch()
+    return NgramPostSearch(db)
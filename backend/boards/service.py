@@ -18,12 +18,20 @@ Example:
 """
 
 from typing import Optional, List, Type, Any
-from datetime import datetime, timezone, timedelta
-from sqlalchemy.orm import Session
+from datetime import timedelta
+from sqlalchemy import case, delete, exists, func, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, aliased, joinedload, load_only, selectinload
 
+from core.cache import response_cache
 from common.errors import NotFoundException, BadRequestException, ForbiddenException
 from common.pagination import Pagination, PaginationParams
+from common.search import make_highlight
+from forbidden_words.models import ForbiddenWordTarget
+from forbidden_words.service import ForbiddenWordService
 from .config import BoardsPluginConfig, boards_plugin_config
+from .search import PostSearchBackend, get_post_search
+from .view_counter import view_counter
 from .models import (
     Board, Post, PostImage, PostAttachment, Comment, PostLike,
     ReadPermission, WritePermission, CommentPermission, PostStatus
@@ -37,6 +45,14 @@ from .schemas import (
 )
 from users.models import User
 
+# 공개 게시판 목록 응답 캐시 네임스페이스
+BOARD_LIST_CACHE_NAMESPACE = "boards:list"
+
+
+def invalidate_board_cache() -> None:
+    """게시판/게시글 변경 시 공개 게시판 목록 캐시 무효화"""
+    response_cache.invalidate(BOARD_LIST_CACHE_NAMESPACE)
+
 
 class BoardService:
     """
@@ -56,6 +72,42 @@ class BoardService:
         self.db = db
         self.config = config or boards_plugin_config
         self.user_model = user_model or User
+        self._search_backend: Optional[PostSearchBackend] = None
+
+    @property
+    def search_backend(self) -> PostSearchBackend:
+        """게시글 검색 백엔드 (pg_trgm 또는 인메모리 n-gram)"""
+        if self._search_backend is None:
+            self._search_backend = get_post_search(self.db)
+        return self._search_backend
+
+    def _moderate_text(
+        self,
+        text: Optional[str],
+        target: ForbiddenWordTarget,
+        is_html: bool = False,
+    ) -> Optional[str]:
+        """
+        작성 내용 금칙어 처리 (config.forbidden_word_action)
+
+        filter이면 치환된 텍스트를 반환하고, reject이면 금칙어 포함 시 예외를 발생시킨다.
+        is_html이면 (게시글 본문) 태그/속성은 그대로 두고 텍스트 노드만 검사한다.
+        """
+        action = self.config.forbidden_word_action
+        if not text or action == "off":
+            return text
+
+        service = ForbiddenWordService(self.db)
+        check = service.check_html if is_html else service.check_text
+        contains_forbidden, matched_words, filtered_text = check(text, target)
+        if not contains_forbidden:
+            return text
+        if action == "reject":
+            raise BadRequestException(
+                detail=f"금칙어가 포함되어 있습니다: {', '.join(matched_words)}",
+                error_code="FORBIDDEN_WORD",
+            )
+        return filtered_text
 
     # ============================================
     # Board CRUD
@@ -70,6 +122,7 @@ class BoardService:
         board = Board(**data.model_dump())
         self.db.add(board)
         self.db.commit()
+        invalidate_board_cache()
         self.db.refresh(board)
 
         return BoardResponse.model_validate(board)
@@ -103,22 +156,30 @@ class BoardService:
 
         result = Pagination.from_query(query, pagination)
 
-        items = []
-        for board in result.items:
-            post_count = self.db.query(Post).filter(
-                Post.board_id == board.id,
-                Post.status == PostStatus.PUBLISHED.value
-            ).count()
+        # 게시글 수는 페이지의 게시판 전체를 GROUP BY 한 번으로 집계
+        board_ids = [board.id for board in result.items]
+        post_counts = dict(
+            self.db.query(Post.board_id, func.count(Post.id))
+            .filter(
+                Post.board_id.in_(board_ids),
+                Post.status == PostStatus.PUBLISHED.value,
+            )
+            .group_by(Post.board_id)
+            .all()
+        ) if board_ids else {}
 
-            items.append(BoardListResponse(
+        items = [
+            BoardListResponse(
                 id=board.id,
                 name=board.name,
                 title=board.title,
                 description=board.description,
                 is_active=board.is_active,
                 sort_order=board.sort_order,
-                post_count=post_count,
-            ))
+                post_count=post_counts.get(board.id, 0),
+            )
+            for board in result.items
+        ]
 
         return Pagination(
             items=items,
@@ -128,27 +189,10 @@ class BoardService:
         )
 
     def get_board_stats(self) -> BoardStats:
-        """게시판 통계"""
-        total = self.db.query(Board).count()
-        active = self.db.query(Board).filter(Board.is_active == True).count()
-        inactive = total - active
-        total_posts = self.db.query(Post).filter(
-            Post.status == PostStatus.PUBLISHED.value
-        ).count()
-
-        today = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
-        today_posts = self.db.query(Post).filter(
-            Post.status == PostStatus.PUBLISHED.value,
-            Post.created_at >= today
-        ).count()
-
-        return BoardStats(
-            total=total,
-            active=active,
-            inactive=inactive,
-            total_posts=total_posts,
-            today_posts=today_posts,
-        )
+        """게시판 통계 (대시보드 스냅샷에서 제공, 짧은 주기로 캐시됨)"""
+        from visitors.dashboard import get_dashboard_snapshot
+
+        return BoardStats(**get_dashboard_snapshot(self.db).boards)
 
     def update_board(self, board_id: int, data: BoardUpdate) -> BoardResponse:
         """게시판 수정"""
@@ -167,6 +211,7 @@ class BoardService:
             setattr(board, field, value)
 
         self.db.commit()
+        invalidate_board_cache()
         self.db.refresh(board)
 
         return BoardResponse.model_validate(board)
@@ -179,6 +224,7 @@ class BoardService:
 
         self.db.delete(board)
         self.db.commit()
+        invalidate_board_cache()
         return True
 
     def reorder_boards(self, board_ids: List[int]) -> bool:
@@ -188,6 +234,7 @@ class BoardService:
             if board:
                 board.sort_order = index
         self.db.commit()
+        invalidate_board_cache()
         return True
 
     # ============================================
@@ -268,8 +315,8 @@ class BoardService:
         post = Post(
             board_id=data.board_id,
             author_id=author_id,
-            title=data.title,
-            content=data.content,
+            title=self._moderate_text(data.title, ForbiddenWordTarget.POST_TITLE),
+            content=self._moderate_text(data.content, ForbiddenWordTarget.POST_CONTENT, is_html=True),
             is_pinned=data.is_pinned if is_admin else False,
             is_notice=data.is_notice if is_admin else False,
             status=PostStatus.PUBLISHED.value,
@@ -287,7 +334,9 @@ class BoardService:
                 self.db.add(image)
 
         self.db.commit()
+        invalidate_board_cache()
         self.db.refresh(post)
+        self.search_backend.index_post(post.id, post.title, post.content)
 
         return self._build_post_response(post)
 
@@ -296,15 +345,20 @@ class BoardService:
         post_id: int,
         current_user: Optional[dict] = None,
         increment_view: bool = True,
+        viewer_key: Optional[str] = None,
     ) -> PostResponse:
-        """게시글 상세 조회"""
-        post = self.db.query(Post).filter(Post.id == post_id).first()
+        """
+        게시글 상세 조회
+
+        조회수는 버퍼에 누적하고 주기적으로 반영한다 (boards.view_counter).
+        viewer_key가 있으면 같은 조회자의 반복 조회는 한 번만 집계한다.
+        """
+        post = self._post_detail_query().filter(Post.id == post_id).first()
         if not post:
             raise NotFoundException(detail="게시글을 찾을 수 없습니다")
 
         if increment_view:
-            post.view_count += 1
-            self.db.commit()
+            view_counter.record(post_id, viewer_key)
 
         return self._build_post_response(post, current_user)
 
@@ -314,8 +368,16 @@ class BoardService:
         pagination: PaginationParams,
         search: Optional[PostSearchParams] = None,
         include_hidden: bool = False,
+        current_user_id: Optional[int] = None,
     ) -> Pagination[PostListResponse]:
-        """게시글 목록 조회"""
+        """
+        게시글 목록 조회
+
+        작성자명은 외부 조인, 이미지/첨부 여부는 EXISTS 서브쿼리로 함께 조회해
+        페이지 크기와 무관하게 COUNT 1회 + 목록 1회로 처리한다.
+        통합 검색(q)은 관련도순으로 정렬하고 하이라이트를 포함한다.
+        current_user_id가 있으면 좋아요 여부를 IN 쿼리 한 번으로 채운다.
+        """
         query = self.db.query(Post).filter(Post.board_id == board_id)
 
         if not include_hidden:
@@ -325,7 +387,9 @@ class BoardService:
             if search.title:
                 query = query.filter(Post.title.ilike(f"%{search.title}%"))
             if search.content:
-                query = query.filter(Post.content.ilike(f"%{search.content}%"))
+                query = self.search_backend.filter(query, search.content, fields=("content",))
+            if search.q:
+                query = self.search_backend.filter(query, search.q)
             if search.status:
                 query = query.filter(Post.status == search.status)
             if search.is_pinned is not None:
@@ -333,25 +397,41 @@ class BoardService:
             if search.is_notice is not None:
                 query = query.filter(Post.is_notice == search.is_notice)
 
-        query = query.order_by(
-            Post.is_pinned.desc(),
-            Post.is_notice.desc(),
-            Post.created_at.desc()
-        )
+        total_count = query.count()
 
-        result = Pagination.from_query(query, pagination)
+        has_images = exists().where(PostImage.post_id == Post.id).label("has_images")
+        has_attachments = exists().where(PostAttachment.post_id == Post.id).label("has_attachments")
 
-        items = []
-        for post in result.items:
+        if search and search.q:
+            query = self.search_backend.order_by_relevance(query, search.q)
+            query = query.order_by(Post.created_at.desc())
+        else:
+            query = query.order_by(
+                Post.is_pinned.desc(),
+                Post.is_notice.desc(),
+                Post.created_at.desc()
+            )
+
+        rows = (
+            query
             # 플러그인: user_model 사용
-            author = self.db.query(self.user_model).filter(self.user_model.id == post.author_id).first() if post.author_id else None
-            has_images = self.db.query(PostImage).filter(PostImage.post_id == post.id).count() > 0
-            has_attachments = self.db.query(PostAttachment).filter(PostAttachment.post_id == post.id).count() > 0
+            .outerjoin(self.user_model, self.user_model.id == Post.author_id)
+            .options(load_only(
+                Post.id, Post.board_id, Post.title, Post.status, Post.is_pinned,
+                Post.is_notice, Post.view_count, Post.like_count, Post.comment_count,
+                Post.created_at,
+            ))
+            .add_columns(self.user_model.name.label("author_name"), has_images, has_attachments)
+            .offset(pagination.offset)
+            .limit(pagination.page_size)
+            .all()
+        )
 
-            items.append(PostListResponse(
+        items = [
+            PostListResponse(
                 id=post.id,
                 board_id=post.board_id,
-                author_name=author.name if author else None,
+                author_name=author_name,
                 title=post.title,
                 status=post.status,
                 is_pinned=post.is_pinned,
@@ -359,18 +439,58 @@ class BoardService:
                 view_count=post.view_count,
                 like_count=post.like_count,
                 comment_count=post.comment_count,
-                has_images=has_images,
-                has_attachments=has_attachments,
+                has_images=bool(post_has_images),
+                has_attachments=bool(post_has_attachments),
                 created_at=post.created_at,
-            ))
+            )
+            for post, author_name, post_has_images, post_has_attachments in rows
+        ]
+
+        if search and search.q and items:
+            self._apply_highlights(items, search.q)
+
+        if current_user_id and items:
+            liked_ids = self.get_liked_post_ids(current_user_id, [item.id for item in items])
+            for item in items:
+                item.is_liked = item.id in liked_ids
 
         return Pagination(
             items=items,
-            total_count=result.total_count,
-            page=result.page,
-            page_size=result.page_size,
+            total_count=total_count,
+            page=pagination.page,
+            page_size=pagination.page_size,
+        )
+
+    def _apply_highlights(self, items: List[PostListResponse], term: str) -> None:
+        """검색 결과 하이라이트 (본문에 없으면 댓글에서 발췌)"""
+        post_ids = [item.id for item in items]
+        contents = dict(
+            self.db.query(Post.id, Post.content).filter(Post.id.in_(post_ids)).all()
         )
 
+        for item in items:
+            item.title_highlight = make_highlight(item.title, term, max_length=len(item.title))
+            item.highlight = make_highlight(contents.get(item.id), term)
+
+        missing = [item.id for item in items if item.highlight is None]
+        if not missing:
+            return
+
+        comment_highlights: dict[int, str] = {}
+        rows = self.db.query(Comment.post_id, Comment.content).filter(
+            Comment.post_id.in_(missing),
+            Comment.is_deleted == False,
+        ).order_by(Comment.created_at.asc())
+        for post_id, content in rows:
+            if post_id not in comment_highlights:
+                highlight = make_highlight(content, term)
+                if highlight:
+                    comment_highlights[post_id] = highlight
+
+        for item in items:
+            if item.highlight is None:
+                item.highlight = comment_highlights.get(item.id)
+
     def update_post(
         self,
         post_id: int,
@@ -393,11 +513,21 @@ class BoardService:
             update_data.pop("is_notice", None)
             update_data.pop("status", None)
 
+        if "title" in update_data:
+            update_data["title"] = self._moderate_text(update_data["title"], ForbiddenWordTarget.POST_TITLE)
+        if "content" in update_data:
+            update_data["content"] = self._moderate_text(
+                update_data["content"], ForbiddenWordTarget.POST_CONTENT, is_html=True
+            )
+
         for field, value in update_data.items():
             setattr(post, field, value)
 
         self.db.commit()
+        invalidate_board_cache()
         self.db.refresh(post)
+        if "title" in update_data or "content" in update_data:
+            self.search_backend.index_post(post.id, post.title, post.content)
 
         return self._build_post_response(post, current_user)
 
@@ -417,6 +547,7 @@ class BoardService:
 
         post.status = PostStatus.DELETED.value
         self.db.commit()
+        invalidate_board_cache()
 
         return True
 
@@ -432,25 +563,46 @@ class BoardService:
 
         return self._build_post_response(post)
 
+    def _post_detail_query(self):
+        """
+        게시글 상세 조회 쿼리
+
+        작성자는 JOIN, 이미지/첨부파일은 IN 배치(selectin)로 함께 로드한다.
+        게시판은 _build_post_response에서 세션 identity map으로 조회한다.
+        """
+        options = [selectinload(Post.images), selectinload(Post.attachments)]
+        if self.user_model is User:
+            options.append(joinedload(Post.author))
+        return self.db.query(Post).options(*options)
+
     def _build_post_response(
         self,
         post: Post,
         current_user: Optional[dict] = None,
     ) -> PostResponse:
-        """게시글 응답 빌드"""
-        board = self.db.query(Board).filter(Board.id == post.board_id).first()
+        """
+        게시글 응답 빌드
+
+        게시판/작성자는 Session.get으로 조회해 같은 요청(세션)에서 이미 로드된
+        객체를 재사용한다 (라우터에서 게시판을 조회했다면 추가 쿼리 없음).
+        """
+        board = self.db.get(Board, post.board_id)
         # 플러그인: user_model 사용
-        author = self.db.query(self.user_model).filter(self.user_model.id == post.author_id).first() if post.author_id else None
-        images = self.db.query(PostImage).filter(PostImage.post_id == post.id).order_by(PostImage.sort_order).all()
-        attachments = self.db.query(PostAttachment).filter(PostAttachment.post_id == post.id).all()
+        if not post.author_id:
+            author = None
+        elif self.user_model is User:
+            author = post.author
+        else:
+            author = self.db.get(self.user_model, post.author_id)
 
         is_liked = False
-        if current_user:
-            like = self.db.query(PostLike).filter(
-                PostLike.post_id == post.id,
-                PostLike.user_id == current_user.get("id"),
-            ).first()
-            is_liked = like is not None
+        if current_user and current_user.get("id"):
+            is_liked = self.db.query(
+                exists().where(
+                    PostLike.post_id == post.id,
+                    PostLike.user_id == current_user.get("id"),
+                )
+            ).scalar()
 
         return PostResponse(
             id=post.id,
@@ -468,11 +620,11 @@ class BoardService:
             status=post.status,
             is_pinned=post.is_pinned,
             is_notice=post.is_notice,
-            view_count=post.view_count,
+            view_count=(post.view_count or 0) + view_counter.pending(post.id),
             like_count=post.like_count,
             comment_count=post.comment_count,
-            images=[PostImageResponse.model_validate(img) for img in images],
-            attachments=[PostAttachmentResponse.model_validate(att) for att in attachments],
+            images=[PostImageResponse.model_validate(img) for img in post.images],
+            attachments=[PostAttachmentResponse.model_validate(att) for att in post.attachments],
             is_liked=is_liked,
             created_at=post.created_at,
             updated_at=post.updated_at,
@@ -505,25 +657,74 @@ class BoardService:
             post_id=post_id,
             author_id=author_id,
             parent_id=data.parent_id,
-            content=data.content,
+            content=self._moderate_text(data.content, ForbiddenWordTarget.COMMENT),
         )
         self.db.add(comment)
 
         post.comment_count += 1
 
         self.db.commit()
+        self.search_backend.index_comments(post_id)
         self.db.refresh(comment)
 
         return self._build_comment_response(comment)
 
     def get_comments(self, post_id: int) -> List[CommentResponse]:
-        """게시글 댓글 목록 조회 (트리 구조)"""
+        """
+        게시글 댓글 목록 조회 (트리 구조)
+
+        게시글의 모든 댓글을 한 번에 조회한 뒤 메모리에서 트리를 구성한다.
+        """
         comments = self.db.query(Comment).filter(
             Comment.post_id == post_id,
+        ).order_by(Comment.created_at.asc(), Comment.id.asc()).all()
+
+        root_ids = [c.id for c in comments if c.parent_id is None]
+        return self._build_comment_tree(comments, root_ids)
+
+    def get_comment_threads(
+        self,
+        post_id: int,
+        pagination: PaginationParams,
+    ) -> Pagination[CommentResponse]:
+        """
+        게시글 댓글 목록 조회 (최상위 댓글 기준 페이지네이션)
+
+        페이지의 최상위 댓글과 그 하위 답글 전체를 재귀 CTE로 한 번에 조회한다.
+        """
+        root_query = self.db.query(Comment.id).filter(
+            Comment.post_id == post_id,
             Comment.parent_id.is_(None),
-        ).order_by(Comment.created_at.asc()).all()
+        )
+        total_count = root_query.count()
+        root_ids = [
+            row.id for row in root_query
+            .order_by(Comment.created_at.asc(), Comment.id.asc())
+            .offset(pagination.offset)
+            .limit(pagination.page_size)
+        ]
+
+        comments = []
+        if root_ids:
+            reply = aliased(Comment)
+            tree = (
+                select(Comment.id)
+                .where(Comment.id.in_(root_ids))
+                .cte("comment_tree", recursive=True)
+            )
+            tree = tree.union_all(
+                select(reply.id).where(reply.parent_id == tree.c.id)
+            )
+            comments = self.db.query(Comment).filter(
+                Comment.id.in_(select(tree.c.id)),
+            ).order_by(Comment.created_at.asc(), Comment.id.asc()).all()
 
-        return [self._build_comment_response(c, include_replies=True) for c in comments]
+        return Pagination(
+            items=self._build_comment_tree(comments, root_ids),
+            total_count=total_count,
+            page=pagination.page,
+            page_size=pagination.page_size,
+        )
 
     def update_comment(
         self,
@@ -540,8 +741,9 @@ class BoardService:
         if not is_admin and comment.author_id != current_user.get("id"):
             raise ForbiddenException(detail="수정 권한이 없습니다")
 
-        comment.content = data.content
+        comment.content = self._moderate_text(data.content, ForbiddenWordTarget.COMMENT)
         self.db.commit()
+        self.search_backend.index_comments(comment.post_id)
         self.db.refresh(comment)
 
         return self._build_comment_response(comment)
@@ -568,81 +770,224 @@ class BoardService:
             post.comment_count -= 1
 
         self.db.commit()
+        self.search_backend.index_comments(comment.post_id)
 
         return True
 
-    def _build_comment_response(
-        self,
-        comment: Comment,
-        include_replies: bool = False,
-    ) -> CommentResponse:
-        """댓글 응답 빌드"""
-        # 플러그인: user_model 사용
-        author = self.db.query(self.user_model).filter(self.user_model.id == comment.author_id).first() if comment.author_id else None
-
-        replies = []
-        if include_replies:
-            reply_comments = self.db.query(Comment).filter(
-                Comment.parent_id == comment.id
-            ).order_by(Comment.created_at.asc()).all()
-            replies = [self._build_comment_response(r, include_replies=True) for r in reply_comments]
+    def _load_authors(self, author_ids) -> dict:
+        """작성자 일괄 조회 (id -> AuthorResponse)"""
+        author_ids = {author_id for author_id in author_ids if author_id}
+        if not author_ids:
+            return {}
 
-        return CommentResponse(
-            id=comment.id,
-            post_id=comment.post_id,
-            author=AuthorResponse(
+        # 플러그인: user_model 사용
+        authors = self.db.query(self.user_model).filter(self.user_model.id.in_(author_ids)).all()
+        return {
+            author.id: AuthorResponse(
                 id=author.id,
                 name=author.name,
                 nickname=author.nickname,
                 profile_image=author.profile_image,
-            ) if author else None,
+            )
+            for author in authors
+        }
+
+    def _to_comment_response(self, comment: Comment, authors: dict) -> CommentResponse:
+        return CommentResponse(
+            id=comment.id,
+            post_id=comment.post_id,
+            author=authors.get(comment.author_id),
             parent_id=comment.parent_id,
             content=comment.content,
             is_deleted=comment.is_deleted,
-            replies=replies,
+            replies=[],
             created_at=comment.created_at,
             updated_at=comment.updated_at,
         )
 
+    def _build_comment_tree(
+        self,
+        comments: List[Comment],
+        root_ids: List[int],
+    ) -> List[CommentResponse]:
+        """
+        댓글 트리 구성 (O(n))
+
+        comments는 작성순으로 정렬되어 있어야 한다.
+        max_comment_depth를 넘는 답글은 마지막 깊이의 댓글 아래에 작성순으로 모은다
+        (parent_id는 원래 부모를 유지).
+        """
+        authors = self._load_authors(c.author_id for c in comments)
+        nodes = {c.id: self._to_comment_response(c, authors) for c in comments}
+
+        children: dict[int, List[int]] = {}
+        for comment in comments:
+            if comment.parent_id is not None:
+                children.setdefault(comment.parent_id, []).append(comment.id)
+
+        max_depth = self.config.max_comment_depth
+        flattened_anchors = set()
+
+        # (댓글 ID, 깊이, 답글을 붙일 댓글 ID)
+        stack = [(root_id, 1, root_id) for root_id in root_ids if root_id in nodes]
+        while stack:
+            comment_id, depth, anchor_id = stack.pop()
+            for child_id in children.get(comment_id, []):
+                if max_depth <= 0 or depth < max_depth:
+                    nodes[comment_id].replies.append(nodes[child_id])
+                    stack.append((child_id, depth + 1, child_id))
+                else:
+                    nodes[anchor_id].replies.append(nodes[child_id])
+                    flattened_anchors.add(anchor_id)
+                    stack.append((child_id, depth, anchor_id))
+
+        for anchor_id in flattened_anchors:
+            nodes[anchor_id].replies.sort(key=lambda r: (r.created_at, r.id))
+
+        return [nodes[root_id] for root_id in root_ids if root_id in nodes]
+
+    def _build_comment_response(self, comment: Comment) -> CommentResponse:
+        """댓글 응답 빌드 (단일 댓글, 답글 제외)"""
+        return self._to_comment_response(comment, self._load_authors([comment.author_id]))
+
     # ============================================
     # Like
     # ============================================
 
-    def toggle_like(self, post_id: int, user_id: int) -> LikeToggleResponse:
-        """좋아요 토글"""
-        post = self.db.query(Post).filter(Post.id == post_id).first()
-        if not post:
-            raise NotFoundException(detail="게시글을 찾을 수 없습니다")
+    def _insert_like(self, post_id: int, user_id: int) -> bool:
+        """
+        좋아요 추가 (INSERT ... ON CONFLICT DO NOTHING)
+
+        Returns:
+            새로 추가되었으면 True, 이미 있으면 False
+        """
+        likes = PostLike.__table__
+        values = {"post_id": post_id, "user_id": user_id}
+        dialect = self.db.get_bind().dialect.name
+
+        if dialect in ("postgresql", "sqlite"):
+            if dialect == "postgresql":
+                from sqlalchemy.dialects.postgresql import insert as dialect_insert
+            else:
+                from sqlalchemy.dialects.sqlite import insert as dialect_insert
+            stmt = (
+                dialect_insert(likes)
+                .values(**values)
+                .on_conflict_do_nothing(index_elements=["post_id", "user_id"])
+                .returning(likes.c.id)
+            )
+            return self.db.execute(stmt).first() is not None
 
-        existing = self.db.query(PostLike).filter(
-            PostLike.post_id == post_id,
-            PostLike.user_id == user_id,
-        ).first()
+        # 그 외 DB: 유니크 제약조건 위반을 세이브포인트로 처리
+        try:
+            with self.db.begin_nested():
+                self.db.execute(insert(likes).values(**values))
+            return True
+        except IntegrityError:
+            return False
 
-        if existing:
-            self.db.delete(existing)
-            post.like_count = max(0, post.like_count - 1)
-            self.db.commit()
-            return LikeToggleResponse(
-                is_liked=False,
-                like_count=post.like_count,
-                message="좋아요를 취소했습니다",
+    def _delete_like(self, post_id: int, user_id: int) -> bool:
+        """
+        좋아요 삭제 (DELETE ... RETURNING)
+
+        Returns:
+            삭제되었으면 True, 없었으면 False
+        """
+        likes = PostLike.__table__
+        stmt = delete(likes).where(likes.c.post_id == post_id, likes.c.user_id == user_id)
+        if self.db.get_bind().dialect.delete_returning:
+            return self.db.execute(stmt.returning(likes.c.id)).first() is not None
+        return self.db.execute(stmt).rowcount > 0
+
+    def _adjust_like_count(self, post_id: int, delta: int) -> int:
+        """like_count 원자적 증감 후 현재 값 반환 (수정 시각은 유지)"""
+        posts = Post.__table__
+        new_count = posts.c.like_count + delta
+        stmt = (
+            update(posts)
+            .where(posts.c.id == post_id)
+            .values(
+                like_count=case((new_count < 0, 0), else_=new_count),
+                updated_at=posts.c.updated_at,
             )
+        )
+        if self.db.get_bind().dialect.update_returning:
+            return self.db.execute(stmt.returning(posts.c.like_count)).scalar() or 0
+        self.db.execute(stmt)
+        return self.db.query(Post.like_count).filter(Post.id == post_id).scalar() or 0
+
+    def _ensure_post_exists(self, post_id: int) -> None:
+        if not self.db.query(exists().where(Post.id == post_id)).scalar():
+            raise NotFoundException(detail="게시글을 찾을 수 없습니다")
+
+    def set_like(self, post_id: int, user_id: int, liked: bool) -> LikeToggleResponse:
+        """
+        좋아요 설정/해제 (멱등)
+
+        같은 요청을 여러 번 보내도 결과가 같다 (중복 클릭 대응).
+        실제로 행이 추가/삭제된 경우에만 like_count를 증감한다.
+        """
+        self._ensure_post_exists(post_id)
+
+        if liked:
+            changed = self._insert_like(post_id, user_id)
         else:
-            like = PostLike(post_id=post_id, user_id=user_id)
-            self.db.add(like)
-            post.like_count += 1
-            self.db.commit()
-            return LikeToggleResponse(
-                is_liked=True,
-                like_count=post.like_count,
-                message="좋아요를 눌렀습니다",
-            )
+            changed = self._delete_like(post_id, user_id)
+
+        if changed:
+            like_count = self._adjust_like_count(post_id, 1 if liked else -1)
+        else:
+            like_count = self.db.query(Post.like_count).filter(Post.id == post_id).scalar() or 0
+        self.db.commit()
+
+        return LikeToggleResponse(
+            is_liked=liked,
+            like_count=like_count,
+            message="좋아요를 눌렀습니다" if liked else "좋아요를 취소했습니다",
+        )
+
+    def toggle_like(self, post_id: int, user_id: int) -> LikeToggleResponse:
+        """
+        좋아요 토글
+
+        먼저 삭제를 시도하고, 삭제된 행이 없으면 추가한다.
+        SELECT 후 판단하지 않으므로 동시 요청에도 중복 행/카운트 손실이 없다.
+        """
+        self._ensure_post_exists(post_id)
+
+        if self._delete_like(post_id, user_id):
+            liked = False
+            like_count = self._adjust_like_count(post_id, -1)
+        else:
+            liked = True
+            if self._insert_like(post_id, user_id):
+                like_count = self._adjust_like_count(post_id, 1)
+            else:
+                # 동시 요청이 먼저 추가한 경우
+                like_count = self.db.query(Post.like_count).filter(Post.id == post_id).scalar() or 0
+        self.db.commit()
+
+        return LikeToggleResponse(
+            is_liked=liked,
+            like_count=like_count,
+            message="좋아요를 눌렀습니다" if liked else "좋아요를 취소했습니다",
+        )
+
+    def get_liked_post_ids(self, user_id: int, post_ids: List[int]) -> set:
+        """게시글 목록 중 사용자가 좋아요한 게시글 ID (한 번의 IN 쿼리)"""
+        if not post_ids:
+            return set()
+        rows = self.db.query(PostLike.post_id).filter(
+            PostLike.user_id == user_id,
+            PostLike.post_id.in_(post_ids),
+        ).all()
+        return {post_id for (post_id,) in rows}
 
     def check_like_status(self, post_id: int, user_id: int) -> bool:
         """좋아요 여부 확인"""
-        like = self.db.query(PostLike).filter(
-            PostLike.post_id == post_id,
-            PostLike.user_id == user_id,
-        ).first()
-        return like is not None
+        return self.db.query(
+            exists().where(
+                PostLike.post_id == post_id,
+                PostLike.user_id == user_id,
+            )
+        ).scalar()
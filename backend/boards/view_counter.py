@@ -0,0 +1,142 @@
+"""
+게시글 조회수 버퍼
+
+게시글 조회 시마다 UPDATE/COMMIT 하지 않고 메모리에 누적한 뒤
+주기적으로 묶어서 posts.view_count에 반영한다.
+- 같은 조회자(회원 ID 또는 IP+User-Agent)의 반복 조회는 일정 시간 동안 1회로 집계
+- 반영은 view_count = view_count + :n 형태의 배치 UPDATE (executemany)
+- 반영 실패 시 누적값을 버퍼로 되돌려 다음 주기에 재시도
+
+여러 프로세스로 실행해도 각 프로세스가 증분만 더하므로 합계는 정확하다.
+(중복 조회 판단은 프로세스 단위)
+
+Example:
+    view_counter.record(post_id, viewer_key)   # 조회 기록
+    post.view_count + view_counter.pending(post_id)   # 표시용 조회수
+    view_counter.flush(db)   # 백그라운드 작업에서 호출
+"""
+
+import hashlib
+import threading
+import time
+from typing import Optional
+
+from fastapi import Request
+from sqlalchemy import bindparam, update
+from sqlalchemy.orm import Session
+
+from core.database import SessionLocal
+from .config import boards_plugin_config
+from .models import Post
+
+
+class ViewCounterBuffer:
+    """게시글 조회수 누적 버퍼"""
+
+    # 중복 판단용 조회 기록 최대 개수 (초과 시 만료 항목 정리 후 오래된 순으로 제거)
+    MAX_SEEN_ENTRIES = 100_000
+
+    def __init__(self, dedupe_window: int = 600):
+        self.dedupe_window = dedupe_window
+        self._pending: dict[int, int] = {}
+        self._seen: dict[tuple[int, str], float] = {}
+        self._lock = threading.Lock()
+
+    def record(self, post_id: int, viewer_key: Optional[str] = None) -> bool:
+        """
+        조회 기록
+
+        Returns:
+            조회수에 반영되면 True, 중복 조회로 무시되면 False
+        """
+        now = time.monotonic()
+        with self._lock:
+            if viewer_key and self.dedupe_window > 0:
+                key = (post_id, viewer_key)
+                expires_at = self._seen.get(key)
+                if expires_at is not None and expires_at > now:
+                    return False
+                self._seen[key] = now + self.dedupe_window
+                if len(self._seen) > self.MAX_SEEN_ENTRIES:
+                    self._prune_seen(now)
+
+            self._pending[post_id] = self._pending.get(post_id, 0) + 1
+            return True
+
+    def pending(self, post_id: int) -> int:
+        """아직 DB에 반영되지 않은 조회수"""
+        return self._pending.get(post_id, 0)
+
+    def _prune_seen(self, now: float) -> None:
+        self._seen = {key: exp for key, exp in self._seen.items() if exp > now}
+        overflow = len(self._seen) - self.MAX_SEEN_ENTRIES
+        if overflow > 0:
+            # dict는 삽입 순서를 유지하므로 앞쪽이 오래된 기록
+            for key in list(self._seen)[:overflow]:
+                del self._seen[key]
+
+    def flush(self, db: Session) -> int:
+        """
+        누적 조회수를 DB에 반영
+
+        Returns:
+            반영한 게시글 수
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._prune_seen(time.monotonic())
+
+        if not pending:
+            return 0
+
+        posts = Post.__table__
+        stmt = (
+            update(posts)
+            .where(posts.c.id == bindparam("b_id"))
+            .values(
+                view_count=posts.c.view_count + bindparam("b_count"),
+                updated_at=posts.c.updated_at,  # 조회는 수정 시각을 바꾸지 않음
+            )
+        )
+        try:
+            db.connection().execute(
+                stmt,
+                [{"b_id": post_id, "b_count": count} for post_id, count in pending.items()],
+            )
+            db.commit()
+        except Exception:
+            db.rollback()
+            # 반영하지 못한 조회수를 되돌림
+            with self._lock:
+                for post_id, count in pending.items():
+                    self._pending[post_id] = self._pending.get(post_id, 0) + count
+            raise
+
+        return len(pending)
+
+
+view_counter = ViewCounterBuffer(dedupe_window=boards_plugin_config.view_dedupe_window)
+
+
+def get_viewer_key(request: Request, current_user: Optional[dict] = None) -> str:
+    """조회자 식별 키 (회원은 ID, 비회원은 IP + User-Agent 해시)"""
+    if current_user and current_user.get("id"):
+        return f"user:{current_user['id']}"
+
+    forwarded = request.headers.get("x-forwarded-for")
+    if forwarded:
+        ip = forwarded.split(",")[0].strip()
+    else:
+        ip = request.headers.get("x-real-ip") or (request.client.host if request.client else "unknown")
+    user_agent = request.headers.get("user-agent", "")
+    digest = hashlib.sha1(f"{ip}|{user_agent}".encode("utf-8")).hexdigest()[:16]
+    return f"anon:{digest}"
+
+
+def flush_view_counts() -> None:
+    """백그라운드 작업용 진입점 (자체 세션 사용)"""
+    db = SessionLocal()
+    try:
+        view_counter.flush(db)
+    finally:
+        db.close()
@@ -173,6 +173,10 @@ class CategoryService:
         self.db.commit()
         self.db.refresh(category)
 
+        # 상품 응답에 카테고리명이 포함되므로 상품 캐시 무효화
+        from products.service import invalidate_product_cache
+        invalidate_product_cache()
+
         return CategoryResponse.model_validate(category)
 
     def delete_category(self, category_id: int) -> bool:
@@ -14,8 +14,9 @@ from .responses import (
     SuccessResponse,
     ErrorResponse,
     PaginatedResponse,
+    CursorPaginatedResponse,
 )
-from .pagination import Pagination, PaginationParams
+from .pagination import Pagination, PaginationParams, CursorPagination, CursorParams
 
 __all__ = [
     "AppException",
@@ -27,6 +28,9 @@ __all__ = [
     "SuccessResponse",
     "ErrorResponse",
     "PaginatedResponse",
+    "CursorPaginatedResponse",
     "Pagination",
     "PaginationParams",
+    "CursorPagination",
+    "CursorParams",
 ]
@@ -0,0 +1,83 @@
+"""
+업무 기준 날짜 유틸리티
+
+통계의 "하루"는 서버/DB 시간대가 아니라 업무 시간대(BUSINESS_TIMEZONE, 기본 Asia/Seoul) 기준이다.
+DB의 시각 컬럼은 UTC로 저장되므로, 날짜 조건은 date(컬럼) 비교 대신
+UTC 경계의 반개구간 [시작, 끝) 범위 조건으로 만들어 인덱스를 사용할 수 있게 한다.
+
+Example:
+    start, end = day_range(date(2026, 1, 1))
+    query.filter(Visitor.visited_at >= start, Visitor.visited_at < end)
+"""
+
+from datetime import date, datetime, time, timedelta, timezone
+from functools import lru_cache
+from typing import Iterator, Optional
+from zoneinfo import ZoneInfo
+
+from core.config import settings
+
+
+@lru_cache()
+def business_tz() -> ZoneInfo:
+    """업무 기준 시간대"""
+    return ZoneInfo(settings.BUSINESS_TIMEZONE)
+
+
+def business_today() -> date:
+    """업무 시간대 기준 오늘"""
+    return datetime.now(business_tz()).date()
+
+
+def to_business_date(value: datetime) -> date:
+    """시각을 업무 시간대 기준 날짜로 변환 (시간대 정보가 없으면 UTC로 간주)"""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(business_tz()).date()
+
+
+def day_start(day: date) -> datetime:
+    """업무 기준 날짜의 시작 시각 (UTC)"""
+    return datetime.combine(day, time.min, tzinfo=business_tz()).astimezone(timezone.utc)
+
+
+def day_range(day: date) -> tuple[datetime, datetime]:
+    """업무 기준 하루의 UTC 반개구간 [시작, 끝)"""
+    return day_start(day), day_start(day + timedelta(days=1))
+
+
+def date_range(start: date, end: date) -> tuple[datetime, datetime]:
+    """업무 기준 기간(start~end, 양 끝 포함)의 UTC 반개구간 [시작, 끝)"""
+    return day_start(start), day_start(end + timedelta(days=1))
+
+
+def iter_dates(start: date, end: date) -> Iterator[date]:
+    """start부터 end까지(포함) 날짜 순회"""
+    current = start
+    while current <= end:
+        yield current
+        current += timedelta(days=1)
+
+
+def dates_between(start: Optional[datetime], end: Optional[datetime]) -> list[date]:
+    """두 시각 사이에 걸친 업무 기준 날짜 목록 (둘 중 하나가 없으면 빈 목록)"""
+    if start is None or end is None:
+        return []
+    return list(iter_dates(to_business_date(start), to_business_date(end)))
+
+
+def month_start(day: date) -> date:
+    """날짜가 속한 달의 1일"""
+    return day.replace(day=1)
+
+
+def add_months(month: date, months: int) -> date:
+    """달(1일) 기준 months개월 뒤의 1일 (음수면 이전 달)"""
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def month_range(month: date) -> tuple[datetime, datetime]:
+    """업무 기준 한 달(month가 속한 달)의 UTC 반개구간 [시작, 끝)"""
+    first = month_start(month)
+    return day_start(first), day_start(add_months(first, 1))
@@ -0,0 +1,158 @@
+"""
+대용량 목록 내보내기 (CSV / NDJSON 스트리밍)
+
+목록 API를 페이지 단위로 반복 호출(매번 COUNT + OFFSET)하지 않고, 한 번의 쿼리를
+서버 측 커서(yield_per -> stream_results)로 읽으면서 바로 응답으로 흘려보낸다.
+- 메모리 사용량은 행 수와 관계없이 배치 크기 수준으로 일정
+- gzip=True이면 스트림을 그대로 압축해 .gz 파일로 전송
+- 응답 스트림이 요청 세션보다 오래 살아 있으므로 내보내기 전용 세션을 생성기 안에서 열고 닫는다
+
+Example:
+    return export_response(
+        lambda db: PaymentService(db).iter_export_rows(search),
+        columns=EXPORT_COLUMNS,
+        filename="payments",
+        format="csv",
+    )
+"""
+
+import csv
+import io
+import json
+import zlib
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Callable, Iterable, Iterator, Literal, Sequence
+
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+
+from core.database import SessionLocal
+from .dates import business_today
+
+ExportFormat = Literal["csv", "ndjson"]
+
+# 배치 크기 (서버 측 커서에서 한 번에 가져오는 행 수, 응답으로 내보내는 단위)
+EXPORT_BATCH_SIZE = 1000
+
+_MEDIA_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+}
+
+# Excel에서 UTF-8 CSV의 한글이 깨지지 않도록 BOM 추가
+_CSV_BOM = "\ufeff"
+
+# 스프레드시트가 수식으로 해석하는 시작 문자 (CSV 수식 주입 방지를 위해 앞에 ' 추가)
+_CSV_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+def _to_json_value(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
+def _to_csv_value(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, str) and value.startswith(_CSV_FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def _encode_csv(rows: Iterable[Sequence[Any]], columns: Sequence[str]) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    buffer.write(_CSV_BOM)
+    writer.writerow(columns)
+
+    count = 0
+    for row in rows:
+        writer.writerow([_to_csv_value(value) for value in row])
+        count += 1
+        if count % EXPORT_BATCH_SIZE == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+def _encode_ndjson(rows: Iterable[Sequence[Any]], columns: Sequence[str]) -> Iterator[str]:
+    lines = []
+    for row in rows:
+        record = {column: _to_json_value(value) for column, value in zip(columns, row)}
+        lines.append(json.dumps(record, ensure_ascii=False))
+        if len(lines) >= EXPORT_BATCH_SIZE:
+            yield "\n".join(lines) + "\n"
+            lines = []
+    if lines:
+        yield "\n".join(lines) + "\n"
+
+
+def _gzip(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    # wbits=31: gzip 헤더/트레일러 포함
+    compressor = zlib.compressobj(wbits=31)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def stream_export(
+    rows_factory: Callable[[Session], Iterable[Sequence[Any]]],
+    columns: Sequence[str],
+    format: ExportFormat = "csv",
+    gzip: bool = False,
+) -> Iterator[bytes]:
+    """
+    내보내기 바이트 스트림
+
+    Args:
+        rows_factory: 세션을 받아 columns 순서의 행을 돌려주는 함수 (yield_per 쿼리 권장)
+        columns: 컬럼(필드) 이름
+        format: csv 또는 ndjson
+        gzip: gzip 압축 여부
+    """
+    encode = _encode_csv if format == "csv" else _encode_ndjson
+
+    def generate() -> Iterator[bytes]:
+        db = SessionLocal()
+        try:
+            for text in encode(rows_factory(db), columns):
+                if text:
+                    yield text.encode("utf-8")
+        finally:
+            db.close()
+
+    return _gzip(generate()) if gzip else generate()
+
+
+def export_response(
+    rows_factory: Callable[[Session], Iterable[Sequence[Any]]],
+    columns: Sequence[str],
+    filename: str,
+    format: ExportFormat = "csv",
+    gzip: bool = False,
+) -> StreamingResponse:
+    """
+    내보내기 스트리밍 응답 (첨부 파일)
+
+    파일명은 `{filename}_{업무 기준 날짜}.{format}[.gz]`
+    """
+    name = f"{filename}_{business_today():%Y%m%d}.{format}"
+    media_type = _MEDIA_TYPES[format]
+    if gzip:
+        name += ".gz"
+        media_type = "application/gzip"
+
+    return StreamingResponse(
+        stream_export(rows_factory, columns, format, gzip),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{name}"'},
+    )
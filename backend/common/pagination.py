@@ -2,11 +2,20 @@
 페이지네이션 유틸리티
 """
 
-from typing import TypeVar, Generic, Optional
+import base64
+import binascii
+import json
+import threading
+import time
+from datetime import datetime
+from typing import TypeVar, Generic, Optional, Any
 from pydantic import BaseModel, Field
-from sqlalchemy.orm import Query
+from sqlalchemy import tuple_
+from sqlalchemy.orm import Query, InstrumentedAttribute
 from math import ceil
 
+from .errors import BadRequestException
+
 T = TypeVar("T")
 
 
@@ -77,3 +86,208 @@ class Pagination(Generic[T]):
             page=params.page,
             page_size=params.page_size,
         )
+
+
+# ============================================
+# 커서(키셋) 페이지네이션
+# ============================================
+
+
+class CursorParams(BaseModel):
+    """커서 페이지네이션 파라미터"""
+
+    cursor: Optional[str] = Field(default=None, description="다음 페이지 커서 (첫 페이지는 생략)")
+    page_size: int = Field(default=20, ge=1, le=100, description="페이지 크기")
+    include_total: bool = Field(default=False, description="전체 개수 포함 여부")
+    approximate_total: bool = Field(default=True, description="근사 전체 개수 허용 여부")
+
+
+def encode_cursor(sort_value: Any, row_id: int) -> str:
+    """(정렬값, id)를 불투명 커서 문자열로 인코딩"""
+    if isinstance(sort_value, datetime):
+        value = {"t": "dt", "v": sort_value.isoformat()}
+    else:
+        value = {"t": "raw", "v": sort_value}
+    payload = json.dumps([value, row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[Any, int]:
+    """커서 문자열을 (정렬값, id)로 디코딩"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        value, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        sort_value = value["v"]
+        if value["t"] == "dt":
+            sort_value = datetime.fromisoformat(sort_value)
+        return sort_value, int(row_id)
+    except (ValueError, TypeError, KeyError, binascii.Error):
+        raise BadRequestException(detail="유효하지 않은 커서입니다", error_code="INVALID_CURSOR")
+
+
+class _TotalCountCache:
+    """전체 개수 캐시 (쿼리 SQL + 파라미터 기준, TTL)"""
+
+    def __init__(self, ttl_seconds: int = 60, max_entries: int = 256):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: dict[str, tuple[float, int, bool]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[tuple[int, bool]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, total, approximate = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            return total, approximate
+
+    def set(self, key: str, total: int, approximate: bool) -> None:
+        with self._lock:
+            if len(self._entries) >= self.max_entries:
+                # 가장 먼저 만료되는 항목 제거
+                oldest = min(self._entries, key=lambda k: self._entries[k][0])
+                del self._entries[oldest]
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, total, approximate)
+
+
+_total_count_cache = _TotalCountCache()
+
+
+def _estimate_count(query: Query) -> Optional[int]:
+    """
+    PostgreSQL 실행 계획의 예상 행 수로 근사 개수 계산
+
+    다른 DB이거나 계획을 읽을 수 없으면 None 반환
+    """
+    session = query.session
+    if session.get_bind().dialect.name != "postgresql":
+        return None
+
+    compiled = query.statement.compile(dialect=session.get_bind().dialect)
+    try:
+        # 실패해도 요청 트랜잭션이 중단(aborted) 상태로 남지 않도록 세이브포인트 안에서 실행
+        with session.begin_nested():
+            row = (
+                session.connection()
+                .exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled.string}", compiled.params)
+                .first()
+            )
+        plan = row[0] if isinstance(row[0], list) else json.loads(row[0])
+        return int(plan[0]["Plan"]["Plan Rows"])
+    except Exception:
+        return None
+
+
+def count_total(query: Query, approximate: bool = True) -> tuple[int, bool]:
+    """
+    전체 개수 조회 (캐시 사용)
+
+    Returns:
+        (전체 개수, 근사값 여부)
+    """
+    compiled = query.statement.compile()
+    cache_key = f"{approximate}:{compiled.string}:{sorted(compiled.params.items(), key=str)}"
+
+    cached = _total_count_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    total = _estimate_count(query) if approximate else None
+    is_approximate = total is not None
+    if total is None:
+        total = query.order_by(None).count()
+
+    _total_count_cache.set(cache_key, total, is_approximate)
+    return total, is_approximate
+
+
+class CursorPagination(Generic[T]):
+    """커서 페이지네이션 결과"""
+
+    def __init__(
+        self,
+        items: list[T],
+        page_size: int,
+        next_cursor: Optional[str] = None,
+        total_count: Optional[int] = None,
+        total_is_approximate: bool = False,
+    ):
+        self.items = items
+        self.page_size = page_size
+        self.next_cursor = next_cursor
+        self.total_count = total_count
+        self.total_is_approximate = total_is_approximate
+
+    @property
+    def has_next(self) -> bool:
+        """다음 페이지 존재 여부"""
+        return self.next_cursor is not None
+
+    def to_dict(self) -> dict:
+        """딕셔너리 변환"""
+        return {
+            "items": self.items,
+            "meta": {
+                "page_size": self.page_size,
+                "next_cursor": self.next_cursor,
+                "has_next": self.has_next,
+                "total_count": self.total_count,
+                "total_is_approximate": self.total_is_approximate,
+            },
+        }
+
+    @classmethod
+    def from_query(
+        cls,
+        query: Query,
+        params: CursorParams,
+        sort_column: InstrumentedAttribute,
+        id_column: InstrumentedAttribute,
+    ) -> "CursorPagination[T]":
+        """
+        SQLAlchemy 쿼리에서 커서 페이지네이션 생성
+
+        (sort_column, id_column) 내림차순으로 정렬하며,
+        커서 이후 행만 조회하므로 OFFSET 없이 인덱스 범위 스캔으로 동작한다.
+        query에는 정렬을 지정하지 않는다.
+        """
+        total_count = None
+        total_is_approximate = False
+        if params.include_total:
+            total_count, total_is_approximate = count_total(
+                query, approximate=params.approximate_total
+            )
+
+        if params.cursor:
+            sort_value, last_id = decode_cursor(params.cursor)
+            query = query.filter(
+                # 단순 범위 조건을 함께 두어 인덱스 범위/파티션 프루닝에 사용되게 함
+                sort_column <= sort_value,
+                tuple_(sort_column, id_column) < tuple_(sort_value, last_id),
+            )
+
+        rows = (
+            query.order_by(sort_column.desc(), id_column.desc())
+            .limit(params.page_size + 1)
+            .all()
+        )
+
+        next_cursor = None
+        if len(rows) > params.page_size:
+            rows = rows[: params.page_size]
+            last = rows[-1]
+            next_cursor = encode_cursor(
+                getattr(last, sort_column.key), getattr(last, id_column.key)
+            )
+
+        return cls(
+            items=rows,
+            page_size=params.page_size,
+            next_cursor=next_cursor,
+            total_count=total_count,
+            total_is_approximate=total_is_approximate,
+        )
@@ -43,3 +43,22 @@ class PaginatedResponse(BaseModel, Generic[T]):
     message: str = "성공"
     data: list[T]
     meta: PaginationMeta
+
+
+class CursorPaginationMeta(BaseModel):
+    """커서 페이지네이션 메타 정보"""
+
+    page_size: int
+    next_cursor: Optional[str] = None
+    has_next: bool
+    total_count: Optional[int] = None  # include_total 요청 시에만 포함
+    total_is_approximate: bool = False
+
+
+class CursorPaginatedResponse(BaseModel, Generic[T]):
+    """커서 페이지네이션 응답"""
+
+    success: bool = True
+    message: str = "성공"
+    data: list[T]
+    meta: CursorPaginationMeta
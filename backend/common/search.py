@@ -0,0 +1,353 @@
+"""
+인메모리 n-gram 검색 인덱스
+
+한국어처럼 띄어쓰기 단위로 나눌 수 없는 텍스트의 부분 일치 검색을 위해
+문자 n-gram(기본 bigram) 역색인을 사용한다.
+PostgreSQL(pg_trgm)을 사용할 수 없는 환경(SQLite 등)의 대체 검색 경로로 사용.
+
+Example:
+    index = NgramIndex()
+    index.add(1, "아이폰 15 프로")
+    index.add(2, "갤럭시 S24")
+    index.search("아이폰")  # [(1, 1.5)]
+
+프로세스 공유 색인은 BackgroundNgramIndex로 감싸 백그라운드 작업에서 다시 만든다
+(검색 요청 안에서 전체 재색인을 하지 않음).
+색인 검색 결과는 filter_by_candidates/order_by_candidates로 SQL 조건과 정렬에 반영한다.
+"""
+
+import html
+import re
+import threading
+import time
+import unicodedata
+from collections import defaultdict
+from typing import Callable, Optional
+
+from sqlalchemy import case, false
+from sqlalchemy.orm import Query, Session
+
+from core.config import settings
+from core.database import SessionLocal
+
+
+def normalize_text(text: Optional[str]) -> str:
+    """검색용 정규화 (NFKC, 소문자, 공백 정리)"""
+    if not text:
+        return ""
+    return " ".join(unicodedata.normalize("NFKC", text).lower().split())
+
+
+def tokenize_ngrams(text: Optional[str], n: int = 2) -> set[str]:
+    """
+    단어별 문자 n-gram 추출
+
+    n보다 짧은 단어는 단어 자체를 토큰으로 사용한다.
+    단어 경계를 넘는 n-gram은 만들지 않는다.
+    """
+    grams: set[str] = set()
+    for word in normalize_text(text).split(" "):
+        if not word:
+            continue
+        if len(word) < n:
+            grams.add(word)
+            continue
+        for i in range(len(word) - n + 1):
+            grams.add(word[i:i + n])
+    return grams
+
+
+_TAG_RE = re.compile(r"<[^>]+>")
+
+
+def strip_html(text: Optional[str]) -> str:
+    """HTML 태그 제거 및 공백 정리 (에디터 본문 검색/하이라이트용)"""
+    if not text:
+        return ""
+    return " ".join(html.unescape(_TAG_RE.sub(" ", text)).split())
+
+
+def make_highlight(
+    text: Optional[str],
+    query: Optional[str],
+    max_length: int = 120,
+    pre: str = "<mark>",
+    post: str = "</mark>",
+) -> Optional[str]:
+    """
+    검색어 주변 발췌문 생성
+
+    HTML을 제거한 본문에서 검색어(또는 검색어의 단어)가 처음 나오는 위치를 중심으로
+    max_length 길이만큼 잘라 일치 부분을 pre/post로 감싼다.
+    발췌문 자체는 HTML 이스케이프되므로 그대로 렌더링해도 안전하다.
+
+    Returns:
+        일치하는 부분이 없으면 None
+    """
+    plain = strip_html(text)
+    words = [w for w in " ".join((query or "").split()).split(" ") if w]
+    if not plain or not words:
+        return None
+
+    lowered = plain.lower()
+    phrase = " ".join(words).lower()
+    position = lowered.find(phrase)
+    match_length = len(phrase)
+    if position < 0:
+        for word in words:
+            position = lowered.find(word.lower())
+            if position >= 0:
+                match_length = len(word)
+                break
+    if position < 0:
+        return None
+
+    start = max(0, position - max(0, max_length - match_length) // 2)
+    end = min(len(plain), start + max_length)
+    start = max(0, end - max_length)
+    snippet = plain[start:end]
+
+    pattern = re.compile(
+        "|".join(re.escape(w) for w in sorted({phrase, *(w.lower() for w in words)}, key=len, reverse=True)),
+        re.IGNORECASE,
+    )
+    parts = []
+    last = 0
+    for match in pattern.finditer(snippet):
+        parts.append(html.escape(snippet[last:match.start()]))
+        parts.append(pre + html.escape(match.group(0)) + post)
+        last = match.end()
+    parts.append(html.escape(snippet[last:]))
+
+    return ("…" if start > 0 else "") + "".join(parts) + ("…" if end < len(plain) else "")
+
+
+class NgramIndex:
+    """
+    n-gram 역색인
+
+    - add/remove로 문서 단위 증분 갱신
+    - search는 질의의 모든 n-gram을 포함하는 문서만 반환 (AND, 부분 문자열 여부는 호출자가 확인)
+    - 점수: 문서 n-gram 중 질의가 차지하는 비율 + 원문 부분 일치 가산점
+    """
+
+    # 부분 문자열이 그대로 포함된 경우 가산점
+    EXACT_MATCH_BONUS = 1.0
+
+    def __init__(self, n: int = 2, store_text: bool = True):
+        self.n = n
+        self.store_text = store_text
+        self._postings: dict[str, set[int]] = defaultdict(set)
+        self._doc_grams: dict[int, frozenset[str]] = {}
+        self._doc_texts: dict[int, str] = {}
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._doc_grams)
+
+    def __contains__(self, doc_id: int) -> bool:
+        return doc_id in self._doc_grams
+
+    def clear(self) -> None:
+        """전체 초기화"""
+        with self._lock:
+            self._postings.clear()
+            self._doc_grams.clear()
+            self._doc_texts.clear()
+
+    def add(self, doc_id: int, text: Optional[str]) -> None:
+        """문서 추가 (이미 있으면 교체)"""
+        grams = frozenset(tokenize_ngrams(text, self.n))
+        with self._lock:
+            self._remove_unlocked(doc_id)
+            self._doc_grams[doc_id] = grams
+            for gram in grams:
+                self._postings[gram].add(doc_id)
+            if self.store_text:
+                self._doc_texts[doc_id] = normalize_text(text)
+
+    def remove(self, doc_id: int) -> None:
+        """문서 제거"""
+        with self._lock:
+            self._remove_unlocked(doc_id)
+
+    def _remove_unlocked(self, doc_id: int) -> None:
+        grams = self._doc_grams.pop(doc_id, None)
+        self._doc_texts.pop(doc_id, None)
+        if not grams:
+            return
+        for gram in grams:
+            posting = self._postings.get(gram)
+            if posting is None:
+                continue
+            posting.discard(doc_id)
+            if not posting:
+                del self._postings[gram]
+
+    def search(self, query: Optional[str], limit: Optional[int] = None) -> list[tuple[int, float]]:
+        """
+        질의 검색
+
+        Returns:
+            (문서 ID, 점수) 목록, 점수 내림차순
+        """
+        normalized = normalize_text(query)
+        query_grams = tokenize_ngrams(normalized, self.n)
+        if not query_grams:
+            return []
+
+        # 여러 단어 질의의 n보다 짧은 단어 토큰은 문서 쪽 n-gram과 맞지 않으므로 후보 교집합에서 제외
+        match_grams = {gram for gram in query_grams if len(gram) >= self.n} or query_grams
+
+        with self._lock:
+            postings = [self._postings.get(gram) for gram in match_grams]
+            if len(normalized) < self.n:
+                # 한 글자 질의는 n-gram으로 찾을 수 없으므로 저장된 원문에서 부분 일치 검색
+                if not self.store_text:
+                    return []
+                candidates = {
+                    doc_id for doc_id, text in self._doc_texts.items() if normalized in text
+                }
+            elif any(not p for p in postings):
+                return []
+            else:
+                postings.sort(key=len)
+                candidates = set(postings[0])
+                for posting in postings[1:]:
+                    candidates &= posting
+                    if not candidates:
+                        return []
+
+            results = []
+            for doc_id in candidates:
+                doc_grams = self._doc_grams[doc_id]
+                score = len(query_grams) / max(len(doc_grams), 1)
+                if self.store_text and normalized in self._doc_texts.get(doc_id, ""):
+                    score += self.EXACT_MATCH_BONUS
+                results.append((doc_id, score))
+
+        results.sort(key=lambda r: (-r[1], -r[0]))
+        if limit is not None:
+            results = results[:limit]
+        return results
+
+
+# 색인 검색 결과를 SQL에 넘기는 최대 후보 수 (IN 바인드 수, 관련도 CASE 분기 수)
+MAX_SQL_CANDIDATES = 500
+
+
+def _too_many(results: Optional[list[tuple[int, float]]]) -> bool:
+    return results is None or len(results) > MAX_SQL_CANDIDATES
+
+
+def filter_by_candidates(
+    query: Query,
+    id_column,
+    results: Optional[list[tuple[int, float]]],
+    substring,
+) -> Query:
+    """
+    색인 검색 결과로 필터 적용
+
+    후보가 MAX_SQL_CANDIDATES 이하이면 후보 ID IN 조건 + 부분 일치(substring) 재확인,
+    색인이 없거나(None) 후보가 더 많으면 후보 목록 없이 부분 일치 조건만 사용한다.
+    (흔한 검색어는 큰 IN 목록보다 ILIKE 스캔이 빠르고, 후보를 잘라 넘기지 않으므로
+    다른 조건과 함께 걸러도 결과가 빠지지 않음)
+    """
+    if _too_many(results):
+        return query.filter(substring)
+    if not results:
+        return query.filter(false())
+    return query.filter(id_column.in_([doc_id for doc_id, _ in results]), substring)
+
+
+def order_by_candidates(query: Query, id_column, results: Optional[list[tuple[int, float]]]) -> Query:
+    """
+    색인 점수순 정렬 추가
+
+    filter_by_candidates가 후보 ID로 거른 경우에만 정렬하고,
+    부분 일치 조건만 사용한 경우(후보가 많음)는 관련도 정렬 없이 그대로 반환한다.
+    """
+    if not results or _too_many(results):
+        return query
+    ranks = {doc_id: rank for rank, (doc_id, _) in enumerate(results)}
+    return query.order_by(case(ranks, value=id_column, else_=len(ranks)).asc())
+
+
+class BackgroundNgramIndex:
+    """
+    백그라운드 작업에서 다시 만드는 프로세스 공유 색인 묶음 ({이름: NgramIndex})
+
+    - 검색 요청은 현재 색인을 그대로 사용하고, 색인이 없거나 SEARCH_INDEX_REFRESH_INTERVAL이
+      지났으면 백그라운드 작업(task_name)에 재생성을 요청만 한다 (다른 프로세스의 수정 반영)
+    - 재생성은 새 색인을 따로 만든 뒤 교체하므로 그동안은 이전 색인으로 검색
+    - 같은 프로세스의 변경은 update()로 증분 반영 (재생성 중이면 새 색인에도 다시 반영)
+    - 검색이 없으면 재생성하지 않는다
+    """
+
+    def __init__(self, task_name: str, build: Callable[[Session], dict[str, NgramIndex]]):
+        self.task_name = task_name
+        self._build = build
+        self._indexes: Optional[dict[str, NgramIndex]] = None
+        self._built_at = 0.0
+        self._refresh_requested = False
+        # 재생성 중 들어온 증분 변경 (재생성 중이 아니면 None)
+        self._pending: Optional[list[Callable[[dict[str, NgramIndex]], None]]] = None
+        self._lock = threading.Lock()
+        self._build_lock = threading.Lock()
+
+    def get(self) -> Optional[dict[str, NgramIndex]]:
+        """현재 색인 (아직 만들지 않았으면 None), 없거나 오래됐으면 재생성 요청"""
+        indexes = self._indexes
+        expired = time.monotonic() - self._built_at > settings.SEARCH_INDEX_REFRESH_INTERVAL
+        if (indexes is None or expired) and self._pending is None:
+            self._request_refresh()
+        return indexes
+
+    def _request_refresh(self) -> None:
+        if self._refresh_requested:
+            return
+        self._refresh_requested = True
+        from core.background import background_tasks
+
+        background_tasks.trigger(self.task_name)
+
+    def update(self, change: Callable[[dict[str, NgramIndex]], None]) -> None:
+        """증분 변경 반영 (아직 색인이 없으면 재생성 때 DB에서 읽음)"""
+        with self._lock:
+            if self._indexes is not None:
+                change(self._indexes)
+            if self._pending is not None:
+                self._pending.append(change)
+
+    def refresh_if_requested(self) -> None:
+        """재생성 요청이 있었으면 새 색인을 만들어 교체 (자체 세션 사용)"""
+        if not self._refresh_requested:
+            return
+        with self._build_lock:
+            self._refresh_requested = False
+            with self._lock:
+                self._pending = []
+            try:
+                db = SessionLocal()
+                try:
+                    indexes = self._build(db)
+                finally:
+                    db.close()
+            except Exception:
+                with self._lock:
+                    self._pending = None
+                raise
+
+            with self._lock:
+                for change in self._pending:
+                    change(indexes)
+                self._pending = None
+                self._indexes = indexes
+                self._built_at = time.monotonic()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._indexes = None
+            self._built_at = 0.0
+            self._refresh_requested = False
@@ -0,0 +1,142 @@
+"""
+백그라운드 주기 작업 실행기
+
+애플리케이션 수명 주기(lifespan) 동안 등록된 작업을 주기적으로 실행한다.
+작업 함수는 동기 함수이며 스레드에서 실행되어 이벤트 루프를 막지 않는다.
+
+Example:
+    background_tasks.register("product_counters", 3600, reconcile_job)
+    background_tasks.trigger("visitor_events")   # 주기를 기다리지 않고 바로 실행
+
+    # main.py lifespan
+    background_tasks.start()
+    ...
+    await background_tasks.stop()
+"""
+
+import asyncio
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Callable, Optional
+
+
+@dataclass
+class PeriodicTask:
+    """주기 작업 정보"""
+
+    name: str
+    interval: float  # 초
+    func: Callable[[], object]
+    run_on_shutdown: bool = False  # 종료 시 한 번 더 실행 (버퍼 플러시 등)
+    last_run_at: Optional[datetime] = None
+    last_error: Optional[str] = None
+    run_count: int = 0
+    _handle: Optional[asyncio.Task] = field(default=None, repr=False)
+    _wake: Optional[asyncio.Event] = field(default=None, repr=False)
+
+
+class PeriodicTaskRunner:
+    """주기 작업 실행기 (싱글톤으로 사용)"""
+
+    def __init__(self):
+        self._tasks: dict[str, PeriodicTask] = {}
+        self._started = False
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def register(
+        self,
+        name: str,
+        interval: float,
+        func: Callable[[], object],
+        run_on_shutdown: bool = False,
+    ) -> None:
+        """
+        작업 등록
+
+        interval이 0 이하이면 등록하지 않는다 (설정으로 비활성화).
+        실행 중에 등록하면 즉시 시작한다.
+        """
+        if interval <= 0:
+            return
+        task = PeriodicTask(name=name, interval=interval, func=func, run_on_shutdown=run_on_shutdown)
+        self._tasks[name] = task
+        if self._started:
+            task._handle = asyncio.create_task(self._run_loop(task))
+
+    async def run_once(self, task: PeriodicTask) -> None:
+        """작업 1회 실행 (예외는 기록만 하고 전파하지 않음)"""
+        try:
+            await asyncio.to_thread(task.func)
+            task.last_error = None
+        except Exception as e:
+            task.last_error = str(e)
+            print(f"[Background] {task.name} 실패: {e}")
+        finally:
+            task.last_run_at = datetime.now(timezone.utc)
+            task.run_count += 1
+
+    async def _run_loop(self, task: PeriodicTask) -> None:
+        task._wake = asyncio.Event()
+        while True:
+            try:
+                await asyncio.wait_for(task._wake.wait(), timeout=task.interval)
+            except asyncio.TimeoutError:
+                pass
+            task._wake.clear()
+            await self.run_once(task)
+
+    def trigger(self, name: str) -> None:
+        """
+        작업을 주기와 관계없이 곧바로 실행하도록 깨운다 (다른 스레드에서 호출 가능)
+
+        실행 중이 아니거나 등록되지 않은 작업이면 무시한다.
+        """
+        task = self._tasks.get(name)
+        if not self._started or task is None or task._wake is None or self._loop is None:
+            return
+        self._loop.call_soon_threadsafe(task._wake.set)
+
+    def start(self) -> None:
+        """등록된 모든 작업 시작"""
+        if self._started:
+            return
+        self._started = True
+        self._loop = asyncio.get_running_loop()
+        for task in self._tasks.values():
+            task._handle = asyncio.create_task(self._run_loop(task))
+
+    async def stop(self) -> None:
+        """모든 작업 중지 (run_on_shutdown 작업은 마지막으로 한 번 실행)"""
+        if not self._started:
+            return
+        self._started = False
+        for task in self._tasks.values():
+            if task._handle:
+                task._handle.cancel()
+        for task in self._tasks.values():
+            if task._handle:
+                try:
+                    await task._handle
+                except asyncio.CancelledError:
+                    pass
+                task._handle = None
+                task._wake = None
+        for task in self._tasks.values():
+            if task.run_on_shutdown:
+                await self.run_once(task)
+
+    def get_status(self) -> list[dict]:
+        """작업 상태 목록"""
+        return [
+            {
+                "name": task.name,
+                "interval": task.interval,
+                "last_run_at": task.last_run_at,
+                "last_error": task.last_error,
+                "run_count": task.run_count,
+            }
+            for task in self._tasks.values()
+        ]
+
+
+background_tasks = PeriodicTaskRunner()
@@ -0,0 +1,243 @@
+"""
+응답 캐시
+
+자주 조회되지만 변경이 드문 공개 API 응답을 캐시한다.
+인메모리 LRU(TTL) 또는 Redis(여러 프로세스 공유)를 백엔드로 사용할 수 있음.
+
+- 캐시 키: 네임스페이스 버전 + 정규화된 파라미터
+- 무효화: 네임스페이스 버전을 올려 기존 키를 모두 무효화 (키 스캔 불필요)
+- ETag/If-None-Match: 같은 응답이면 304 Not Modified 반환
+
+Example:
+    return cached_response(
+        request,
+        namespaces=["products", f"products:{product_id}"],
+        params={"product_id": product_id},
+        build=lambda: SuccessResponse(data=service.get_product(product_id)),
+    )
+
+    # 변경 시
+    response_cache.invalidate(f"products:{product_id}")
+"""
+
+import hashlib
+import json
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+
+from .config import settings
+
+
+class CacheBackend(ABC):
+    """캐시 백엔드 추상 베이스 클래스"""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        """값 조회 (없거나 만료되면 None)"""
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: bytes, ttl: int) -> None:
+        """값 저장 (ttl초 후 만료)"""
+        pass
+
+    @abstractmethod
+    def get_versions(self, names: list[str]) -> list[int]:
+        """네임스페이스 버전 조회 (없으면 0)"""
+        pass
+
+    @abstractmethod
+    def bump_version(self, name: str) -> None:
+        """네임스페이스 버전 증가"""
+        pass
+
+
+class MemoryCache(CacheBackend):
+    """프로세스 내 LRU 캐시 (TTL 지원)"""
+
+    def __init__(self, max_entries: int = 1000):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._versions: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes, ttl: int) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get_versions(self, names: list[str]) -> list[int]:
+        with self._lock:
+            return [self._versions.get(name, 0) for name in names]
+
+    def bump_version(self, name: str) -> None:
+        with self._lock:
+            self._versions[name] = self._versions.get(name, 0) + 1
+
+    def clear(self) -> None:
+        """전체 초기화"""
+        with self._lock:
+            self._entries.clear()
+            self._versions.clear()
+
+
+class RedisCache(CacheBackend):
+    """Redis 기반 공유 캐시"""
+
+    KEY_PREFIX = "cache:"
+    VERSION_PREFIX = "cache_version:"
+
+    def __init__(self):
+        import redis
+
+        self._redis = redis.from_url(settings.REDIS_URL)
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self._redis.get(self.KEY_PREFIX + key)
+
+    def set(self, key: str, value: bytes, ttl: int) -> None:
+        self._redis.setex(self.KEY_PREFIX + key, ttl, value)
+
+    def get_versions(self, names: list[str]) -> list[int]:
+        values = self._redis.mget([self.VERSION_PREFIX + name for name in names])
+        return [int(v) if v else 0 for v in values]
+
+    def bump_version(self, name: str) -> None:
+        self._redis.incr(self.VERSION_PREFIX + name)
+
+
+class ResponseCache:
+    """네임스페이스 버전 기반 응답 캐시"""
+
+    def __init__(self, backend: Optional[CacheBackend]):
+        self.backend = backend
+
+    @property
+    def enabled(self) -> bool:
+        return self.backend is not None
+
+    def make_key(self, namespaces: list[str], params: Optional[dict] = None) -> str:
+        """네임스페이스 버전과 정규화된 파라미터로 캐시 키 생성"""
+        versions = self.backend.get_versions(namespaces)
+        normalized = {k: v for k, v in sorted((params or {}).items()) if v is not None}
+        digest = hashlib.sha1(
+            json.dumps(normalized, default=str, ensure_ascii=False).encode("utf-8")
+        ).hexdigest()
+        version_part = ",".join(f"{name}@{version}" for name, version in zip(namespaces, versions))
+        return f"{version_part}:{digest}"
+
+    def get(self, key: str) -> Optional[tuple[str, bytes]]:
+        """(ETag, 본문) 조회"""
+        raw = self.backend.get(key)
+        if raw is None:
+            return None
+        etag, _, body = raw.partition(b"\n")
+        return etag.decode("ascii"), body
+
+    def set(self, key: str, body: bytes, ttl: int) -> str:
+        """본문 저장 후 ETag 반환"""
+        etag = f'W/"{hashlib.sha1(body).hexdigest()}"'
+        self.backend.set(key, etag.encode("ascii") + b"\n" + body, ttl)
+        return etag
+
+    def invalidate(self, *namespaces: str) -> None:
+        """네임스페이스에 속한 모든 캐시 무효화"""
+        if not self.enabled:
+            return
+        for name in namespaces:
+            try:
+                self.backend.bump_version(name)
+            except Exception as e:
+                print(f"[ResponseCache] 무효화 실패 ({name}): {e}")
+
+
+def _create_backend() -> Optional[CacheBackend]:
+    """설정에 따라 캐시 백엔드 생성"""
+    backend = settings.CACHE_BACKEND.lower()
+
+    if backend == "redis":
+        return RedisCache()
+    if backend == "memory":
+        return MemoryCache(max_entries=settings.CACHE_MAX_ENTRIES)
+    return None
+
+
+response_cache = ResponseCache(_create_backend())
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # 약한 비교 (W/ 접두사 무시)
+    target = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == target for tag in if_none_match.split(","))
+
+
+def cached_response(
+    request: Request,
+    namespaces: list[str],
+    params: Optional[dict],
+    build: Callable[[], Any],
+    ttl: Optional[int] = None,
+) -> Response:
+    """
+    캐시된 JSON 응답 반환
+
+    캐시에 없으면 build()로 응답을 만들어 저장한다.
+    build()에서 발생한 예외(404 등)는 캐시하지 않고 그대로 전달한다.
+    브라우저는 매번 ETag로 재검증하고, 변경이 없으면 304를 받는다.
+    """
+    headers = {"Cache-Control": "no-cache"}
+
+    if not response_cache.enabled:
+        body = json.dumps(jsonable_encoder(build()), ensure_ascii=False).encode("utf-8")
+        return Response(content=body, media_type="application/json")
+
+    key = None
+    cached = None
+    try:
+        key = response_cache.make_key(namespaces, params)
+        cached = response_cache.get(key)
+    except Exception as e:
+        # 캐시 장애 시 DB 조회로 대체
+        print(f"[ResponseCache] 조회 실패: {e}")
+
+    if cached is not None:
+        etag, body = cached
+        headers["X-Cache"] = "HIT"
+    else:
+        body = json.dumps(jsonable_encoder(build()), ensure_ascii=False).encode("utf-8")
+        etag = f'W/"{hashlib.sha1(body).hexdigest()}"'
+        if key is not None:
+            try:
+                etag = response_cache.set(key, body, ttl or settings.CACHE_DEFAULT_TTL)
+            except Exception as e:
+                print(f"[ResponseCache] 저장 실패: {e}")
+        headers["X-Cache"] = "MISS"
+
+    headers["ETag"] = etag
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
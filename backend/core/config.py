@@ -35,6 +35,54 @@ class Settings(BaseSettings):
     TOKEN_BLACKLIST_BACKEND: str = "db"  # "db" 또는 "redis"
     REDIS_URL: str = "redis://localhost:6379/0"  # Redis 사용 시
 
+    # 업무 기준 시간대 (일별 통계의 날짜 경계)
+    BUSINESS_TIMEZONE: str = "Asia/Seoul"
+
+    # 검색 설정
+    # "auto": PostgreSQL이면 pg_trgm, 그 외에는 인메모리 n-gram 인덱스
+    SEARCH_BACKEND: str = "auto"  # "auto", "postgres" 또는 "ngram"
+    SEARCH_INDEX_REFRESH_INTERVAL: int = 300  # n-gram 색인 백그라운드 재생성 주기 (초, 검색이 있을 때만, 0이면 색인 없이 ILIKE 검색)
+
+    # 응답 캐시 설정 (공개 API)
+    CACHE_BACKEND: str = "memory"  # "memory", "redis" 또는 "none"
+    CACHE_DEFAULT_TTL: int = 60  # 초
+    CACHE_MAX_ENTRIES: int = 1000  # 인메모리 LRU 최대 항목 수
+
+    # 관리자 대시보드/통계 스냅샷 캐시 (프로세스별)
+    DASHBOARD_SNAPSHOT_TTL: int = 30  # 이 시간 안에는 캐시 그대로 사용 (초, 0이면 캐시 안 함)
+    DASHBOARD_SNAPSHOT_STALE_TTL: int = 300  # TTL 이후 이 시간까지는 이전 값을 반환하고 백그라운드에서 갱신 (초)
+
+    # 백그라운드 작업 주기 (초, 0이면 비활성화)
+    PRODUCT_COUNTER_RECONCILE_INTERVAL: int = 3600  # 상품 카운터 정합성 보정
+    MODERATION_SCAN_INTERVAL: int = 60  # 금칙어 변경 후 기존 게시글/댓글 재검사
+    DAILY_STATS_ROLLUP_INTERVAL: int = 300  # 일별 통계 증분 집계
+    VISITOR_PARTITION_MAINTENANCE_INTERVAL: int = 3600  # 방문 기록 파티션 생성/이동, 보관 기간 정리
+    POINT_EXPIRY_INTERVAL: int = 3600  # 만료 시각이 지난 포인트 차감
+
+    # 금칙어 재검사 설정 (서비스 트래픽에 영향을 주지 않도록 나누어 처리)
+    MODERATION_SCAN_CHUNK_SIZE: int = 200  # 한 번에 검사할 행 수
+    MODERATION_SCAN_THROTTLE: float = 0.1  # 청크 사이 대기 시간 (초)
+    MODERATION_SCAN_MAX_SECONDS: int = 20  # 1회 실행 최대 시간 (초, 남은 분량은 다음 실행에서 이어서)
+
+    # 방문 기록 수집 설정 (메모리 큐에 모아 일괄 저장)
+    VISITOR_TRACKING_ENABLED: bool = True
+    VISITOR_FLUSH_INTERVAL_MS: int = 1000  # 저장 주기 (밀리초, 0이면 비활성화)
+    VISITOR_FLUSH_BATCH_SIZE: int = 500  # 다중 행 INSERT 1회 최대 행 수 (이만큼 쌓이면 주기 전에 저장)
+    VISITOR_QUEUE_MAX_SIZE: int = 50000  # 큐 최대 크기 (초과 시 새 이벤트 버림)
+    VISITOR_FLUSH_MAX_ATTEMPTS: int = 3  # 같은 묶음이 이 횟수만큼 연속 실패하면 나누어 저장하고 실패하는 행은 버림
+    VISITOR_TRACK_PATHS: list[str] = []  # 미들웨어로 자동 기록할 GET 경로 접두사 (비어 있으면 미들웨어 미사용)
+
+    # 방문 기록 월별 파티션/보관 설정 (visitors/partitions.py)
+    VISITOR_PARTITION_MONTHS_AHEAD: int = 2  # PostgreSQL: 미리 만들어 둘 다음 달 파티션 수
+    VISITOR_PARTITION_HOT_MONTHS: int = 2  # SQLite: visitors 테이블에 남겨 둘 최근 개월 수 (이번 달 포함)
+    VISITOR_RETENTION_MONTHS: int = 13  # 원본 방문 기록 보관 개월 수 (이번 달 포함, 0이면 무기한)
+    VISITOR_ARCHIVE_DIR: str = "archive/visitors"  # 보관 기간이 지난 달을 gzip NDJSON으로 내보낼 경로 (빈 값이면 내보내지 않고 삭제)
+
+    # 포인트 만료 설정 (points/expiry.py)
+    POINT_EXPIRY_LOOKBACK_DAYS: int = 30  # 만료 시각이 최근 이 기간 안인 적립만 조회 (작업이 더 오래 멈췄으면 스크립트 --since로 처리)
+    POINT_EXPIRY_CHUNK_SIZE: int = 200  # 트랜잭션 하나가 처리할 사용자 수
+    POINT_EXPIRY_WORKERS: int = 2  # 병렬 처리 스레드 수 (SQLite는 1)
+
     # 일반 회원 로그인 설정
     ENABLE_EMAIL_LOGIN: bool = True  # 이메일/비밀번호 로그인 사용 여부
     ENABLE_REGISTRATION: bool = True  # 회원가입 허용 여부
@@ -47,9 +47,9 @@ def init_db() -> None:
     from payments.models import Payment
     from points.models import PointHistory
     from banners.models import Banner
-    from visitors.models import Visitor, DailyStats
+    from visitors.models import Visitor, DailyStats, StatsWatermark
     from wishlist.models import Wishlist
     from boards.models import Board, Post, PostImage, PostAttachment, Comment, PostLike
-    from forbidden_words.models import ForbiddenWord
+    from forbidden_words.models import ForbiddenWord, ModerationMatch, ModerationCheckpoint
 
     Base.metadata.create_all(bind=engine)
@@ -198,8 +198,19 @@ COMMENT ON COLUMN point_histories.reference_id IS '관련 주문/결제 ID';
 COMMENT ON COLUMN point_histories.description IS '상세 설명';
 COMMENT ON COLUMN point_histories.admin_id IS '처리 관리자 FK';
 COMMENT ON COLUMN point_histories.expires_at IS '만료 시각';
+COMMENT ON COLUMN point_histories.expiry_processed_at IS '만료 처리 시각 (적립 행, NULL이면 미처리)';
 COMMENT ON COLUMN point_histories.created_at IS '생성 시각';
 
+-- ============================================
+-- user_point_summaries: 사용자별 포인트 누계 테이블
+-- ============================================
+COMMENT ON TABLE user_point_summaries IS '사용자별 포인트 적립/사용/만료 누계';
+COMMENT ON COLUMN user_point_summaries.user_id IS '사용자 FK (PK)';
+COMMENT ON COLUMN user_point_summaries.total_earned IS '적립 합계';
+COMMENT ON COLUMN user_point_summaries.total_used IS '사용 합계 (양수)';
+COMMENT ON COLUMN user_point_summaries.total_expired IS '만료 합계 (양수)';
+COMMENT ON COLUMN user_point_summaries.updated_at IS '수정 시각';
+
 -- ============================================
 -- boards: 게시판 테이블
 -- ============================================
@@ -297,6 +308,32 @@ COMMENT ON COLUMN forbidden_words.reason IS '등록 사유';
 COMMENT ON COLUMN forbidden_words.created_at IS '등록 시각';
 COMMENT ON COLUMN forbidden_words.updated_at IS '수정 시각';
 
+-- ============================================
+-- moderation_matches: 금칙어 재검사 결과 테이블
+-- ============================================
+COMMENT ON TABLE moderation_matches IS '기존 게시글/댓글 금칙어 재검사 결과';
+COMMENT ON COLUMN moderation_matches.id IS '결과 고유 ID';
+COMMENT ON COLUMN moderation_matches.content_type IS '대상 유형 (post, comment)';
+COMMENT ON COLUMN moderation_matches.content_id IS '대상 게시글/댓글 ID';
+COMMENT ON COLUMN moderation_matches.field IS '필드 (title, content)';
+COMMENT ON COLUMN moderation_matches.matched_words IS '매칭된 금칙어 목록 (JSON)';
+COMMENT ON COLUMN moderation_matches.scanned_at IS '검사 시각';
+
+-- ============================================
+-- moderation_checkpoints: 금칙어 재검사 진행 위치 테이블
+-- ============================================
+COMMENT ON TABLE moderation_checkpoints IS '금칙어 재검사 진행 위치 (대상 유형별 1행)';
+COMMENT ON COLUMN moderation_checkpoints.content_type IS '대상 유형 (post, comment)';
+COMMENT ON COLUMN moderation_checkpoints.status IS '상태 (pending, running, completed)';
+COMMENT ON COLUMN moderation_checkpoints.generation IS '재검사 요청 세대 (요청마다 증가)';
+COMMENT ON COLUMN moderation_checkpoints.last_id IS '마지막으로 처리한 ID';
+COMMENT ON COLUMN moderation_checkpoints.scanned_count IS '검사한 항목 수';
+COMMENT ON COLUMN moderation_checkpoints.matched_count IS '금칙어가 발견된 항목 수';
+COMMENT ON COLUMN moderation_checkpoints.locked_until IS '진행 임대 만료 시각';
+COMMENT ON COLUMN moderation_checkpoints.requested_at IS '재검사 요청 시각';
+COMMENT ON COLUMN moderation_checkpoints.completed_at IS '완료 시각';
+COMMENT ON COLUMN moderation_checkpoints.updated_at IS '수정 시각';
+
 -- ============================================
 -- banners: 배너 테이블
 -- ============================================
@@ -361,6 +398,26 @@ COMMENT ON COLUMN daily_stats.total_revenue IS '총 매출액';
 COMMENT ON COLUMN daily_stats.created_at IS '생성 시각';
 COMMENT ON COLUMN daily_stats.updated_at IS '수정 시각';
 
+-- ============================================
+-- visitor_sketches: 일별 고유 방문자 스케치 테이블
+-- ============================================
+COMMENT ON TABLE visitor_sketches IS '일별 고유 방문자 HyperLogLog 스케치';
+COMMENT ON COLUMN visitor_sketches.id IS '스케치 고유 ID';
+COMMENT ON COLUMN visitor_sketches.date IS '날짜 (업무 기준)';
+COMMENT ON COLUMN visitor_sketches.device_type IS '디바이스 유형 (all, desktop, mobile, tablet, unknown)';
+COMMENT ON COLUMN visitor_sketches.registers IS 'HyperLogLog 레지스터 (session_id 기준)';
+COMMENT ON COLUMN visitor_sketches.updated_at IS '수정 시각';
+
+-- ============================================
+-- stats_watermarks: 일별 통계 집계 워터마크 테이블
+-- ============================================
+COMMENT ON TABLE stats_watermarks IS '일별 통계 집계 워터마크 (원본 테이블별 1행)';
+COMMENT ON COLUMN stats_watermarks.source IS '원본 테이블 (visitors, users, payments)';
+COMMENT ON COLUMN stats_watermarks.last_id IS '마지막으로 처리한 ID';
+COMMENT ON COLUMN stats_watermarks.last_updated_at IS '마지막으로 처리한 수정 시각';
+COMMENT ON COLUMN stats_watermarks.last_run_date IS '마지막 집계 실행일 (업무 기준)';
+COMMENT ON COLUMN stats_watermarks.updated_at IS '수정 시각';
+
 -- ============================================
 -- wishlists: 관심 상품 테이블
 -- ============================================
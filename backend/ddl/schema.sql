@@ -308,6 +308,58 @@ CREATE SEQUENCE public.forbidden_words_id_seq
 ALTER SEQUENCE public.forbidden_words_id_seq OWNED BY public.forbidden_words.id;
 
 
+--
+-- Name: moderation_checkpoints; Type: TABLE; Schema: public; Owner: -
+--
+
+CREATE TABLE public.moderation_checkpoints (
+    content_type character varying(20) NOT NULL,
+    status character varying(20),
+    generation integer,
+    last_id integer,
+    scanned_count integer,
+    matched_count integer,
+    locked_until timestamp with time zone,
+    requested_at timestamp with time zone,
+    completed_at timestamp with time zone,
+    updated_at timestamp with time zone DEFAULT now()
+);
+
+
+--
+-- Name: moderation_matches; Type: TABLE; Schema: public; Owner: -
+--
+
+CREATE TABLE public.moderation_matches (
+    id integer NOT NULL,
+    content_type character varying(20) NOT NULL,
+    content_id integer NOT NULL,
+    field character varying(20) NOT NULL,
+    matched_words json NOT NULL,
+    scanned_at timestamp with time zone DEFAULT now()
+);
+
+
+--
+-- Name: moderation_matches_id_seq; Type: SEQUENCE; Schema: public; Owner: -
+--
+
+CREATE SEQUENCE public.moderation_matches_id_seq
+    AS integer
+    START WITH 1
+    INCREMENT BY 1
+    NO MINVALUE
+    NO MAXVALUE
+    CACHE 1;
+
+
+--
+-- Name: moderation_matches_id_seq; Type: SEQUENCE OWNED BY; Schema: public; Owner: -
+--
+
+ALTER SEQUENCE public.moderation_matches_id_seq OWNED BY public.moderation_matches.id;
+
+
 --
 -- Name: payments; Type: TABLE; Schema: public; Owner: -
 --
@@ -372,6 +424,7 @@ CREATE TABLE public.point_histories (
     description text,
     admin_id integer,
     expires_at timestamp with time zone,
+    expiry_processed_at timestamp with time zone,
     created_at timestamp with time zone DEFAULT now()
 );
 
@@ -705,6 +758,19 @@ CREATE SEQUENCE public.shipping_addresses_id_seq
 ALTER SEQUENCE public.shipping_addresses_id_seq OWNED BY public.shipping_addresses.id;
 
 
+--
+-- Name: stats_watermarks; Type: TABLE; Schema: public; Owner: -
+--
+
+CREATE TABLE public.stats_watermarks (
+    source character varying(50) NOT NULL,
+    last_id integer,
+    last_updated_at timestamp with time zone,
+    last_run_date date,
+    updated_at timestamp with time zone DEFAULT now()
+);
+
+
 --
 -- Name: suspicious_activities; Type: TABLE; Schema: public; Owner: -
 --
@@ -784,6 +850,19 @@ CREATE SEQUENCE public.user_devices_id_seq
 ALTER SEQUENCE public.user_devices_id_seq OWNED BY public.user_devices.id;
 
 
+--
+-- Name: user_point_summaries; Type: TABLE; Schema: public; Owner: -
+--
+
+CREATE TABLE public.user_point_summaries (
+    user_id integer NOT NULL,
+    total_earned bigint NOT NULL,
+    total_used bigint NOT NULL,
+    total_expired bigint NOT NULL,
+    updated_at timestamp with time zone DEFAULT now()
+);
+
+
 --
 -- Name: users; Type: TABLE; Schema: public; Owner: -
 --
@@ -835,6 +914,39 @@ CREATE SEQUENCE public.users_id_seq
 ALTER SEQUENCE public.users_id_seq OWNED BY public.users.id;
 
 
+--
+-- Name: visitor_sketches; Type: TABLE; Schema: public; Owner: -
+--
+
+CREATE TABLE public.visitor_sketches (
+    id integer NOT NULL,
+    date date NOT NULL,
+    device_type character varying(20) NOT NULL,
+    registers bytea NOT NULL,
+    updated_at timestamp with time zone DEFAULT now()
+);
+
+
+--
+-- Name: visitor_sketches_id_seq; Type: SEQUENCE; Schema: public; Owner: -
+--
+
+CREATE SEQUENCE public.visitor_sketches_id_seq
+    AS integer
+    START WITH 1
+    INCREMENT BY 1
+    NO MINVALUE
+    NO MAXVALUE
+    CACHE 1;
+
+
+--
+-- Name: visitor_sketches_id_seq; Type: SEQUENCE OWNED BY; Schema: public; Owner: -
+--
+
+ALTER SEQUENCE public.visitor_sketches_id_seq OWNED BY public.visitor_sketches.id;
+
+
 --
 -- Name: visitors; Type: TABLE; Schema: public; Owner: -
 --
@@ -957,6 +1069,13 @@ ALTER TABLE ONLY public.daily_stats ALTER COLUMN id SET DEFAULT nextval('public.
 ALTER TABLE ONLY public.forbidden_words ALTER COLUMN id SET DEFAULT nextval('public.forbidden_words_id_seq'::regclass);
 
 
+--
+-- Name: moderation_matches id; Type: DEFAULT; Schema: public; Owner: -
+--
+
+ALTER TABLE ONLY public.moderation_matches ALTER COLUMN id SET DEFAULT nextval('public.moderation_matches_id_seq'::regclass);
+
+
 --
 -- Name: payments id; Type: DEFAULT; Schema: public; Owner: -
 --
@@ -1048,6 +1167,13 @@ ALTER TABLE ONLY public.user_devices ALTER COLUMN id SET DEFAULT nextval('public
 ALTER TABLE ONLY public.users ALTER COLUMN id SET DEFAULT nextval('public.users_id_seq'::regclass);
 
 
+--
+-- Name: visitor_sketches id; Type: DEFAULT; Schema: public; Owner: -
+--
+
+ALTER TABLE ONLY public.visitor_sketches ALTER COLUMN id SET DEFAULT nextval('public.visitor_sketches_id_seq'::regclass);
+
+
 --
 -- Name: visitors id; Type: DEFAULT; Schema: public; Owner: -
 --
@@ -1126,6 +1252,22 @@ ALTER TABLE ONLY public.forbidden_words
     ADD CONSTRAINT forbidden_words_pkey PRIMARY KEY (id);
 
 
+--
+-- Name: moderation_checkpoints moderation_checkpoints_pkey; Type: CONSTRAINT; Schema: public; Owner: -
+--
+
+ALTER TABLE ONLY public.moderation_checkpoints
+    ADD CONSTRAINT moderation_checkpoints_pkey PRIMARY KEY (content_type);
+
+
+--
+-- Name: moderation_matches moderation_matches_pkey; Type: CONSTRAINT; Schema: public; Owner: -
+--
+
+ALTER TABLE ONLY public.moderation_matches
+    ADD CONSTRAINT moderation_matches_pkey PRIMARY KEY (id);
+
+
 --
 -- Name: payments payments_pkey; Type: CONSTRAINT; Schema: public; Owner: -
 --
@@ -1206,6 +1348,14 @@ ALTER TABLE ONLY public.shipping_addresses
     ADD CONSTRAINT shipping_addresses_pkey PRIMARY KEY (id);
 
 
+--
+-- Name: stats_watermarks stats_watermarks_pkey; Type: CONSTRAINT; Schema: public; Owner: -
+--
+
+ALTER TABLE ONLY public.stats_watermarks
+    ADD CONSTRAINT stats_watermarks_pkey PRIMARY KEY (source);
+
+
 --
 -- Name: suspicious_activities suspicious_activities_pkey; Type: CONSTRAINT; Schema: public; Owner: -
 --
@@ -1222,6 +1372,14 @@ ALTER TABLE ONLY public.post_likes
     ADD CONSTRAINT uq_post_like_user UNIQUE (post_id, user_id);
 
 
+--
+-- Name: visitor_sketches uq_visitor_sketches_date_device; Type: CONSTRAINT; Schema: public; Owner: -
+--
+
+ALTER TABLE ONLY public.visitor_sketches
+    ADD CONSTRAINT uq_visitor_sketches_date_device UNIQUE (date, device_type);
+
+
 --
 -- Name: wishlists uq_wishlist_user_product; Type: CONSTRAINT; Schema: public; Owner: -
 --
@@ -1238,6 +1396,14 @@ ALTER TABLE ONLY public.user_devices
     ADD CONSTRAINT user_devices_pkey PRIMARY KEY (id);
 
 
+--
+-- Name: user_point_summaries user_point_summaries_pkey; Type: CONSTRAINT; Schema: public; Owner: -
+--
+
+ALTER TABLE ONLY public.user_point_summaries
+    ADD CONSTRAINT user_point_summaries_pkey PRIMARY KEY (user_id);
+
+
 --
 -- Name: users users_pkey; Type: CONSTRAINT; Schema: public; Owner: -
 --
@@ -1246,6 +1412,14 @@ ALTER TABLE ONLY public.users
     ADD CONSTRAINT users_pkey PRIMARY KEY (id);
 
 
+--
+-- Name: visitor_sketches visitor_sketches_pkey; Type: CONSTRAINT; Schema: public; Owner: -
+--
+
+ALTER TABLE ONLY public.visitor_sketches
+    ADD CONSTRAINT visitor_sketches_pkey PRIMARY KEY (id);
+
+
 --
 -- Name: visitors visitors_pkey; Type: CONSTRAINT; Schema: public; Owner: -
 --
@@ -1395,6 +1569,27 @@ CREATE INDEX ix_forbidden_words_is_active ON public.forbidden_words USING btree
 CREATE INDEX ix_forbidden_words_word ON public.forbidden_words USING btree (word);
 
 
+--
+-- Name: ix_moderation_matches_content; Type: INDEX; Schema: public; Owner: -
+--
+
+CREATE INDEX ix_moderation_matches_content ON public.moderation_matches USING btree (content_type, content_id);
+
+
+--
+-- Name: ix_moderation_matches_id; Type: INDEX; Schema: public; Owner: -
+--
+
+CREATE INDEX ix_moderation_matches_id ON public.moderation_matches USING btree (id);
+
+
+--
+-- Name: ix_payments_created_at_id; Type: INDEX; Schema: public; Owner: -
+--
+
+CREATE INDEX ix_payments_created_at_id ON public.payments USING btree (created_at, id);
+
+
 --
 -- Name: ix_payments_id; Type: INDEX; Schema: public; Owner: -
 --
@@ -1409,6 +1604,13 @@ CREATE INDEX ix_payments_id ON public.payments USING btree (id);
 CREATE UNIQUE INDEX ix_payments_order_id ON public.payments USING btree (order_id);
 
 
+--
+-- Name: ix_payments_paid_at; Type: INDEX; Schema: public; Owner: -
+--
+
+CREATE INDEX ix_payments_paid_at ON public.payments USING btree (paid_at);
+
+
 --
 -- Name: ix_payments_status; Type: INDEX; Schema: public; Owner: -
 --
@@ -1416,6 +1618,27 @@ CREATE UNIQUE INDEX ix_payments_order_id ON public.payments USING btree (order_i
 CREATE INDEX ix_payments_status ON public.payments USING btree (status);
 
 
+--
+-- Name: ix_payments_updated_at; Type: INDEX; Schema: public; Owner: -
+--
+
+CREATE INDEX ix_payments_updated_at ON public.payments USING btree (updated_at);
+
+
+--
+-- Name: ix_point_histories_created_at_id; Type: INDEX; Schema: public; Owner: -
+--
+
+CREATE INDEX ix_point_histories_created_at_id ON public.point_histories USING btree (created_at, id);
+
+
+--
+-- Name: ix_point_histories_expiry_pending; Type: INDEX; Schema: public; Owner: -
+--
+
+CREATE INDEX ix_point_histories_expiry_pending ON public.point_histories USING btree (expires_at) WHERE ((expires_at IS NOT NULL) AND (expiry_processed_at IS NULL));
+
+
 --
 -- Name: ix_point_histories_id; Type: INDEX; Schema: public; Owner: -
 --
@@ -1556,6 +1779,13 @@ CREATE INDEX ix_product_slots_product_id ON public.product_slots USING btree (pr
 CREATE INDEX ix_product_slots_status ON public.product_slots USING btree (status);
 
 
+--
+-- Name: ix_products_created_at_id; Type: INDEX; Schema: public; Owner: -
+--
+
+CREATE INDEX ix_products_created_at_id ON public.products USING btree (created_at, id);
+
+
 --
 -- Name: ix_products_id; Type: INDEX; Schema: public; Owner: -
 --
@@ -1633,6 +1863,13 @@ CREATE INDEX ix_user_devices_id ON public.user_devices USING btree (id);
 CREATE INDEX ix_user_devices_user_id ON public.user_devices USING btree (user_id);
 
 
+--
+-- Name: ix_users_created_at; Type: INDEX; Schema: public; Owner: -
+--
+
+CREATE INDEX ix_users_created_at ON public.users USING btree (created_at);
+
+
 --
 -- Name: ix_users_email; Type: INDEX; Schema: public; Owner: -
 --
@@ -1654,6 +1891,13 @@ CREATE INDEX ix_users_id ON public.users USING btree (id);
 CREATE UNIQUE INDEX ix_users_phone ON public.users USING btree (phone);
 
 
+--
+-- Name: ix_visitor_sketches_id; Type: INDEX; Schema: public; Owner: -
+--
+
+CREATE INDEX ix_visitor_sketches_id ON public.visitor_sketches USING btree (id);
+
+
 --
 -- Name: ix_visitors_id; Type: INDEX; Schema: public; Owner: -
 --
@@ -1682,6 +1926,13 @@ CREATE INDEX ix_visitors_user_id ON public.visitors USING btree (user_id);
 CREATE INDEX ix_visitors_visited_at ON public.visitors USING btree (visited_at);
 
 
+--
+-- Name: ix_visitors_visited_at_id; Type: INDEX; Schema: public; Owner: -
+--
+
+CREATE INDEX ix_visitors_visited_at_id ON public.visitors USING btree (visited_at, id);
+
+
 --
 -- Name: ix_wishlists_id; Type: INDEX; Schema: public; Owner: -
 --
@@ -1703,6 +1954,13 @@ CREATE INDEX ix_wishlists_product_id ON public.wishlists USING btree (product_id
 CREATE INDEX ix_wishlists_user_id ON public.wishlists USING btree (user_id);
 
 
+--
+-- Name: uq_point_histories_reference; Type: INDEX; Schema: public; Owner: -
+--
+
+CREATE UNIQUE INDEX uq_point_histories_reference ON public.point_histories USING btree (user_id, reason, reference_id) WHERE (reference_id IS NOT NULL);
+
+
 --
 -- Name: categories categories_parent_id_fkey; Type: FK CONSTRAINT; Schema: public; Owner: -
 --
@@ -1887,6 +2145,14 @@ ALTER TABLE ONLY public.user_devices
     ADD CONSTRAINT user_devices_user_id_fkey FOREIGN KEY (user_id) REFERENCES public.users(id) ON DELETE CASCADE;
 
 
+--
+-- Name: user_point_summaries user_point_summaries_user_id_fkey; Type: FK CONSTRAINT; Schema: public; Owner: -
+--
+
+ALTER TABLE ONLY public.user_point_summaries
+    ADD CONSTRAINT user_point_summaries_user_id_fkey FOREIGN KEY (user_id) REFERENCES public.users(id);
+
+
 --
 -- Name: wishlists wishlists_product_id_fkey; Type: FK CONSTRAINT; Schema: public; Owner: -
 --
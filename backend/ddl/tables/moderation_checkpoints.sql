@@ -0,0 +1,57 @@
+--
+-- PostgreSQL database dump
+--
+
+\restrict sephVqnldkX2ZKZ75XuigTccNBWkPPDcnqpX7hWih6L8kWsu3u0f37ieZGgtvKo
+
+-- Dumped from database version 17.6 (Homebrew)
+-- Dumped by pg_dump version 17.6 (Homebrew)
+
+SET statement_timeout = 0;
+SET lock_timeout = 0;
+SET idle_in_transaction_session_timeout = 0;
+SET transaction_timeout = 0;
+SET client_encoding = 'UTF8';
+SET standard_conforming_strings = on;
+SELECT pg_catalog.set_config('search_path', '', false);
+SET check_function_bodies = false;
+SET xmloption = content;
+SET client_min_messages = warning;
+SET row_security = off;
+
+SET default_tablespace = '';
+
+SET default_table_access_method = heap;
+
+--
+-- Name: moderation_checkpoints; Type: TABLE; Schema: public; Owner: -
+--
+
+CREATE TABLE public.moderation_checkpoints (
+    content_type character varying(20) NOT NULL,
+    status character varying(20),
+    generation integer,
+    last_id integer,
+    scanned_count integer,
+    matched_count integer,
+    locked_until timestamp with time zone,
+    requested_at timestamp with time zone,
+    completed_at timestamp with time zone,
+    updated_at timestamp with time zone DEFAULT now()
+);
+
+
+--
+-- Name: moderation_checkpoints moderation_checkpoints_pkey; Type: CONSTRAINT; Schema: public; Owner: -
+--
+
+ALTER TABLE ONLY public.moderation_checkpoints
+    ADD CONSTRAINT moderation_checkpoints_pkey PRIMARY KEY (content_type);
+
+
+--
+-- PostgreSQL database dump complete
+--
+
+\unrestrict sephVqnldkX2ZKZ75XuigTccNBWkPPDcnqpX7hWih6L8kWsu3u0f37ieZGgtvKo
+
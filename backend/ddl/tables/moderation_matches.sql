@@ -0,0 +1,94 @@
+--
+-- PostgreSQL database dump
+--
+
+\restrict zmt3fGpzKcWHT9ctezwnIWmtbSYzsGFif89uff83ikRC8obenoZyX86zdlozCuD
+
+-- Dumped from database version 17.6 (Homebrew)
+-- Dumped by pg_dump version 17.6 (Homebrew)
+
+SET statement_timeout = 0;
+SET lock_timeout = 0;
+SET idle_in_transaction_session_timeout = 0;
+SET transaction_timeout = 0;
+SET client_encoding = 'UTF8';
+SET standard_conforming_strings = on;
+SELECT pg_catalog.set_config('search_path', '', false);
+SET check_function_bodies = false;
+SET xmloption = content;
+SET client_min_messages = warning;
+SET row_security = off;
+
+SET default_tablespace = '';
+
+SET default_table_access_method = heap;
+
+--
+-- Name: moderation_matches; Type: TABLE; Schema: public; Owner: -
+--
+
+CREATE TABLE public.moderation_matches (
+    id integer NOT NULL,
+    content_type character varying(20) NOT NULL,
+    content_id integer NOT NULL,
+    field character varying(20) NOT NULL,
+    matched_words json NOT NULL,
+    scanned_at timestamp with time zone DEFAULT now()
+);
+
+
+--
+-- Name: moderation_matches_id_seq; Type: SEQUENCE; Schema: public; Owner: -
+--
+
+CREATE SEQUENCE public.moderation_matches_id_seq
+    AS integer
+    START WITH 1
+    INCREMENT BY 1
+    NO MINVALUE
+    NO MAXVALUE
+    CACHE 1;
+
+
+--
+-- Name: moderation_matches_id_seq; Type: SEQUENCE OWNED BY; Schema: public; Owner: -
+--
+
+ALTER SEQUENCE public.moderation_matches_id_seq OWNED BY public.moderation_matches.id;
+
+
+--
+-- Name: moderation_matches id; Type: DEFAULT; Schema: public; Owner: -
+--
+
+ALTER TABLE ONLY public.moderation_matches ALTER COLUMN id SET DEFAULT nextval('public.moderation_matches_id_seq'::regclass);
+
+
+--
+-- Name: moderation_matches moderation_matches_pkey; Type: CONSTRAINT; Schema: public; Owner: -
+--
+
+ALTER TABLE ONLY public.moderation_matches
+    ADD CONSTRAINT moderation_matches_pkey PRIMARY KEY (id);
+
+
+--
+-- Name: ix_moderation_matches_content; Type: INDEX; Schema: public; Owner: -
+--
+
+CREATE INDEX ix_moderation_matches_content ON public.moderation_matches USING btree (content_type, content_id);
+
+
+--
+-- Name: ix_moderation_matches_id; Type: INDEX; Schema: public; Owner: -
+--
+
+CREATE INDEX ix_moderation_matches_id ON public.moderation_matches USING btree (id);
+
+
+--
+-- PostgreSQL database dump complete
+--
+
+\unrestrict zmt3fGpzKcWHT9ctezwnIWmtbSYzsGFif89uff83ikRC8obenoZyX86zdlozCuD
+
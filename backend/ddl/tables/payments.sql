@@ -87,6 +87,13 @@ ALTER TABLE ONLY public.payments
     ADD CONSTRAINT payments_pkey PRIMARY KEY (id);
 
 
+--
+-- Name: ix_payments_created_at_id; Type: INDEX; Schema: public; Owner: -
+--
+
+CREATE INDEX ix_payments_created_at_id ON public.payments USING btree (created_at, id);
+
+
 --
 -- Name: ix_payments_id; Type: INDEX; Schema: public; Owner: -
 --
@@ -101,6 +108,13 @@ CREATE INDEX ix_payments_id ON public.payments USING btree (id);
 CREATE UNIQUE INDEX ix_payments_order_id ON public.payments USING btree (order_id);
 
 
+--
+-- Name: ix_payments_paid_at; Type: INDEX; Schema: public; Owner: -
+--
+
+CREATE INDEX ix_payments_paid_at ON public.payments USING btree (paid_at);
+
+
 --
 -- Name: ix_payments_status; Type: INDEX; Schema: public; Owner: -
 --
@@ -108,6 +122,13 @@ CREATE UNIQUE INDEX ix_payments_order_id ON public.payments USING btree (order_i
 CREATE INDEX ix_payments_status ON public.payments USING btree (status);
 
 
+--
+-- Name: ix_payments_updated_at; Type: INDEX; Schema: public; Owner: -
+--
+
+CREATE INDEX ix_payments_updated_at ON public.payments USING btree (updated_at);
+
+
 --
 -- Name: payments payments_product_id_fkey; Type: FK CONSTRAINT; Schema: public; Owner: -
 --
@@ -38,6 +38,7 @@ CREATE TABLE public.point_histories (
     description text,
     admin_id integer,
     expires_at timestamp with time zone,
+    expiry_processed_at timestamp with time zone,
     created_at timestamp with time zone DEFAULT now()
 );
 
@@ -77,6 +78,20 @@ ALTER TABLE ONLY public.point_histories
     ADD CONSTRAINT point_histories_pkey PRIMARY KEY (id);
 
 
+--
+-- Name: ix_point_histories_created_at_id; Type: INDEX; Schema: public; Owner: -
+--
+
+CREATE INDEX ix_point_histories_created_at_id ON public.point_histories USING btree (created_at, id);
+
+
+--
+-- Name: ix_point_histories_expiry_pending; Type: INDEX; Schema: public; Owner: -
+--
+
+CREATE INDEX ix_point_histories_expiry_pending ON public.point_histories USING btree (expires_at) WHERE ((expires_at IS NOT NULL) AND (expiry_processed_at IS NULL));
+
+
 --
 -- Name: ix_point_histories_id; Type: INDEX; Schema: public; Owner: -
 --
@@ -91,6 +106,13 @@ CREATE INDEX ix_point_histories_id ON public.point_histories USING btree (id);
 CREATE INDEX ix_point_histories_user_id ON public.point_histories USING btree (user_id);
 
 
+--
+-- Name: uq_point_histories_reference; Type: INDEX; Schema: public; Owner: -
+--
+
+CREATE UNIQUE INDEX uq_point_histories_reference ON public.point_histories USING btree (user_id, reason, reference_id) WHERE (reference_id IS NOT NULL);
+
+
 --
 -- Name: point_histories point_histories_admin_id_fkey; Type: FK CONSTRAINT; Schema: public; Owner: -
 --
@@ -95,6 +95,13 @@ ALTER TABLE ONLY public.products
 CREATE INDEX idx_products_category_id ON public.products USING btree (category_id);
 
 
+--
+-- Name: ix_products_created_at_id; Type: INDEX; Schema: public; Owner: -
+--
+
+CREATE INDEX ix_products_created_at_id ON public.products USING btree (created_at, id);
+
+
 --
 -- Name: ix_products_id; Type: INDEX; Schema: public; Owner: -
 --
@@ -0,0 +1,52 @@
+--
+-- PostgreSQL database dump
+--
+
+\restrict mDSAcEjlfBa5ARFPD1wVKYbTwToefNZv4RjLGbuzgA29hvqqIpr83Xx4wvFlaHa
+
+-- Dumped from database version 17.6 (Homebrew)
+-- Dumped by pg_dump version 17.6 (Homebrew)
+
+SET statement_timeout = 0;
+SET lock_timeout = 0;
+SET idle_in_transaction_session_timeout = 0;
+SET transaction_timeout = 0;
+SET client_encoding = 'UTF8';
+SET standard_conforming_strings = on;
+SELECT pg_catalog.set_config('search_path', '', false);
+SET check_function_bodies = false;
+SET xmloption = content;
+SET client_min_messages = warning;
+SET row_security = off;
+
+SET default_tablespace = '';
+
+SET default_table_access_method = heap;
+
+--
+-- Name: stats_watermarks; Type: TABLE; Schema: public; Owner: -
+--
+
+CREATE TABLE public.stats_watermarks (
+    source character varying(50) NOT NULL,
+    last_id integer,
+    last_updated_at timestamp with time zone,
+    last_run_date date,
+    updated_at timestamp with time zone DEFAULT now()
+);
+
+
+--
+-- Name: stats_watermarks stats_watermarks_pkey; Type: CONSTRAINT; Schema: public; Owner: -
+--
+
+ALTER TABLE ONLY public.stats_watermarks
+    ADD CONSTRAINT stats_watermarks_pkey PRIMARY KEY (source);
+
+
+--
+-- PostgreSQL database dump complete
+--
+
+\unrestrict mDSAcEjlfBa5ARFPD1wVKYbTwToefNZv4RjLGbuzgA29hvqqIpr83Xx4wvFlaHa
+
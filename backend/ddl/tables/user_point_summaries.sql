@@ -0,0 +1,60 @@
+--
+-- PostgreSQL database dump
+--
+
+\restrict XmTd3Zaem5UN3UJ8KWYxLTdRxR0LbW3OwThhq7m570cXcHnspwI1kjF04jCX657
+
+-- Dumped from database version 17.6 (Homebrew)
+-- Dumped by pg_dump version 17.6 (Homebrew)
+
+SET statement_timeout = 0;
+SET lock_timeout = 0;
+SET idle_in_transaction_session_timeout = 0;
+SET transaction_timeout = 0;
+SET client_encoding = 'UTF8';
+SET standard_conforming_strings = on;
+SELECT pg_catalog.set_config('search_path', '', false);
+SET check_function_bodies = false;
+SET xmloption = content;
+SET client_min_messages = warning;
+SET row_security = off;
+
+SET default_tablespace = '';
+
+SET default_table_access_method = heap;
+
+--
+-- Name: user_point_summaries; Type: TABLE; Schema: public; Owner: -
+--
+
+CREATE TABLE public.user_point_summaries (
+    user_id integer NOT NULL,
+    total_earned bigint NOT NULL,
+    total_used bigint NOT NULL,
+    total_expired bigint NOT NULL,
+    updated_at timestamp with time zone DEFAULT now()
+);
+
+
+--
+-- Name: user_point_summaries user_point_summaries_pkey; Type: CONSTRAINT; Schema: public; Owner: -
+--
+
+ALTER TABLE ONLY public.user_point_summaries
+    ADD CONSTRAINT user_point_summaries_pkey PRIMARY KEY (user_id);
+
+
+--
+-- Name: user_point_summaries user_point_summaries_user_id_fkey; Type: FK CONSTRAINT; Schema: public; Owner: -
+--
+
+ALTER TABLE ONLY public.user_point_summaries
+    ADD CONSTRAINT user_point_summaries_user_id_fkey FOREIGN KEY (user_id) REFERENCES public.users(id);
+
+
+--
+-- PostgreSQL database dump complete
+--
+
+\unrestrict XmTd3Zaem5UN3UJ8KWYxLTdRxR0LbW3OwThhq7m570cXcHnspwI1kjF04jCX657
+
@@ -89,6 +89,13 @@ ALTER TABLE ONLY public.users
     ADD CONSTRAINT users_pkey PRIMARY KEY (id);
 
 
+--
+-- Name: ix_users_created_at; Type: INDEX; Schema: public; Owner: -
+--
+
+CREATE INDEX ix_users_created_at ON public.users USING btree (created_at);
+
+
 --
 -- Name: ix_users_email; Type: INDEX; Schema: public; Owner: -
 --
@@ -0,0 +1,94 @@
+--
+-- PostgreSQL database dump
+--
+
+\restrict fC7crO2B4YviwsqdiuayxopSyLUQgtLYElnxaJGGNRfmo9JvQ25pQkVCFDhQg3i
+
+-- Dumped from database version 17.6 (Homebrew)
+-- Dumped by pg_dump version 17.6 (Homebrew)
+
+SET statement_timeout = 0;
+SET lock_timeout = 0;
+SET idle_in_transaction_session_timeout = 0;
+SET transaction_timeout = 0;
+SET client_encoding = 'UTF8';
+SET standard_conforming_strings = on;
+SELECT pg_catalog.set_config('search_path', '', false);
+SET check_function_bodies = false;
+SET xmloption = content;
+SET client_min_messages = warning;
+SET row_security = off;
+
+SET default_tablespace = '';
+
+SET default_table_access_method = heap;
+
+--
+-- Name: visitor_sketches; Type: TABLE; Schema: public; Owner: -
+--
+
+CREATE TABLE public.visitor_sketches (
+    id integer NOT NULL,
+    date date NOT NULL,
+    device_type character varying(20) NOT NULL,
+    registers bytea NOT NULL,
+    updated_at timestamp with time zone DEFAULT now()
+);
+
+
+--
+-- Name: visitor_sketches_id_seq; Type: SEQUENCE; Schema: public; Owner: -
+--
+
+CREATE SEQUENCE public.visitor_sketches_id_seq
+    AS integer
+    START WITH 1
+    INCREMENT BY 1
+    NO MINVALUE
+    NO MAXVALUE
+    CACHE 1;
+
+
+--
+-- Name: visitor_sketches_id_seq; Type: SEQUENCE OWNED BY; Schema: public; Owner: -
+--
+
+ALTER SEQUENCE public.visitor_sketches_id_seq OWNED BY public.visitor_sketches.id;
+
+
+--
+-- Name: visitor_sketches id; Type: DEFAULT; Schema: public; Owner: -
+--
+
+ALTER TABLE ONLY public.visitor_sketches ALTER COLUMN id SET DEFAULT nextval('public.visitor_sketches_id_seq'::regclass);
+
+
+--
+-- Name: visitor_sketches uq_visitor_sketches_date_device; Type: CONSTRAINT; Schema: public; Owner: -
+--
+
+ALTER TABLE ONLY public.visitor_sketches
+    ADD CONSTRAINT uq_visitor_sketches_date_device UNIQUE (date, device_type);
+
+
+--
+-- Name: visitor_sketches visitor_sketches_pkey; Type: CONSTRAINT; Schema: public; Owner: -
+--
+
+ALTER TABLE ONLY public.visitor_sketches
+    ADD CONSTRAINT visitor_sketches_pkey PRIMARY KEY (id);
+
+
+--
+-- Name: ix_visitor_sketches_id; Type: INDEX; Schema: public; Owner: -
+--
+
+CREATE INDEX ix_visitor_sketches_id ON public.visitor_sketches USING btree (id);
+
+
+--
+-- PostgreSQL database dump complete
+--
+
+\unrestrict fC7crO2B4YviwsqdiuayxopSyLUQgtLYElnxaJGGNRfmo9JvQ25pQkVCFDhQg3i
+
@@ -107,6 +107,13 @@ CREATE INDEX ix_visitors_user_id ON public.visitors USING btree (user_id);
 CREATE INDEX ix_visitors_visited_at ON public.visitors USING btree (visited_at);
 
 
+--
+-- Name: ix_visitors_visited_at_id; Type: INDEX; Schema: public; Owner: -
+--
+
+CREATE INDEX ix_visitors_visited_at_id ON public.visitors USING btree (visited_at, id);
+
+
 --
 -- PostgreSQL database dump complete
 --
@@ -0,0 +1,316 @@
+"""
+금칙어 매처
+
+활성 금칙어 목록으로 한 번 만든 매처를 요청 간에 재사용한다.
+- CONTAINS: Aho-Corasick 오토마톤 (단어 수와 무관하게 텍스트 1회 순회)
+- EXACT: 소문자 해시 조회
+- REGEX: 하나로 합친 패턴으로 1회 순회 (역참조/그룹명/인라인 플래그가 있는 패턴은 개별 컴파일)
+
+목록이 바뀌면(생성/수정/삭제) invalidate_matchers()로 즉시 무효화하고,
+다른 프로세스의 변경은 (개수, 최대 ID, 최종 수정 시각) 지문으로 주기적으로 확인한다.
+
+게시글 본문처럼 HTML인 텍스트는 check_html()로 태그/속성을 제외한 텍스트 노드만 검사/치환한다.
+"""
+
+import html
+import re
+import threading
+import time
+from dataclasses import dataclass
+from typing import Iterator, List, Optional, Tuple
+
+from sqlalchemy import func, or_
+from sqlalchemy.orm import Session
+
+from common.search import strip_html
+from .models import ForbiddenWord, ForbiddenWordType, ForbiddenWordTarget
+
+DEFAULT_REPLACEMENT = "***"
+
+
+def _lower_preserving_length(text: str) -> str:
+    """위치가 어긋나지 않도록 길이를 유지하는 소문자 변환"""
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+    # 'İ'처럼 소문자 변환 시 길이가 바뀌는 문자는 그대로 둔다
+    return "".join(c.lower() if len(c.lower()) == 1 else c for c in text)
+
+
+class AhoCorasick:
+    """Aho-Corasick 다중 문자열 매칭 오토마톤"""
+
+    def __init__(self):
+        self._goto: List[dict] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[int]] = [[]]
+        self._lengths: List[int] = []
+
+    def add(self, word: str) -> int:
+        """단어 추가 후 단어 번호 반환 (build 전에만 호출)"""
+        state = 0
+        for ch in word:
+            next_state = self._goto[state].get(ch)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][ch] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+        index = len(self._lengths)
+        self._lengths.append(len(word))
+        self._output[state].append(index)
+        return index
+
+    def build(self) -> None:
+        """실패 링크 계산 (BFS)"""
+        queue = list(self._goto[0].values())
+        head = 0
+        while head < len(queue):
+            state = queue[head]
+            head += 1
+            for ch, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                candidate = self._goto[fail].get(ch, 0)
+                self._fail[next_state] = candidate if candidate != next_state else 0
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int, int]]:
+        """(시작, 끝, 단어 번호) 순회 (겹치는 일치 포함)"""
+        goto, fail, output, lengths = self._goto, self._fail, self._output, self._lengths
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if output[state]:
+                for index in output[state]:
+                    yield i - lengths[index] + 1, i + 1, index
+
+
+# HTML 태그 분리 (split 결과의 홀수 번째가 태그)
+_TAG_SPLIT_RE = re.compile(r"(<[^>]*>)")
+
+# 합친 패턴에 넣을 수 없는 정규식 (그룹 번호/이름이 바뀌면 의미가 달라지는 경우)
+_STANDALONE_REGEX_RE = re.compile(r"\\\d|\(\?P[<=]|\(\?[aiLmsux]+\)")
+
+
+@dataclass
+class _Word:
+    word: str
+    replacement: str
+
+
+class ForbiddenWordMatcher:
+    """컴파일된 금칙어 매처 (불변, 여러 스레드에서 공유)"""
+
+    def __init__(self, words: List[ForbiddenWord]):
+        self.exact: dict[str, _Word] = {}
+        self.contains: List[_Word] = []
+        self.regex: List[Tuple[_Word, re.Pattern]] = []
+        self._automaton = AhoCorasick()
+        self._combined: Optional[re.Pattern] = None
+        self._standalone: List[Tuple[_Word, re.Pattern]] = []
+
+        combined_parts = []
+        for fw in words:
+            entry = _Word(word=fw.word, replacement=fw.replacement or DEFAULT_REPLACEMENT)
+            if fw.match_type == ForbiddenWordType.EXACT.value:
+                self.exact.setdefault(fw.word.lower(), entry)
+            elif fw.match_type == ForbiddenWordType.CONTAINS.value:
+                self._automaton.add(_lower_preserving_length(fw.word))
+                self.contains.append(entry)
+            elif fw.match_type == ForbiddenWordType.REGEX.value:
+                try:
+                    pattern = re.compile(fw.word, re.IGNORECASE)
+                except re.error:
+                    # 잘못된 정규식은 무시
+                    continue
+                if pattern.groups or _STANDALONE_REGEX_RE.search(fw.word):
+                    self._standalone.append((entry, pattern))
+                else:
+                    combined_parts.append(f"(?P<w{len(self.regex)}>{fw.word})")
+                self.regex.append((entry, pattern))
+
+        self._automaton.build()
+        if combined_parts:
+            self._combined = re.compile("|".join(combined_parts), re.IGNORECASE)
+        self._combined_words = {
+            f"w{i}": entry for i, (entry, _) in enumerate(self.regex)
+        }
+
+    def _contains_matches(self, text: str) -> List[Tuple[int, int, int]]:
+        return list(self._automaton.iter_matches(_lower_preserving_length(text)))
+
+    def _replace_contains(self, text: str, matches: List[Tuple[int, int, int]]) -> str:
+        """겹치지 않는 일치 구간을 앞에서부터 가장 긴 것 우선으로 치환"""
+        if not matches:
+            return text
+        parts = []
+        last = 0
+        for start, end, index in sorted(matches, key=lambda m: (m[0], m[0] - m[1])):
+            if start < last:
+                continue
+            parts.append(text[last:start])
+            parts.append(self.contains[index].replacement)
+            last = end
+        parts.append(text[last:])
+        return "".join(parts)
+
+    def _filter_inline(self, text: str, filtered: str, matched: dict[str, None]) -> str:
+        """CONTAINS/REGEX 검사 (text 기준으로 매칭, filtered에 치환), 매칭된 금칙어는 matched에 추가"""
+        # CONTAINS: 원문 기준으로 매칭하고 필터링된 텍스트에 치환
+        if self.contains:
+            matches = self._contains_matches(text)
+            for _, _, index in matches:
+                matched[self.contains[index].word] = None
+            if filtered is not text:
+                matches = self._contains_matches(filtered)
+            filtered = self._replace_contains(filtered, matches)
+
+        # REGEX: 합친 패턴으로 1회 검사, 일치가 있을 때만 개별 패턴 확인
+        if self.regex:
+            found = self._combined is not None and self._combined.search(text) is not None
+            found = found or any(p.search(text) for _, p in self._standalone)
+            if found:
+                for entry, pattern in self.regex:
+                    if entry.word not in matched and pattern.search(text):
+                        matched[entry.word] = None
+                if self._combined is not None:
+                    filtered = self._combined.sub(
+                        lambda m: self._combined_words[m.lastgroup].replacement, filtered
+                    )
+                for entry, pattern in self._standalone:
+                    filtered = pattern.sub(lambda m, r=entry.replacement: r, filtered)
+
+        return filtered
+
+    def check(self, text: str) -> Tuple[bool, List[str], str]:
+        """
+        텍스트 검사
+
+        Returns:
+            (금칙어 포함 여부, 매칭된 금칙어 목록, 필터링된 텍스트)
+        """
+        matched: dict[str, None] = {}
+        filtered = text
+
+        # EXACT: 전체 텍스트 일치
+        exact = self.exact.get(text.lower())
+        if exact:
+            matched[exact.word] = None
+            filtered = exact.replacement
+
+        filtered = self._filter_inline(text, filtered, matched)
+        return bool(matched), list(matched), filtered
+
+    def check_html(self, markup: str) -> Tuple[bool, List[str], str]:
+        """
+        HTML 검사 (태그/속성은 검사하거나 바꾸지 않고 텍스트 노드만 처리)
+
+        - CONTAINS/REGEX: 텍스트 노드마다 엔티티를 풀어 검사하고, 치환된 노드만 다시 이스케이프
+          (태그를 사이에 둔 단어는 이어서 검사하지 않음)
+        - EXACT: 태그를 제거한 본문 전체와 비교, 일치하면 본문 전체를 대체 텍스트로
+
+        Returns:
+            (금칙어 포함 여부, 매칭된 금칙어 목록, 필터링된 HTML)
+        """
+        matched: dict[str, None] = {}
+
+        exact = self.exact.get(strip_html(markup).lower())
+        if exact:
+            matched[exact.word] = None
+
+        parts = _TAG_SPLIT_RE.split(markup)
+        for i in range(0, len(parts), 2):
+            if not parts[i]:
+                continue
+            text = html.unescape(parts[i])
+            filtered = self._filter_inline(text, text, matched)
+            if filtered != text:
+                parts[i] = html.escape(filtered, quote=False)
+
+        filtered_markup = html.escape(exact.replacement, quote=False) if exact else "".join(parts)
+        return bool(matched), list(matched), filtered_markup
+
+
+class _MatcherCache:
+    """대상(target)별 매처 캐시"""
+
+    # 다른 프로세스의 변경 확인 주기 (초)
+    FINGERPRINT_CHECK_INTERVAL = 5.0
+
+    def __init__(self):
+        self._matchers: dict[Optional[str], ForbiddenWordMatcher] = {}
+        self._fingerprint: Optional[tuple] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def _current_fingerprint(self, db: Session) -> tuple:
+        return tuple(
+            db.query(
+                func.count(ForbiddenWord.id),
+                func.max(ForbiddenWord.id),
+                func.max(ForbiddenWord.updated_at),
+            ).one()
+        )
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._matchers.clear()
+            self._fingerprint = None
+
+    def get(
+        self,
+        db: Session,
+        target: Optional[ForbiddenWordTarget] = None,
+        refresh: bool = False,
+    ) -> ForbiddenWordMatcher:
+        """대상에 맞는 매처 반환 (필요 시 생성, refresh이면 확인 주기와 무관하게 지문 확인)"""
+        now = time.monotonic()
+        if refresh or self._fingerprint is None or now - self._checked_at > self.FINGERPRINT_CHECK_INTERVAL:
+            fingerprint = self._current_fingerprint(db)
+            with self._lock:
+                if fingerprint != self._fingerprint:
+                    self._matchers.clear()
+                    self._fingerprint = fingerprint
+                self._checked_at = now
+
+        key = target.value if target else None
+        matcher = self._matchers.get(key)
+        if matcher is None:
+            query = db.query(ForbiddenWord).filter(ForbiddenWord.is_active == True)
+            if target:
+                query = query.filter(
+                    or_(
+                        ForbiddenWord.target == ForbiddenWordTarget.ALL.value,
+                        ForbiddenWord.target == target.value
+                    )
+                )
+            else:
+                query = query.filter(ForbiddenWord.target == ForbiddenWordTarget.ALL.value)
+            matcher = ForbiddenWordMatcher(query.order_by(ForbiddenWord.id).all())
+            with self._lock:
+                self._matchers[key] = matcher
+        return matcher
+
+
+_matcher_cache = _MatcherCache()
+
+
+def get_matcher(
+    db: Session,
+    target: Optional[ForbiddenWordTarget] = None,
+    refresh: bool = False,
+) -> ForbiddenWordMatcher:
+    """캐시된 금칙어 매처 반환"""
+    return _matcher_cache.get(db, target, refresh)
+
+
+def invalidate_matchers() -> None:
+    """금칙어 목록 변경 시 매처 캐시 무효화"""
+    _matcher_cache.invalidate()
@@ -3,7 +3,7 @@
 """
 
 import enum
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, JSON, Index
 from sqlalchemy.sql import func
 
 from core.database import Base
@@ -47,3 +47,54 @@ class ForbiddenWord(Base):
     # 타임스탬프
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+
+class ModerationStatus(str, enum.Enum):
+    """재검사 진행 상태"""
+    PENDING = "pending"       # 재검사 대기
+    RUNNING = "running"       # 진행 중
+    COMPLETED = "completed"   # 완료
+
+
+class ModerationMatch(Base):
+    """기존 게시글/댓글 재검사 결과 (금칙어가 발견된 항목)"""
+
+    __tablename__ = "moderation_matches"
+    __table_args__ = (
+        Index("ix_moderation_matches_content", "content_type", "content_id"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+
+    # 검사 대상
+    content_type = Column(String(20), nullable=False)  # post, comment
+    content_id = Column(Integer, nullable=False)
+    field = Column(String(20), nullable=False)  # title, content
+
+    # 결과
+    matched_words = Column(JSON, nullable=False)  # 매칭된 금칙어 목록
+
+    scanned_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
+class ModerationCheckpoint(Base):
+    """재검사 진행 위치 (대상별 1행, 재시작 시 이어서 진행)"""
+
+    __tablename__ = "moderation_checkpoints"
+
+    content_type = Column(String(20), primary_key=True)  # post, comment
+
+    # 진행 상태
+    status = Column(String(20), default=ModerationStatus.PENDING.value)
+    generation = Column(Integer, default=0)  # 재검사 요청마다 증가 (진행 중인 검사 중단 판단)
+    last_id = Column(Integer, default=0)  # 마지막으로 처리한 ID
+    scanned_count = Column(Integer, default=0)
+    matched_count = Column(Integer, default=0)
+
+    # 여러 프로세스 중 하나만 진행하도록 하는 임대 만료 시각
+    locked_until = Column(DateTime(timezone=True), nullable=True)
+
+    # 타임스탬프
+    requested_at = Column(DateTime(timezone=True), nullable=True)
+    completed_at = Column(DateTime(timezone=True), nullable=True)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
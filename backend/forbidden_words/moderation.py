@@ -0,0 +1,302 @@
+"""
+기존 게시글/댓글 금칙어 재검사
+
+금칙어 목록이 바뀌면 request_rescan()으로 재검사를 요청하고,
+백그라운드 작업이 posts/comments를 ID 순 청크로 나누어 검사해 결과를 moderation_matches에 기록한다.
+- 청크마다 결과와 진행 위치(moderation_checkpoints.last_id)를 같은 트랜잭션으로 커밋하므로
+  재시작하면 마지막 청크 다음부터 이어서 진행한다
+- 청크 사이에 잠시 쉬고, 1회 실행 시간을 제한해 서비스 트래픽을 방해하지 않는다
+- 진행 중에 다시 요청되면(generation 증가) 현재 검사를 멈추고 처음부터 다시 검사한다
+- 여러 프로세스에서 실행해도 임대(locked_until)를 얻은 하나만 진행한다
+"""
+
+import time
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+
+from sqlalchemy import delete, insert, or_, update
+from sqlalchemy.orm import Session
+
+from core.config import settings
+from core.database import SessionLocal
+from .matcher import get_matcher
+from .models import ForbiddenWordTarget, ModerationCheckpoint, ModerationMatch, ModerationStatus
+
+POST = "post"
+COMMENT = "comment"
+CONTENT_TYPES = (POST, COMMENT)
+
+# 임대 시간 (초, 청크를 처리할 때마다 연장)
+LEASE_SECONDS = 120
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _new_checkpoint(content_type: str) -> ModerationCheckpoint:
+    return ModerationCheckpoint(
+        content_type=content_type,
+        status=ModerationStatus.PENDING.value,
+        generation=0,
+        last_id=0,
+        scanned_count=0,
+        matched_count=0,
+        requested_at=_now(),
+    )
+
+
+def _ensure_checkpoints(db: Session) -> None:
+    """대상별 체크포인트가 없으면 생성 (최초 실행 시 전체 검사)"""
+    existing = {row.content_type for row in db.query(ModerationCheckpoint.content_type).all()}
+    missing = [content_type for content_type in CONTENT_TYPES if content_type not in existing]
+    if missing:
+        db.add_all(_new_checkpoint(content_type) for content_type in missing)
+        db.flush()
+
+
+def init_checkpoints() -> None:
+    """시작 시 체크포인트 생성 (자체 세션 사용)"""
+    db = SessionLocal()
+    try:
+        _ensure_checkpoints(db)
+        db.commit()
+    finally:
+        db.close()
+
+
+def request_rescan(db: Session) -> None:
+    """전체 재검사 요청 (커밋은 호출자가 수행)"""
+    _ensure_checkpoints(db)
+    db.execute(
+        update(ModerationCheckpoint).values(
+            status=ModerationStatus.PENDING.value,
+            generation=ModerationCheckpoint.generation + 1,
+            last_id=0,
+            scanned_count=0,
+            matched_count=0,
+            requested_at=_now(),
+            completed_at=None,
+        ),
+        execution_options={"synchronize_session": False},
+    )
+
+
+def _fetch_chunk(db: Session, content_type: str, last_id: int, chunk_size: int) -> List[tuple]:
+    """(ID, [(필드, 텍스트, 대상, HTML 여부), ...]) 목록"""
+    from boards.models import Comment, Post, PostStatus
+
+    if content_type == POST:
+        rows = (
+            db.query(Post.id, Post.title, Post.content)
+            .filter(Post.id > last_id, Post.status != PostStatus.DELETED.value)
+            .order_by(Post.id)
+            .limit(chunk_size)
+            .all()
+        )
+        return [
+            (post_id, [
+                ("title", title, ForbiddenWordTarget.POST_TITLE, False),
+                # 본문은 HTML -> 태그/속성 안의 일치는 제외 (작성 시 검사와 같은 기준)
+                ("content", content, ForbiddenWordTarget.POST_CONTENT, True),
+            ])
+            for post_id, title, content in rows
+        ]
+
+    rows = (
+        db.query(Comment.id, Comment.content)
+        .filter(Comment.id > last_id, Comment.is_deleted == False)
+        .order_by(Comment.id)
+        .limit(chunk_size)
+        .all()
+    )
+    return [(comment_id, [("content", content, ForbiddenWordTarget.COMMENT, False)]) for comment_id, content in rows]
+
+
+def _claim(db: Session, content_type: str) -> Optional[ModerationCheckpoint]:
+    """진행할 체크포인트의 임대 획득 (다른 프로세스가 진행 중이면 None)"""
+    now = _now()
+    claimed = db.execute(
+        update(ModerationCheckpoint)
+        .where(
+            ModerationCheckpoint.content_type == content_type,
+            ModerationCheckpoint.status != ModerationStatus.COMPLETED.value,
+            or_(ModerationCheckpoint.locked_until.is_(None), ModerationCheckpoint.locked_until < now),
+        )
+        .values(
+            status=ModerationStatus.RUNNING.value,
+            locked_until=now + timedelta(seconds=LEASE_SECONDS),
+        ),
+        execution_options={"synchronize_session": False},
+    ).rowcount
+    db.commit()
+    if not claimed:
+        return None
+    return db.get(ModerationCheckpoint, content_type, populate_existing=True)
+
+
+def scan_content(
+    db: Session,
+    content_type: str,
+    chunk_size: int,
+    throttle: float = 0.0,
+    deadline: Optional[float] = None,
+) -> int:
+    """
+    한 대상의 재검사 진행 (deadline까지 또는 끝날 때까지)
+
+    Returns:
+        이번 실행에서 검사한 행 수
+    """
+    checkpoint = _claim(db, content_type)
+    if checkpoint is None:
+        return 0
+
+    generation = checkpoint.generation
+    last_id = checkpoint.last_id or 0
+    scanned = 0
+
+    while True:
+        chunk = _fetch_chunk(db, content_type, last_id, chunk_size)
+        done = len(chunk) < chunk_size
+        chunk_last_id = chunk[-1][0] if chunk else last_id
+
+        # 다른 프로세스의 금칙어 변경도 바로 반영되도록 청크마다 목록 버전 확인
+        matchers = {}
+        matches = []
+        for content_id, fields in chunk:
+            for field, text, target, is_html in fields:
+                if not text:
+                    continue
+                if target not in matchers:
+                    matchers[target] = get_matcher(db, target, refresh=True)
+                matcher = matchers[target]
+                check = matcher.check_html if is_html else matcher.check
+                contains_forbidden, matched_words, _ = check(text)
+                if contains_forbidden:
+                    matches.append({
+                        "content_type": content_type,
+                        "content_id": content_id,
+                        "field": field,
+                        "matched_words": matched_words,
+                    })
+
+        # 이전 결과 교체 (삭제된 행의 결과도 함께 정리)
+        match_table = ModerationMatch.__table__
+        range_filter = [match_table.c.content_type == content_type, match_table.c.content_id > last_id]
+        if not done:
+            range_filter.append(match_table.c.content_id <= chunk_last_id)
+        db.execute(delete(match_table).where(*range_filter))
+        if matches:
+            db.execute(insert(match_table), matches)
+
+        values = {
+            "last_id": chunk_last_id,
+            "scanned_count": ModerationCheckpoint.scanned_count + len(chunk),
+            "matched_count": ModerationCheckpoint.matched_count + len(matches),
+            "locked_until": None if done else _now() + timedelta(seconds=LEASE_SECONDS),
+        }
+        if done:
+            values["status"] = ModerationStatus.COMPLETED.value
+            values["completed_at"] = _now()
+
+        advanced = db.execute(
+            update(ModerationCheckpoint)
+            .where(
+                ModerationCheckpoint.content_type == content_type,
+                ModerationCheckpoint.generation == generation,
+            )
+            .values(**values),
+            execution_options={"synchronize_session": False},
+        ).rowcount
+        if not advanced:
+            # 진행 중에 재검사가 다시 요청됨 -> 이 청크는 버리고 다음 실행에서 처음부터
+            db.rollback()
+            db.execute(
+                update(ModerationCheckpoint)
+                .where(ModerationCheckpoint.content_type == content_type)
+                .values(locked_until=None),
+                execution_options={"synchronize_session": False},
+            )
+            db.commit()
+            return scanned
+
+        db.commit()
+        scanned += len(chunk)
+        last_id = chunk_last_id
+
+        if done:
+            return scanned
+
+        if deadline is not None and time.monotonic() >= deadline:
+            # 남은 분량은 다음 실행에서 이어서 (임대 해제)
+            db.execute(
+                update(ModerationCheckpoint)
+                .where(
+                    ModerationCheckpoint.content_type == content_type,
+                    ModerationCheckpoint.generation == generation,
+                )
+                .values(locked_until=None),
+                execution_options={"synchronize_session": False},
+            )
+            db.commit()
+            return scanned
+
+        if throttle > 0:
+            time.sleep(throttle)
+
+
+def run_moderation_scan(
+    db: Session,
+    chunk_size: Optional[int] = None,
+    throttle: Optional[float] = None,
+    max_seconds: Optional[float] = None,
+) -> int:
+    """
+    대기 중인 모든 대상 재검사 진행
+
+    Returns:
+        이번 실행에서 검사한 행 수
+    """
+    chunk_size = chunk_size or settings.MODERATION_SCAN_CHUNK_SIZE
+    throttle = settings.MODERATION_SCAN_THROTTLE if throttle is None else throttle
+    max_seconds = settings.MODERATION_SCAN_MAX_SECONDS if max_seconds is None else max_seconds
+    deadline = time.monotonic() + max_seconds if max_seconds > 0 else None
+
+    _ensure_checkpoints(db)
+    db.commit()
+
+    scanned = 0
+    for content_type in CONTENT_TYPES:
+        scanned += scan_content(db, content_type, chunk_size, throttle, deadline)
+        if deadline is not None and time.monotonic() >= deadline:
+            break
+    return scanned
+
+
+def get_scan_status(db: Session) -> List[ModerationCheckpoint]:
+    """
+    대상별 재검사 진행 상태 (조회만 함)
+
+    아직 체크포인트가 없는 대상은 저장하지 않은 대기 상태로 채운다
+    (체크포인트는 시작 시, 재검사 요청 시, 백그라운드 작업에서 생성).
+    """
+    checkpoints = {
+        checkpoint.content_type: checkpoint
+        for checkpoint in db.query(ModerationCheckpoint).all()
+    }
+    for content_type in CONTENT_TYPES:
+        if content_type not in checkpoints:
+            checkpoints[content_type] = _new_checkpoint(content_type)
+    return [checkpoints[content_type] for content_type in sorted(checkpoints)]
+
+
+def run_moderation_job() -> None:
+    """백그라운드 작업용 진입점 (자체 세션 사용)"""
+    db = SessionLocal()
+    try:
+        scanned = run_moderation_scan(db)
+        if scanned:
+            print(f"[Moderation] {scanned}건 재검사")
+    finally:
+        db.close()
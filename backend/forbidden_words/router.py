@@ -2,9 +2,12 @@
 금칙어 라우터 (관리자 전용)
 """
 
+import json
+
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from typing import Optional
+from typing import List, Literal, Optional
 
 from core.database import get_db
 from core.security import get_current_admin
@@ -16,7 +19,10 @@ from .schemas import (
     ForbiddenWordResponse,
     ForbiddenWordListResponse,
     CheckTextRequest,
-    CheckTextResponse
+    CheckTextResponse,
+    CheckTextBatchRequest,
+    ModerationCheckpointResponse,
+    ModerationMatchListResponse
 )
 from .service import ForbiddenWordService
 
@@ -57,6 +63,77 @@ async def get_forbidden_words(
     }
 
 
+@router.post("/check/batch")
+async def check_text_batch(
+    data: CheckTextBatchRequest,
+    db: Session = Depends(get_db),
+    current_admin: dict = Depends(get_current_admin)
+):
+    """
+    텍스트 일괄 금칙어 검사
+
+    결과를 NDJSON(한 줄에 항목 하나)으로 스트리밍한다.
+    각 줄: {"index", "id", "contains_forbidden", "matched_words", "filtered_text"}
+    """
+    service = ForbiddenWordService(db)
+    results = service.check_batch(data)
+
+    def generate():
+        for result in results:
+            yield json.dumps(result, ensure_ascii=False) + "\n"
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
+@router.get("/moderation/status", response_model=List[ModerationCheckpointResponse])
+async def get_moderation_status(
+    db: Session = Depends(get_db),
+    current_admin: dict = Depends(get_current_admin)
+):
+    """기존 게시글/댓글 재검사 진행 상태"""
+    service = ForbiddenWordService(db)
+    return service.get_moderation_status()
+
+
+@router.post("/moderation/rescan", response_model=List[ModerationCheckpointResponse])
+async def request_moderation_rescan(
+    db: Session = Depends(get_db),
+    current_admin: dict = Depends(get_current_admin)
+):
+    """기존 게시글/댓글 전체 재검사 요청 (백그라운드 작업이 처리)"""
+    service = ForbiddenWordService(db)
+    return service.request_rescan()
+
+
+@router.get("/moderation/matches", response_model=ModerationMatchListResponse)
+async def get_moderation_matches(
+    page: int = Query(1, ge=1),
+    page_size: int = Query(20, ge=1, le=100),
+    content_type: Optional[Literal["post", "comment"]] = None,
+    db: Session = Depends(get_db),
+    current_admin: dict = Depends(get_current_admin)
+):
+    """재검사에서 금칙어가 발견된 게시글/댓글 목록"""
+    service = ForbiddenWordService(db)
+    skip = (page - 1) * page_size
+
+    items, total = service.get_moderation_matches(
+        skip=skip,
+        limit=page_size,
+        content_type=content_type
+    )
+
+    return {
+        "data": items,
+        "meta": {
+            "page": page,
+            "page_size": page_size,
+            "total": total,
+            "total_pages": (total + page_size - 1) // page_size
+        }
+    }
+
+
 @router.get("/{word_id}", response_model=ForbiddenWordResponse)
 async def get_forbidden_word(
     word_id: int,
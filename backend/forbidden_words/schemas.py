@@ -61,3 +61,53 @@ class CheckTextResponse(BaseModel):
     contains_forbidden: bool
     matched_words: List[str]
     filtered_text: Optional[str] = None
+
+
+class CheckTextBatchItem(BaseModel):
+    """일괄 검사 항목"""
+    id: Optional[str] = Field(None, max_length=100, description="결과 매칭용 식별자 (예: post:123)")
+    text: str
+    target: Optional[ForbiddenWordTarget] = None
+
+
+class CheckTextBatchRequest(BaseModel):
+    """텍스트 일괄 검사 요청 스키마"""
+    items: List[CheckTextBatchItem] = Field(..., min_length=1, max_length=10000)
+    target: Optional[ForbiddenWordTarget] = Field(None, description="항목에 대상이 없을 때 사용할 기본 대상")
+    only_matched: bool = Field(False, description="금칙어가 포함된 항목만 반환")
+    include_filtered_text: bool = True
+
+
+class ModerationCheckpointResponse(BaseModel):
+    """재검사 진행 상태 응답 스키마"""
+    content_type: str
+    status: str
+    generation: int
+    last_id: int
+    scanned_count: int
+    matched_count: int
+    requested_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
+class ModerationMatchResponse(BaseModel):
+    """재검사 결과 응답 스키마"""
+    id: int
+    content_type: str
+    content_id: int
+    field: str
+    matched_words: List[str]
+    scanned_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
+class ModerationMatchListResponse(BaseModel):
+    """재검사 결과 목록 응답 스키마"""
+    data: List[ModerationMatchResponse]
+    meta: dict
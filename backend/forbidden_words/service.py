@@ -2,13 +2,14 @@
 금칙어 서비스
 """
 
-import re
-from typing import Optional, List, Tuple
+from typing import Iterator, Optional, List, Tuple
 from sqlalchemy.orm import Session
 from sqlalchemy import or_
 
-from .models import ForbiddenWord, ForbiddenWordType, ForbiddenWordTarget
-from .schemas import ForbiddenWordCreate, ForbiddenWordUpdate
+from .matcher import get_matcher, invalidate_matchers
+from .moderation import request_rescan, get_scan_status
+from .models import ForbiddenWord, ForbiddenWordTarget, ModerationCheckpoint, ModerationMatch
+from .schemas import ForbiddenWordCreate, ForbiddenWordUpdate, CheckTextBatchRequest
 
 
 class ForbiddenWordService:
@@ -62,8 +63,11 @@ class ForbiddenWordService:
             reason=data.reason
         )
         self.db.add(forbidden_word)
+        if forbidden_word.is_active:
+            request_rescan(self.db)
         self.db.commit()
         self.db.refresh(forbidden_word)
+        invalidate_matchers()
         return forbidden_word
 
     def update(self, word_id: int, data: ForbiddenWordUpdate) -> Optional[ForbiddenWord]:
@@ -83,8 +87,12 @@ class ForbiddenWordService:
         for key, value in update_data.items():
             setattr(forbidden_word, key, value)
 
+        # 사유(reason)만 바뀐 경우는 검사 결과에 영향 없음
+        if set(update_data) - {"reason"}:
+            request_rescan(self.db)
         self.db.commit()
         self.db.refresh(forbidden_word)
+        invalidate_matchers()
         return forbidden_word
 
     def delete(self, word_id: int) -> bool:
@@ -93,8 +101,11 @@ class ForbiddenWordService:
         if not forbidden_word:
             return False
 
+        if forbidden_word.is_active:
+            request_rescan(self.db)
         self.db.delete(forbidden_word)
         self.db.commit()
+        invalidate_matchers()
         return True
 
     def check_text(
@@ -108,56 +119,48 @@ class ForbiddenWordService:
         Returns:
             (금칙어 포함 여부, 매칭된 금칙어 목록, 필터링된 텍스트)
         """
-        # 활성화된 금칙어 조회
-        query = self.db.query(ForbiddenWord).filter(ForbiddenWord.is_active == True)
+        # 금칙어 목록 버전별로 컴파일해 둔 매처 재사용
+        return get_matcher(self.db, target).check(text)
 
-        if target:
-            query = query.filter(
-                or_(
-                    ForbiddenWord.target == ForbiddenWordTarget.ALL.value,
-                    ForbiddenWord.target == target.value
-                )
-            )
-        else:
-            query = query.filter(ForbiddenWord.target == ForbiddenWordTarget.ALL.value)
-
-        forbidden_words = query.all()
-
-        matched_words = []
-        filtered_text = text
-
-        for fw in forbidden_words:
-            is_matched = False
-            replacement = fw.replacement or "***"
-
-            if fw.match_type == ForbiddenWordType.EXACT.value:
-                # 정확히 일치
-                if fw.word.lower() == text.lower():
-                    is_matched = True
-                    filtered_text = replacement
-
-            elif fw.match_type == ForbiddenWordType.CONTAINS.value:
-                # 포함
-                pattern = re.compile(re.escape(fw.word), re.IGNORECASE)
-                if pattern.search(text):
-                    is_matched = True
-                    filtered_text = pattern.sub(replacement, filtered_text)
-
-            elif fw.match_type == ForbiddenWordType.REGEX.value:
-                # 정규식
-                try:
-                    pattern = re.compile(fw.word, re.IGNORECASE)
-                    if pattern.search(text):
-                        is_matched = True
-                        filtered_text = pattern.sub(replacement, filtered_text)
-                except re.error:
-                    # 잘못된 정규식은 무시
-                    pass
-
-            if is_matched:
-                matched_words.append(fw.word)
-
-        return bool(matched_words), matched_words, filtered_text
+    def check_html(
+        self,
+        markup: str,
+        target: Optional[ForbiddenWordTarget] = None
+    ) -> Tuple[bool, List[str], str]:
+        """
+        HTML 본문에서 금칙어 검사 (태그/속성 제외, 텍스트 노드만 검사/치환)
+
+        Returns:
+            (금칙어 포함 여부, 매칭된 금칙어 목록, 필터링된 HTML)
+        """
+        return get_matcher(self.db, target).check_html(markup)
+
+    def check_batch(self, data: CheckTextBatchRequest) -> Iterator[dict]:
+        """
+        텍스트 일괄 검사
+
+        필요한 대상별 매처를 먼저 준비한 뒤 결과를 한 건씩 생성한다.
+        반환된 이터레이터는 DB 세션을 사용하지 않으므로 스트리밍 응답에서 소비해도 된다.
+        """
+        targets = {item.target or data.target for item in data.items}
+        matchers = {target: get_matcher(self.db, target) for target in targets}
+        return self._iter_batch_results(data, matchers)
+
+    @staticmethod
+    def _iter_batch_results(data: CheckTextBatchRequest, matchers: dict) -> Iterator[dict]:
+        for index, item in enumerate(data.items):
+            contains_forbidden, matched_words, filtered_text = matchers[item.target or data.target].check(item.text)
+            if data.only_matched and not contains_forbidden:
+                continue
+            result = {
+                "index": index,
+                "id": item.id,
+                "contains_forbidden": contains_forbidden,
+                "matched_words": matched_words,
+            }
+            if data.include_filtered_text:
+                result["filtered_text"] = filtered_text
+            yield result
 
     def get_active_words(self, target: Optional[ForbiddenWordTarget] = None) -> List[ForbiddenWord]:
         """활성화된 금칙어 목록 조회"""
@@ -172,3 +175,30 @@ class ForbiddenWordService:
             )
 
         return query.all()
+
+    def get_moderation_matches(
+        self,
+        skip: int = 0,
+        limit: int = 20,
+        content_type: Optional[str] = None
+    ) -> Tuple[List[ModerationMatch], int]:
+        """재검사 결과 목록 조회"""
+        query = self.db.query(ModerationMatch)
+
+        if content_type:
+            query = query.filter(ModerationMatch.content_type == content_type)
+
+        total = query.count()
+        items = query.order_by(ModerationMatch.id.desc()).offset(skip).limit(limit).all()
+
+        return items, total
+
+    def get_moderation_status(self) -> List[ModerationCheckpoint]:
+        """재검사 진행 상태 조회"""
+        return get_scan_status(self.db)
+
+    def request_rescan(self) -> List[ModerationCheckpoint]:
+        """기존 게시글/댓글 전체 재검사 요청"""
+        request_rescan(self.db)
+        self.db.commit()
+        return get_scan_status(self.db)
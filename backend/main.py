@@ -11,6 +11,7 @@ from fastapi.staticfiles import StaticFiles
 
 from core.config import settings
 from core.database import init_db
+from core.background import background_tasks
 from core.security_guard import SecurityConfig, setup_security
 
 # 라우터 임포트
@@ -26,6 +27,8 @@ from payments.public_router import router as public_payments_router
 from points.router import router as points_router
 from banners.router import router as banners_router, public_router as public_banners_router
 from visitors.router import router as visitors_router
+from visitors.public_router import router as public_visitors_router
+from visitors.middleware import VisitorTrackingMiddleware
 from categories.router import router as categories_router
 from wishlist.router import router as wishlist_router
 from boards.router import router as boards_router
@@ -48,9 +51,86 @@ async def lifespan(app: FastAPI):
     (upload_dir / "attachments").mkdir(parents=True, exist_ok=True)
     print("Upload directories created")
 
+    # 백그라운드 주기 작업 시작
+    from products.counters import run_counter_reconciliation
+    background_tasks.register(
+        "product_counters",
+        settings.PRODUCT_COUNTER_RECONCILE_INTERVAL,
+        run_counter_reconciliation,
+    )
+
+    from boards.config import boards_plugin_config
+    from boards.view_counter import flush_view_counts
+    background_tasks.register(
+        "post_view_counts",
+        boards_plugin_config.view_count_flush_interval,
+        flush_view_counts,
+        run_on_shutdown=True,  # 종료 시 남은 조회수 반영
+    )
+
+    from forbidden_words.moderation import init_checkpoints, run_moderation_job
+    init_checkpoints()  # 재검사 상태 조회가 쓰기 없이 동작하도록 미리 생성
+    background_tasks.register(
+        "forbidden_word_rescan",
+        settings.MODERATION_SCAN_INTERVAL,
+        run_moderation_job,
+    )
+
+    from visitors.rollup import run_rollup_job
+    background_tasks.register(
+        "daily_stats_rollup",
+        settings.DAILY_STATS_ROLLUP_INTERVAL,
+        run_rollup_job,
+    )
+
+    from visitors.partitions import run_partition_maintenance_job
+    background_tasks.register(
+        "visitor_partitions",
+        settings.VISITOR_PARTITION_MAINTENANCE_INTERVAL,
+        run_partition_maintenance_job,
+    )
+
+    from points.expiry import run_point_expiry_job
+    background_tasks.register(
+        "point_expiry",
+        settings.POINT_EXPIRY_INTERVAL,
+        run_point_expiry_job,
+    )
+
+    from visitors.tracker import FLUSH_TASK_NAME, flush_visitor_events
+    background_tasks.register(
+        FLUSH_TASK_NAME,
+        settings.VISITOR_FLUSH_INTERVAL_MS / 1000,
+        flush_visitor_events,
+        run_on_shutdown=True,  # 종료 시 남은 방문 기록 저장
+    )
+
+    from products.search import INDEX_TASK_NAME as PRODUCT_INDEX_TASK_NAME, refresh_product_search_index_job
+    background_tasks.register(
+        PRODUCT_INDEX_TASK_NAME,
+        settings.SEARCH_INDEX_REFRESH_INTERVAL,
+        refresh_product_search_index_job,  # 검색이 있었을 때만 재생성
+    )
+
+    from boards.search import INDEX_TASK_NAME as POST_INDEX_TASK_NAME, refresh_post_search_index_job
+    background_tasks.register(
+        POST_INDEX_TASK_NAME,
+        settings.SEARCH_INDEX_REFRESH_INTERVAL,
+        refresh_post_search_index_job,  # 검색이 있었을 때만 재생성
+    )
+
+    from visitors.dashboard import SNAPSHOT_TASK_NAME, refresh_dashboard_snapshot_job
+    background_tasks.register(
+        SNAPSHOT_TASK_NAME,
+        settings.DASHBOARD_SNAPSHOT_TTL,
+        refresh_dashboard_snapshot_job,  # 오래된 스냅샷 조회가 있을 때만 갱신
+    )
+    background_tasks.start()
+
     yield
     # 종료 시 정리 작업
     print("Shutting down...")
+    await background_tasks.stop()
 
 
 app = FastAPI(
@@ -83,6 +163,10 @@ security_config = SecurityConfig(
 )
 setup_security(app, security_config)
 
+# 방문 기록 미들웨어 (설정한 경로의 GET 요청만 기록)
+if settings.VISITOR_TRACKING_ENABLED and settings.VISITOR_TRACK_PATHS:
+    app.add_middleware(VisitorTrackingMiddleware, paths=settings.VISITOR_TRACK_PATHS)
+
 # API 라우터 등록
 app.include_router(auth_router, prefix="/api")
 app.include_router(user_auth_router, prefix="/api")  # 일반 회원 인증
@@ -97,6 +181,7 @@ app.include_router(points_router, prefix="/api")
 app.include_router(banners_router, prefix="/api")
 app.include_router(public_banners_router, prefix="/api")  # 공개 배너 API
 app.include_router(visitors_router, prefix="/api")
+app.include_router(public_visitors_router, prefix="/api")  # 방문 기록 API
 app.include_router(categories_router, prefix="/api")
 app.include_router(wishlist_router, prefix="/api")  # 관심 상품
 app.include_router(boards_router, prefix="/api")  # 게시판 관리
@@ -2,7 +2,7 @@
 결제 모델
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, Numeric, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, DateTime, Numeric, ForeignKey, Text, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 import enum
@@ -61,12 +61,18 @@ class Payment(Base):
     refund_reason = Column(Text, nullable=True)
 
     # 타임스탬프
-    paid_at = Column(DateTime(timezone=True), nullable=True)
+    paid_at = Column(DateTime(timezone=True), nullable=True, index=True)  # 일별 매출 통계
     cancelled_at = Column(DateTime(timezone=True), nullable=True)
     refunded_at = Column(DateTime(timezone=True), nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(
-        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(),
+        index=True,  # 통계 집계 워터마크 (변경된 결제 조회)
+    )
+
+    __table_args__ = (
+        # 커서 페이지네이션 (created_at, id) 키셋 인덱스
+        Index("ix_payments_created_at_id", "created_at", "id"),
     )
 
     # 관계
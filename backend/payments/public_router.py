@@ -13,6 +13,8 @@ from core.security import get_current_user_from_cookie_optional
 from common.responses import SuccessResponse
 from .models import Payment, PaymentStatus
 from products.models import Product, ProductSlot, SlotStatus
+from products.counters import adjust_product_counters
+from products.service import invalidate_product_cache
 
 router = APIRouter(prefix="/public/payments", tags=["결제 (공개)"])
 
@@ -133,15 +135,11 @@ async def complete_purchase(
         slot.paid_price = product.slot_price or product.starting_price
         slot.purchased_at = now
 
-    # 상품의 판매된 슬롯 수 증가
-    product.sold_slot_count = (product.sold_slot_count or 0) + len(slots)
-    product.bid_count = (product.bid_count or 0) + 1
-
-    # 모든 슬롯이 판매되면 상품 상태를 sold로 변경
-    if product.sold_slot_count >= product.slot_count:
-        product.status = "sold"
+    # 상품의 판매된 슬롯 수/참여 수 증가 (원자적 UPDATE, 모든 슬롯 판매 시 sold로 변경)
+    adjust_product_counters(db, request.product_id, sold_delta=len(slots), bid_delta=1)
 
     db.commit()
+    invalidate_product_cache(request.product_id)
 
     return SuccessResponse(
         data=SlotPurchaseResponse(
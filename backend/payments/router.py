@@ -9,15 +9,22 @@ from datetime import datetime
 
 from core.database import get_db
 from core.security import get_current_admin
-from common.responses import SuccessResponse, PaginatedResponse, PaginationMeta
-from common.pagination import PaginationParams
+from common.responses import (
+    SuccessResponse,
+    PaginatedResponse,
+    PaginationMeta,
+    CursorPaginatedResponse,
+    CursorPaginationMeta,
+)
+from common.export import ExportFormat, export_response
+from common.pagination import PaginationParams, CursorParams
 from .schemas import (
     PaymentResponse,
     PaymentListResponse,
     PaymentSearchParams,
     RefundRequest,
 )
-from .service import PaymentService
+from .service import EXPORT_COLUMNS, PaymentService
 
 router = APIRouter(prefix="/payments", tags=["결제 관리"])
 
@@ -64,6 +71,87 @@ async def get_payment_list(
     )
 
 
+@router.get("/cursor", response_model=CursorPaginatedResponse[PaymentListResponse])
+async def get_payment_cursor_list(
+    cursor: Optional[str] = None,
+    page_size: int = Query(20, ge=1, le=100),
+    include_total: bool = False,
+    approximate_total: bool = True,
+    user_id: Optional[int] = None,
+    order_id: Optional[str] = None,
+    status: Optional[str] = None,
+    method: Optional[str] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    current_admin: dict = Depends(get_current_admin),
+    db: Session = Depends(get_db),
+):
+    """
+    결제 목록 조회 (커서 기반)
+    """
+    service = PaymentService(db)
+    params = CursorParams(
+        cursor=cursor,
+        page_size=page_size,
+        include_total=include_total,
+        approximate_total=approximate_total,
+    )
+    search = PaymentSearchParams(
+        user_id=user_id,
+        order_id=order_id,
+        status=status,
+        method=method,
+        start_date=start_date,
+        end_date=end_date,
+    )
+
+    result = service.get_payment_cursor_list(params, search)
+
+    return CursorPaginatedResponse(
+        data=result.items,
+        meta=CursorPaginationMeta(
+            page_size=result.page_size,
+            next_cursor=result.next_cursor,
+            has_next=result.has_next,
+            total_count=result.total_count,
+            total_is_approximate=result.total_is_approximate,
+        ),
+    )
+
+
+@router.get("/export")
+async def export_payments(
+    format: ExportFormat = "csv",
+    gzip: bool = False,
+    user_id: Optional[int] = None,
+    order_id: Optional[str] = None,
+    status: Optional[str] = None,
+    method: Optional[str] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    current_admin: dict = Depends(get_current_admin),
+):
+    """
+    결제 목록 내보내기 (CSV/NDJSON 스트리밍, 목록과 같은 검색 조건)
+    """
+    search = PaymentSearchParams(
+        user_id=user_id,
+        order_id=order_id,
+        status=status,
+        method=method,
+        start_date=start_date,
+        end_date=end_date,
+    )
+
+    return export_response(
+        lambda db: PaymentService(db).iter_export_rows(search),
+        columns=EXPORT_COLUMNS,
+        filename="payments",
+        format=format,
+        gzip=gzip,
+    )
+
+
 @router.get("/stats", response_model=SuccessResponse[dict])
 async def get_payment_stats(
     current_admin: dict = Depends(get_current_admin),
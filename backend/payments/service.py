@@ -5,10 +5,10 @@
 from typing import Optional
 from datetime import datetime, timezone
 from sqlalchemy.orm import Session
-from sqlalchemy import func as sql_func
 
 from common.errors import NotFoundException, BadRequestException
-from common.pagination import Pagination, PaginationParams
+from common.export import EXPORT_BATCH_SIZE
+from common.pagination import Pagination, PaginationParams, CursorPagination, CursorParams
 from .models import Payment, PaymentStatus
 from .schemas import (
     PaymentResponse,
@@ -17,6 +17,9 @@ from .schemas import (
     RefundRequest,
 )
 
+# 내보내기 컬럼 (목록 응답과 같은 필드)
+EXPORT_COLUMNS = list(PaymentListResponse.model_fields)
+
 
 class PaymentService:
     """결제 서비스"""
@@ -44,22 +47,7 @@ class PaymentService:
         search: Optional[PaymentSearchParams] = None,
     ) -> Pagination[PaymentListResponse]:
         """결제 목록 조회"""
-        query = self.db.query(Payment)
-
-        # 검색 조건 적용
-        if search:
-            if search.user_id:
-                query = query.filter(Payment.user_id == search.user_id)
-            if search.order_id:
-                query = query.filter(Payment.order_id.ilike(f"%{search.order_id}%"))
-            if search.status:
-                query = query.filter(Payment.status == search.status)
-            if search.method:
-                query = query.filter(Payment.method == search.method)
-            if search.start_date:
-                query = query.filter(Payment.created_at >= search.start_date)
-            if search.end_date:
-                query = query.filter(Payment.created_at <= search.end_date)
+        query = self._apply_search(self.db.query(Payment), search)
 
         # 정렬 (최신순)
         query = query.order_by(Payment.created_at.desc())
@@ -74,6 +62,49 @@ class PaymentService:
             page_size=result.page_size,
         )
 
+    def get_payment_cursor_list(
+        self,
+        params: CursorParams,
+        search: Optional[PaymentSearchParams] = None,
+    ) -> CursorPagination[PaymentListResponse]:
+        """결제 목록 조회 (커서 기반, 최신순)"""
+        query = self._apply_search(self.db.query(Payment), search)
+
+        result = CursorPagination.from_query(
+            query, params, sort_column=Payment.created_at, id_column=Payment.id
+        )
+        result.items = [PaymentListResponse.model_validate(p) for p in result.items]
+        return result
+
+    def iter_export_rows(
+        self,
+        search: Optional[PaymentSearchParams] = None,
+        batch_size: int = EXPORT_BATCH_SIZE,
+    ):
+        """내보내기용 결제 행 (EXPORT_COLUMNS 순서, 최신순, 서버 측 커서로 배치 단위 조회)"""
+        columns = [getattr(Payment, name) for name in EXPORT_COLUMNS]
+        query = self._apply_search(self.db.query(*columns), search)
+        return query.order_by(Payment.created_at.desc(), Payment.id.desc()).yield_per(batch_size)
+
+    def _apply_search(self, query, search: Optional[PaymentSearchParams]):
+        """검색 조건 적용"""
+        if not search:
+            return query
+
+        if search.user_id:
+            query = query.filter(Payment.user_id == search.user_id)
+        if search.order_id:
+            query = query.filter(Payment.order_id.ilike(f"%{search.order_id}%"))
+        if search.status:
+            query = query.filter(Payment.status == search.status)
+        if search.method:
+            query = query.filter(Payment.method == search.method)
+        if search.start_date:
+            query = query.filter(Payment.created_at >= search.start_date)
+        if search.end_date:
+            query = query.filter(Payment.created_at <= search.end_date)
+        return query
+
     def refund_payment(
         self,
         payment_id: int,
@@ -118,41 +149,7 @@ class PaymentService:
         return PaymentResponse.model_validate(payment)
 
     def get_payment_stats(self) -> dict:
-        """결제 통계"""
-        today = datetime.now(timezone.utc).date()
-
-        total_amount = (
-            self.db.query(sql_func.sum(Payment.paid_amount))
-            .filter(Payment.status == PaymentStatus.COMPLETED.value)
-            .scalar()
-            or 0
-        )
-
-        today_amount = (
-            self.db.query(sql_func.sum(Payment.paid_amount))
-            .filter(
-                Payment.status == PaymentStatus.COMPLETED.value,
-                sql_func.date(Payment.paid_at) == today,
-            )
-            .scalar()
-            or 0
-        )
-
-        total_count = (
-            self.db.query(Payment)
-            .filter(Payment.status == PaymentStatus.COMPLETED.value)
-            .count()
-        )
-
-        pending_count = (
-            self.db.query(Payment)
-            .filter(Payment.status == PaymentStatus.PENDING.value)
-            .count()
-        )
+        """결제 통계 (대시보드 스냅샷에서 제공, 짧은 주기로 캐시됨)"""
+        from visitors.dashboard import get_dashboard_snapshot
 
-        return {
-            "total_amount": float(total_amount),
-            "today_amount": float(today_amount),
-            "total_count": total_count,
-            "pending_count": pending_count,
-        }
+        return get_dashboard_snapshot(self.db).payments
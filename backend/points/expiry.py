@@ -0,0 +1,251 @@
+"""
+포인트 만료 처리
+
+만료 시각(expires_at)이 지난 적립의 남은 금액을 EXPIRE 이력으로 차감한다.
+- 대상 조회: 미처리 적립 부분 인덱스로 (as_of - POINT_EXPIRY_LOOKBACK_DAYS, as_of] 구간에 만료된 적립 중
+  아직 처리하지 않은(expiry_processed_at이 없는) 것만 찾음
+  - 처리한 적립은 남은 금액이 없어 만료 이력을 남기지 않은 경우에도 같은 트랜잭션에서 처리 시각을 기록하므로
+    다 쓴 적립 때문에 매 실행마다 사용자를 다시 잠그고 이력을 읽지 않는다
+- 남은 금액 (FIFO): 사용자 이력을 순서대로 따라가며 차감을 먼저 적립된 것부터 소진
+  - 만료 이력(reference_id = "expire:<적립 ID>")은 해당 적립만 소진
+- 적립마다 만료 이력 1건, 사용자 잔액 변경은 1회 (points.ledger.append_entries)
+- 사용자 행을 잠근 뒤 이력을 읽으므로 동시 잔액 변경과 섞이지 않고, 만료 이력이 남아 있어
+  재실행/동시 실행해도 같은 적립이 두 번 만료되지 않는다 (중단되면 다시 실행하면 남은 분량만 처리)
+- 대상 사용자를 user_id 순으로 POINT_EXPIRY_CHUNK_SIZE명씩 나누어 묶음마다 커밋,
+  묶음은 POINT_EXPIRY_WORKERS개 스레드(각자 세션)로 병렬 처리 (SQLite는 1개 스레드)
+- dry_run이면 기록하지 않고 합계만 계산
+
+Example:
+    run_point_expiry(dry_run=True)
+"""
+
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, Optional
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from core.config import settings
+from core.database import SessionLocal, engine
+from users.models import User
+from .ledger import append_entries
+from .models import PointHistory, PointReason, PointType
+from .schemas import PointExpiryResult
+
+# 만료 이력의 reference_id 접두사 (뒤에 만료된 적립 이력 ID)
+EXPIRE_REFERENCE_PREFIX = "expire:"
+
+
+def expire_reference(credit_id: int) -> str:
+    return f"{EXPIRE_REFERENCE_PREFIX}{credit_id}"
+
+
+def _expired_credit_id(reference_id: Optional[str]) -> Optional[int]:
+    if reference_id and reference_id.startswith(EXPIRE_REFERENCE_PREFIX):
+        suffix = reference_id[len(EXPIRE_REFERENCE_PREFIX):]
+        if suffix.isdigit():
+            return int(suffix)
+    return None
+
+
+def fifo_remaining(entries: Iterable[tuple[int, int, Optional[str]]]) -> dict[int, int]:
+    """
+    적립 이력 ID별 남은 금액
+
+    Args:
+        entries: 사용자 이력 (id, amount, reference_id), ID 순
+    """
+    remaining: dict[int, int] = {}
+    queue: deque[int] = deque()
+
+    for history_id, amount, reference_id in entries:
+        if amount > 0:
+            remaining[history_id] = amount
+            queue.append(history_id)
+            continue
+
+        debit = -amount
+        credit_id = _expired_credit_id(reference_id)
+        if credit_id in remaining:
+            # 만료 이력은 해당 적립만 소진
+            taken = min(debit, remaining[credit_id])
+            remaining[credit_id] -= taken
+            debit -= taken
+
+        while debit and queue:
+            head = queue[0]
+            taken = min(debit, remaining[head])
+            remaining[head] -= taken
+            debit -= taken
+            if remaining[head] == 0:
+                queue.popleft()
+        # 다 쓴 적립은 앞에서부터 정리 (만료로 소진된 경우 포함)
+        while queue and remaining[queue[0]] == 0:
+            queue.popleft()
+
+    return remaining
+
+
+def _candidate_users(db: Session, since: datetime, as_of: datetime) -> list[int]:
+    """기간 안에 만료됐지만 아직 처리하지 않은 적립이 있는 사용자 (user_id 순)"""
+    rows = (
+        db.query(PointHistory.user_id)
+        .filter(
+            PointHistory.expires_at > since,
+            PointHistory.expires_at <= as_of,
+            PointHistory.expiry_processed_at.is_(None),
+            PointHistory.amount > 0,
+        )
+        .distinct()
+        .order_by(PointHistory.user_id)
+    )
+    return [user_id for (user_id,) in rows]
+
+
+def _plan_user(
+    db: Session, user_id: int, as_of: datetime, lock: bool
+) -> tuple[list[tuple[int, int]], list[int]]:
+    """
+    사용자의 만료 대상
+
+    Returns:
+        ([(적립 ID, 만료 금액)], 처리 시각을 기록할 만료된 적립 ID 목록)
+    """
+    balance_query = db.query(User.point_balance).filter(User.id == user_id)
+    if lock:
+        # 잔액 변경(UPDATE users)과 직렬화 -> 아래에서 읽는 이력이 잔액과 일치
+        balance_query = balance_query.with_for_update()
+    balance = balance_query.scalar() or 0
+
+    entries = (
+        db.query(
+            PointHistory.id,
+            PointHistory.amount,
+            PointHistory.reference_id,
+            (PointHistory.expires_at <= as_of).label("is_expired"),
+            PointHistory.expiry_processed_at,
+        )
+        .filter(PointHistory.user_id == user_id)
+        .order_by(PointHistory.id)
+        .all()
+    )
+    remaining = fifo_remaining((row.id, row.amount, row.reference_id) for row in entries)
+
+    plan = []
+    processed = []
+    for row in entries:
+        if row.amount <= 0 or not row.is_expired:
+            continue
+        if row.expiry_processed_at is None:
+            processed.append(row.id)
+        # 이력과 잔액이 어긋난 경우에도 잔액보다 많이 차감하지 않음
+        amount = min(remaining.get(row.id, 0), balance)
+        if amount <= 0:
+            continue
+        plan.append((row.id, amount))
+        balance -= amount
+    return plan, processed
+
+
+def _expire_chunk(user_ids: list[int], as_of: datetime, dry_run: bool) -> tuple[int, int, int]:
+    """사용자 묶음 처리 (한 트랜잭션), (사용자 수, 이력 수, 금액) 반환"""
+    db = SessionLocal()
+    try:
+        users = entries = amount = 0
+        processed_ids: list[int] = []
+        for user_id in user_ids:
+            plan, processed = _plan_user(db, user_id, as_of, lock=not dry_run)
+            processed_ids.extend(processed)
+            if not plan:
+                continue
+            if not dry_run:
+                append_entries(
+                    db,
+                    user_id,
+                    [
+                        {
+                            "type": PointType.EXPIRE.value,
+                            "reason": PointReason.EXPIRED.value,
+                            "amount": -expired,
+                            "reference_id": expire_reference(credit_id),
+                            "description": "포인트 유효기간 만료",
+                        }
+                        for credit_id, expired in plan
+                    ],
+                )
+            users += 1
+            entries += len(plan)
+            amount += sum(expired for _, expired in plan)
+
+        if dry_run:
+            db.rollback()
+        else:
+            if processed_ids:
+                db.execute(
+                    update(PointHistory)
+                    .where(PointHistory.id.in_(processed_ids))
+                    .values(expiry_processed_at=datetime.now(timezone.utc)),
+                    execution_options={"synchronize_session": False},
+                )
+            db.commit()
+        return users, entries, amount
+    finally:
+        db.close()
+
+
+def run_point_expiry(
+    as_of: Optional[datetime] = None,
+    since: Optional[datetime] = None,
+    dry_run: bool = False,
+    workers: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+) -> PointExpiryResult:
+    """
+    만료 시각이 지난 포인트 차감
+
+    Args:
+        as_of: 기준 시각 (기본: 현재)
+        since: 만료 시각이 이 시각 이후인 적립만 조회 (기본: as_of - POINT_EXPIRY_LOOKBACK_DAYS)
+        dry_run: True이면 기록하지 않고 합계만 계산
+    """
+    started = time.monotonic()
+    as_of = as_of or datetime.now(timezone.utc)
+    since = since or as_of - timedelta(days=settings.POINT_EXPIRY_LOOKBACK_DAYS)
+    workers = workers or settings.POINT_EXPIRY_WORKERS
+    chunk_size = chunk_size or settings.POINT_EXPIRY_CHUNK_SIZE
+
+    db = SessionLocal()
+    try:
+        user_ids = _candidate_users(db, since, as_of)
+    finally:
+        db.close()
+    chunks = [user_ids[i:i + chunk_size] for i in range(0, len(user_ids), chunk_size)]
+
+    if engine.dialect.name == "sqlite":
+        workers = 1
+
+    if workers <= 1 or len(chunks) <= 1:
+        results = [_expire_chunk(chunk, as_of, dry_run) for chunk in chunks]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # 예외가 있으면 여기서 전파
+            results = list(executor.map(lambda chunk: _expire_chunk(chunk, as_of, dry_run), chunks))
+
+    return PointExpiryResult(
+        dry_run=dry_run,
+        as_of=as_of,
+        since=since,
+        users=sum(r[0] for r in results),
+        entries=sum(r[1] for r in results),
+        amount=sum(r[2] for r in results),
+        chunks=len(chunks),
+        elapsed_ms=int((time.monotonic() - started) * 1000),
+    )
+
+
+def run_point_expiry_job() -> None:
+    """백그라운드 작업용 진입점 (각 묶음이 자체 세션 사용)"""
+    run_point_expiry()
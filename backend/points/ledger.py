@@ -0,0 +1,262 @@
+"""
+포인트 잔액 변경 (원자적 조건부 UPDATE + 이력)
+
+잔액을 읽어 파이썬에서 검사한 뒤 새 잔액을 쓰는 대신, 검사와 변경을 하나의 UPDATE로 처리한다.
+
+    UPDATE users SET point_balance = point_balance + :amount
+    WHERE id = :user_id AND point_balance + :amount >= 0
+    RETURNING point_balance
+
+- 같은 사용자 잔액을 동시에 바꿔도 갱신 손실이나 마이너스 잔액이 생기지 않는다
+  (조건을 만족하지 않으면 0행 -> 잔액 부족, 행 잠금은 UPDATE부터 커밋까지만)
+- 변경 후 잔액(RETURNING)으로 이력 행과 사용자별 누계를 같은 트랜잭션에서 기록
+- 대량 조정은 사용자 묶음마다 UPDATE ... WHERE id IN (...) RETURNING 1회 + 이력 일괄 INSERT +
+  누계 일괄 반영 후 커밋
+- reference_id가 있는 이력은 (user_id, reason, reference_id) 유니크 인덱스로 중복 반영을 막는다
+  (대량 조정은 이력을 먼저 INSERT ... ON CONFLICT DO NOTHING으로 넣고, 들어간 사용자만 잔액 변경)
+
+Example:
+    history = change_balance(db, user_id, -500, PointType.USE.value, PointReason.PAYMENT.value)
+    db.commit()
+"""
+
+import time
+from datetime import datetime
+from typing import Iterable, Optional
+
+from sqlalchemy import delete, func, insert, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from common.errors import ConflictException, NotFoundException, BadRequestException
+from users.models import User
+from .models import PointHistory
+from .schemas import PointBulkAdjustResult
+from .summary import record_histories, record_history, record_uniform_histories
+
+BULK_BATCH_SIZE = 1000
+
+
+def _balance_update(condition, amount: int):
+    """잔액 증감 UPDATE (차감이면 잔액이 0 미만이 되지 않는 행만)"""
+    balance = func.coalesce(User.point_balance, 0)
+    stmt = update(User).where(condition).values(point_balance=balance + amount)
+    if amount < 0:
+        stmt = stmt.where(balance + amount >= 0)
+    return stmt
+
+
+def change_balance(
+    db: Session,
+    user_id: int,
+    amount: int,
+    point_type: str,
+    reason: str,
+    description: Optional[str] = None,
+    reference_id: Optional[str] = None,
+    admin_id: Optional[int] = None,
+    expires_at: Optional[datetime] = None,
+) -> PointHistory:
+    """
+    잔액 변경 + 이력/누계 기록 (커밋은 호출자가 수행)
+
+    Raises:
+        NotFoundException: 사용자가 없음
+        BadRequestException: 잔액 부족
+        ConflictException: 같은 reason + reference_id 이력이 이미 있음
+    """
+    new_balance = db.execute(
+        _balance_update(User.id == user_id, amount).returning(User.point_balance),
+        execution_options={"synchronize_session": False},
+    ).scalar()
+    if new_balance is None:
+        if db.query(User.id).filter(User.id == user_id).first() is None:
+            raise NotFoundException(detail="사용자를 찾을 수 없습니다")
+        raise BadRequestException(detail="포인트 잔액이 부족합니다")
+
+    history = PointHistory(
+        user_id=user_id,
+        type=point_type,
+        reason=reason,
+        amount=amount,
+        balance=new_balance,
+        reference_id=reference_id,
+        description=description,
+        admin_id=admin_id,
+        expires_at=expires_at,
+    )
+    if reference_id:
+        # 유니크 인덱스 위반 -> 이미 반영된 요청 (잔액 변경은 호출자 롤백으로 취소)
+        try:
+            with db.begin_nested():
+                db.add(history)
+        except IntegrityError:
+            raise ConflictException(detail="이미 처리된 포인트 요청입니다")
+    else:
+        db.add(history)
+    record_history(db, history)
+    return history
+
+
+def append_entries(db: Session, user_id: int, entries: list[dict]) -> int:
+    """
+    같은 사용자의 이력 여러 건을 잔액 변경 1회로 기록 (커밋은 호출자가 수행)
+
+    entries는 type/reason/amount(+ reference_id/description 등) 값이며,
+    각 이력의 balance는 앞 이력부터 차례로 반영한 잔액으로 채운다.
+
+    Returns:
+        변경 후 잔액
+
+    Raises:
+        NotFoundException: 사용자가 없음
+        BadRequestException: 잔액 부족
+    """
+    total = sum(entry["amount"] for entry in entries)
+    new_balance = db.execute(
+        _balance_update(User.id == user_id, total).returning(User.point_balance),
+        execution_options={"synchronize_session": False},
+    ).scalar()
+    if new_balance is None:
+        if db.query(User.id).filter(User.id == user_id).first() is None:
+            raise NotFoundException(detail="사용자를 찾을 수 없습니다")
+        raise BadRequestException(detail="포인트 잔액이 부족합니다")
+
+    balance = new_balance - total
+    rows = []
+    for entry in entries:
+        balance += entry["amount"]
+        rows.append({**entry, "user_id": user_id, "balance": balance})
+    db.execute(insert(PointHistory), rows)
+    record_histories(db, [(user_id, row["type"], row["amount"]) for row in rows])
+    return new_balance
+
+
+def _insert_new_references(db: Session, rows: list[dict]) -> dict[int, int]:
+    """
+    reference_id 이력 일괄 INSERT, 유니크 인덱스에 걸리는 (이미 있는) 행은 건너뜀
+
+    Returns:
+        {user_id: 추가된 이력 ID}
+    """
+    if not rows:
+        return {}
+    table = PointHistory.__table__
+    dialect = db.get_bind().dialect.name
+
+    if dialect in ("postgresql", "sqlite"):
+        if dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        stmt = (
+            dialect_insert(table)
+            .values(rows)
+            .on_conflict_do_nothing(
+                index_elements=["user_id", "reason", "reference_id"],
+                index_where=table.c.reference_id.isnot(None),
+            )
+            .returning(table.c.user_id, table.c.id)
+        )
+        return dict(db.execute(stmt).all())
+
+    # 그 외 DB: 유니크 제약조건 위반을 세이브포인트로 처리
+    inserted = {}
+    for row in rows:
+        try:
+            with db.begin_nested():
+                inserted[row["user_id"]] = db.execute(insert(table).values(row).returning(table.c.id)).scalar()
+        except IntegrityError:
+            pass
+    return inserted
+
+
+def bulk_change_balance(
+    db: Session,
+    user_ids: Iterable[int],
+    amount: int,
+    point_type: str,
+    reason: str,
+    description: Optional[str] = None,
+    reference_id: Optional[str] = None,
+    admin_id: Optional[int] = None,
+    batch_size: int = BULK_BATCH_SIZE,
+) -> PointBulkAdjustResult:
+    """
+    여러 사용자 잔액을 같은 금액만큼 변경 (묶음마다 커밋)
+
+    - 없는 사용자/잔액 부족 사용자는 건너뛰고 failed_user_ids로 반환
+    - reference_id를 지정하면 같은 reason + reference_id 이력이 이미 있는 사용자는 건너뜀
+      (중간에 실패해도 같은 요청으로 다시 실행하면 남은 사용자만 처리)
+      - 이력을 먼저 INSERT ... ON CONFLICT DO NOTHING으로 넣어 유니크 인덱스로 판정하므로
+        같은 요청이 동시에 실행되어도 한 번만 반영 (나중 요청은 먼저 요청의 커밋을 기다린 뒤 건너뜀)
+      - 잔액을 바꾸지 못한 사용자의 이력은 같은 트랜잭션에서 삭제
+    """
+    started = time.monotonic()
+    # 잠금 순서를 고정해 다른 잔액 변경과의 교착 방지
+    ids = sorted(set(user_ids))
+    adjusted = already = 0
+    failed: list[int] = []
+
+    def history_row(user_id: int, balance: int) -> dict:
+        return {
+            "user_id": user_id,
+            "type": point_type,
+            "reason": reason,
+            "amount": amount,
+            "balance": balance,
+            "reference_id": reference_id,
+            "description": description,
+            "admin_id": admin_id,
+        }
+
+    for i in range(0, len(ids), batch_size):
+        batch = ids[i:i + batch_size]
+        targets = batch
+        history_ids: dict[int, int] = {}
+        applied: set[int] = set()  # 같은 reference_id로 이미 반영된 사용자
+        if reference_id:
+            # 없는 사용자는 외래 키 위반이 되므로 제외 (failed로 반환), 잔액은 아래 UPDATE 결과로 채움
+            existing = [user_id for (user_id,) in db.query(User.id).filter(User.id.in_(batch)).order_by(User.id)]
+            history_ids = _insert_new_references(db, [history_row(user_id, 0) for user_id in existing])
+            applied = {user_id for user_id in existing if user_id not in history_ids}
+            already += len(applied)
+            targets = [user_id for user_id in existing if user_id in history_ids]
+
+        rows = []
+        if targets:
+            rows = db.execute(
+                _balance_update(User.id.in_(targets), amount).returning(User.id, User.point_balance),
+                execution_options={"synchronize_session": False},
+            ).all()
+        if reference_id:
+            changed_ids = {user_id for user_id, _ in rows}
+            unchanged = [history_ids[user_id] for user_id in targets if user_id not in changed_ids]
+            if unchanged:
+                db.execute(
+                    delete(PointHistory).where(PointHistory.id.in_(unchanged)),
+                    execution_options={"synchronize_session": False},
+                )
+            if rows:
+                # 기본 키 기준 ORM 일괄 UPDATE
+                db.execute(
+                    update(PointHistory),
+                    [{"id": history_ids[user_id], "balance": balance} for user_id, balance in rows],
+                )
+        elif rows:
+            db.execute(insert(PointHistory), [history_row(user_id, balance) for user_id, balance in rows])
+        if rows:
+            record_uniform_histories(db, [user_id for user_id, _ in rows], point_type, amount)
+        db.commit()
+
+        changed = {user_id for user_id, _ in rows}
+        adjusted += len(changed)
+        failed.extend(user_id for user_id in batch if user_id not in changed and user_id not in applied)
+
+    return PointBulkAdjustResult(
+        requested=len(ids),
+        adjusted=adjusted,
+        already_applied=already,
+        failed_user_ids=failed,
+        elapsed_ms=int((time.monotonic() - started) * 1000),
+    )
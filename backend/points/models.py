@@ -2,7 +2,7 @@
 포인트 모델
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text
+from sqlalchemy import BigInteger, Column, Integer, String, DateTime, ForeignKey, Text, Index, text
 from sqlalchemy.sql import func
 import enum
 
@@ -55,9 +55,50 @@ class PointHistory(Base):
 
     # 만료 정보
     expires_at = Column(DateTime(timezone=True), nullable=True)
+    # 만료 처리 시각 (적립 행, 남은 금액이 없어 만료 이력을 남기지 않은 경우 포함, points/expiry.py)
+    expiry_processed_at = Column(DateTime(timezone=True), nullable=True)
 
     # 타임스탬프
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
+    __table_args__ = (
+        # 커서 페이지네이션 (created_at, id) 키셋 인덱스
+        Index("ix_point_histories_created_at_id", "created_at", "id"),
+        # 포인트 만료 대상 조회 (points/expiry.py, 아직 처리하지 않은 적립만)
+        Index(
+            "ix_point_histories_expiry_pending",
+            "expires_at",
+            postgresql_where=text("expires_at IS NOT NULL AND expiry_processed_at IS NULL"),
+            sqlite_where=text("expires_at IS NOT NULL AND expiry_processed_at IS NULL"),
+        ),
+        # 같은 요청(reason + reference_id)이 사용자에게 두 번 반영되지 않도록 (points/ledger.py)
+        Index(
+            "uq_point_histories_reference",
+            "user_id", "reason", "reference_id",
+            unique=True,
+            postgresql_where=text("reference_id IS NOT NULL"),
+            sqlite_where=text("reference_id IS NOT NULL"),
+        ),
+    )
+
     # 관계
     # user = relationship("User", back_populates="point_histories")
+
+
+class PointSummary(Base):
+    """
+    사용자별 포인트 누계 테이블
+
+    point_histories 행을 추가할 때 같은 트랜잭션에서 증감한다 (points/summary.py).
+    누락/불일치는 scripts/rebuild_point_summaries.py로 재계산.
+    """
+
+    __tablename__ = "user_point_summaries"
+
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+
+    total_earned = Column(BigInteger, nullable=False, default=0)  # 적립 합계 (양수 금액 전체)
+    total_used = Column(BigInteger, nullable=False, default=0)  # 사용 합계 (양수로 저장)
+    total_expired = Column(BigInteger, nullable=False, default=0)  # 만료 합계 (양수로 저장)
+
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
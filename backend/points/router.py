@@ -2,6 +2,8 @@
 포인트 라우터
 """
 
+import asyncio
+
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 from typing import Optional
@@ -9,16 +11,27 @@ from datetime import datetime
 
 from core.database import get_db
 from core.security import get_current_admin
-from common.responses import SuccessResponse, PaginatedResponse, PaginationMeta
-from common.pagination import PaginationParams
+from common.responses import (
+    SuccessResponse,
+    PaginatedResponse,
+    PaginationMeta,
+    CursorPaginatedResponse,
+    CursorPaginationMeta,
+)
+from common.export import ExportFormat, export_response
+from common.pagination import PaginationParams, CursorParams
 from .schemas import (
     PointHistoryResponse,
     PointHistoryListResponse,
     PointAdjustRequest,
+    PointBulkAdjustRequest,
+    PointBulkAdjustResult,
+    PointExpiryResult,
     PointSearchParams,
     UserPointSummary,
 )
-from .service import PointService
+from .expiry import run_point_expiry
+from .service import EXPORT_COLUMNS, PointService
 
 router = APIRouter(prefix="/points", tags=["포인트 관리"])
 
@@ -63,6 +76,83 @@ async def get_point_history_list(
     )
 
 
+@router.get("/cursor", response_model=CursorPaginatedResponse[PointHistoryListResponse])
+async def get_point_history_cursor_list(
+    cursor: Optional[str] = None,
+    page_size: int = Query(20, ge=1, le=100),
+    include_total: bool = False,
+    approximate_total: bool = True,
+    user_id: Optional[int] = None,
+    type: Optional[str] = None,
+    reason: Optional[str] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    current_admin: dict = Depends(get_current_admin),
+    db: Session = Depends(get_db),
+):
+    """
+    포인트 이력 목록 조회 (커서 기반)
+    """
+    service = PointService(db)
+    params = CursorParams(
+        cursor=cursor,
+        page_size=page_size,
+        include_total=include_total,
+        approximate_total=approximate_total,
+    )
+    search = PointSearchParams(
+        user_id=user_id,
+        type=type,
+        reason=reason,
+        start_date=start_date,
+        end_date=end_date,
+    )
+
+    result = service.get_point_history_cursor_list(params, search)
+
+    return CursorPaginatedResponse(
+        data=result.items,
+        meta=CursorPaginationMeta(
+            page_size=result.page_size,
+            next_cursor=result.next_cursor,
+            has_next=result.has_next,
+            total_count=result.total_count,
+            total_is_approximate=result.total_is_approximate,
+        ),
+    )
+
+
+@router.get("/export")
+async def export_point_history(
+    format: ExportFormat = "csv",
+    gzip: bool = False,
+    user_id: Optional[int] = None,
+    type: Optional[str] = None,
+    reason: Optional[str] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    current_admin: dict = Depends(get_current_admin),
+):
+    """
+    포인트 이력 내보내기 (CSV/NDJSON 스트리밍, 목록과 같은 검색 조건)
+    """
+    search = PointSearchParams(
+        user_id=user_id,
+        type=type,
+        reason=reason,
+        start_date=start_date,
+        end_date=end_date,
+    )
+
+    return export_response(
+        lambda db: PointService(db).iter_export_rows(search),
+        columns=EXPORT_COLUMNS,
+        filename="point_history",
+        format=format,
+        gzip=gzip,
+    )
+
+
 @router.get("/stats", response_model=SuccessResponse[dict])
 async def get_point_stats(
     current_admin: dict = Depends(get_current_admin),
@@ -108,3 +198,36 @@ async def adjust_points(
         message=f"포인트가 {action}되었습니다",
         data=history,
     )
+
+
+@router.post("/bulk-adjust", response_model=SuccessResponse[PointBulkAdjustResult])
+async def bulk_adjust_points(
+    request: PointBulkAdjustRequest,
+    current_admin: dict = Depends(get_current_admin),
+    db: Session = Depends(get_db),
+):
+    """
+    포인트 대량 조정 (이벤트/캠페인 지급)
+
+    reference_id(캠페인 식별자)를 지정하면 이미 지급된 사용자는 건너뛰므로 같은 요청을 다시 보내도 안전하다.
+    """
+    service = PointService(db)
+    admin_id = int(current_admin["sub"])
+    result = await asyncio.to_thread(service.bulk_adjust_points, request, admin_id)
+
+    return SuccessResponse(
+        message=f"{result.adjusted}명에게 포인트가 조정되었습니다",
+        data=result,
+    )
+
+
+@router.post("/expiry/run", response_model=SuccessResponse[PointExpiryResult])
+async def run_point_expiry_now(
+    dry_run: bool = True,
+    current_admin: dict = Depends(get_current_admin),
+):
+    """
+    포인트 만료 처리 즉시 실행 (기본: dry_run, 기록 없이 만료 예정 합계만 계산)
+    """
+    result = await asyncio.to_thread(run_point_expiry, dry_run=dry_run)
+    return SuccessResponse(data=result)
@@ -2,8 +2,8 @@
 포인트 스키마
 """
 
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, Field
+from typing import List, Optional
 from datetime import datetime
 
 
@@ -51,6 +51,27 @@ class PointAdjustRequest(BaseModel):
     description: Optional[str] = None
 
 
+class PointBulkAdjustRequest(BaseModel):
+    """포인트 대량 조정 요청 (이벤트/캠페인 지급)"""
+
+    user_ids: List[int] = Field(..., min_length=1, max_length=100000)
+    amount: int  # 사용자마다 같은 금액 (양수: 추가, 음수: 차감)
+    reason: str = "event"
+    description: Optional[str] = None
+    # 캠페인 식별자: 지정하면 같은 reason + reference_id 이력이 있는 사용자는 건너뜀 (재실행 안전)
+    reference_id: Optional[str] = Field(None, max_length=100)
+
+
+class PointBulkAdjustResult(BaseModel):
+    """포인트 대량 조정 결과"""
+
+    requested: int  # 요청한 사용자 수 (중복 제외)
+    adjusted: int
+    already_applied: int  # 같은 reference_id로 이미 지급된 사용자 수
+    failed_user_ids: List[int]  # 없는 사용자 또는 잔액 부족
+    elapsed_ms: int
+
+
 class PointSearchParams(BaseModel):
     """포인트 검색 파라미터"""
 
@@ -69,3 +90,24 @@ class UserPointSummary(BaseModel):
     total_earned: int
     total_used: int
     total_expired: int
+
+
+class PointSummaryRebuildResult(BaseModel):
+    """사용자별 포인트 누계 재계산 결과"""
+
+    users: int  # 재계산한 사용자 수
+    batches: int
+    elapsed_ms: int
+
+
+class PointExpiryResult(BaseModel):
+    """포인트 만료 처리 결과"""
+
+    dry_run: bool
+    as_of: datetime  # 이 시각까지 만료된 적립을 처리
+    since: datetime  # 만료 시각이 이 시각 이후인 적립만 조회
+    users: int  # 포인트가 만료된 사용자 수
+    entries: int  # 만료 이력 수 (적립 건수)
+    amount: int  # 만료 금액 합계
+    chunks: int
+    elapsed_ms: int
@@ -4,19 +4,26 @@
 
 from typing import Optional
 from sqlalchemy.orm import Session
-from sqlalchemy import func as sql_func
 
 from common.errors import NotFoundException, BadRequestException
-from common.pagination import Pagination, PaginationParams
+from common.export import EXPORT_BATCH_SIZE
+from common.pagination import Pagination, PaginationParams, CursorPagination, CursorParams
 from users.models import User
 from .models import PointHistory, PointType, PointReason
 from .schemas import (
     PointHistoryResponse,
     PointHistoryListResponse,
     PointAdjustRequest,
+    PointBulkAdjustRequest,
+    PointBulkAdjustResult,
     PointSearchParams,
     UserPointSummary,
 )
+from .ledger import bulk_change_balance, change_balance
+from .summary import get_point_totals
+
+# 내보내기 컬럼 (목록 응답과 같은 필드)
+EXPORT_COLUMNS = list(PointHistoryListResponse.model_fields)
 
 
 class PointService:
@@ -26,47 +33,15 @@ class PointService:
         self.db = db
 
     def get_user_point_summary(self, user_id: int) -> UserPointSummary:
-        """사용자 포인트 요약"""
+        """사용자 포인트 요약 (사용자별 누계 테이블에서 조회)"""
         user = self.db.query(User).filter(User.id == user_id).first()
         if not user:
             raise NotFoundException(detail="사용자를 찾을 수 없습니다")
 
-        total_earned = (
-            self.db.query(sql_func.sum(PointHistory.amount))
-            .filter(
-                PointHistory.user_id == user_id,
-                PointHistory.amount > 0,
-            )
-            .scalar()
-            or 0
-        )
-
-        total_used = abs(
-            self.db.query(sql_func.sum(PointHistory.amount))
-            .filter(
-                PointHistory.user_id == user_id,
-                PointHistory.type == PointType.USE.value,
-            )
-            .scalar()
-            or 0
-        )
-
-        total_expired = abs(
-            self.db.query(sql_func.sum(PointHistory.amount))
-            .filter(
-                PointHistory.user_id == user_id,
-                PointHistory.type == PointType.EXPIRE.value,
-            )
-            .scalar()
-            or 0
-        )
-
         return UserPointSummary(
             user_id=user_id,
             balance=user.point_balance,
-            total_earned=total_earned,
-            total_used=total_used,
-            total_expired=total_expired,
+            **get_point_totals(self.db, user_id),
         )
 
     def get_point_history_list(
@@ -75,20 +50,7 @@ class PointService:
         search: Optional[PointSearchParams] = None,
     ) -> Pagination[PointHistoryListResponse]:
         """포인트 이력 목록 조회"""
-        query = self.db.query(PointHistory)
-
-        # 검색 조건 적용
-        if search:
-            if search.user_id:
-                query = query.filter(PointHistory.user_id == search.user_id)
-            if search.type:
-                query = query.filter(PointHistory.type == search.type)
-            if search.reason:
-                query = query.filter(PointHistory.reason == search.reason)
-            if search.start_date:
-                query = query.filter(PointHistory.created_at >= search.start_date)
-            if search.end_date:
-                query = query.filter(PointHistory.created_at <= search.end_date)
+        query = self._apply_search(self.db.query(PointHistory), search)
 
         # 정렬 (최신순)
         query = query.order_by(PointHistory.created_at.desc())
@@ -103,70 +65,94 @@ class PointService:
             page_size=result.page_size,
         )
 
-    def adjust_points(
+    def get_point_history_cursor_list(
         self,
-        request: PointAdjustRequest,
-        admin_id: int,
-    ) -> PointHistoryResponse:
-        """포인트 조정 (관리자)"""
-        user = self.db.query(User).filter(User.id == request.user_id).first()
-        if not user:
-            raise NotFoundException(detail="사용자를 찾을 수 없습니다")
-
-        # 차감 시 잔액 확인
-        if request.amount < 0 and user.point_balance + request.amount < 0:
-            raise BadRequestException(detail="포인트 잔액이 부족합니다")
+        params: CursorParams,
+        search: Optional[PointSearchParams] = None,
+    ) -> CursorPagination[PointHistoryListResponse]:
+        """포인트 이력 목록 조회 (커서 기반, 최신순)"""
+        query = self._apply_search(self.db.query(PointHistory), search)
 
-        # 포인트 타입 결정
-        point_type = (
-            PointType.ADMIN_ADD.value
-            if request.amount > 0
-            else PointType.ADMIN_DEDUCT.value
+        result = CursorPagination.from_query(
+            query, params, sort_column=PointHistory.created_at, id_column=PointHistory.id
         )
+        result.items = [PointHistoryListResponse.model_validate(p) for p in result.items]
+        return result
 
-        # 잔액 업데이트
-        new_balance = user.point_balance + request.amount
-        user.point_balance = new_balance
+    def iter_export_rows(
+        self,
+        search: Optional[PointSearchParams] = None,
+        batch_size: int = EXPORT_BATCH_SIZE,
+    ):
+        """내보내기용 포인트 이력 행 (EXPORT_COLUMNS 순서, 최신순, 서버 측 커서로 배치 단위 조회)"""
+        columns = [getattr(PointHistory, name) for name in EXPORT_COLUMNS]
+        query = self._apply_search(self.db.query(*columns), search)
+        return query.order_by(PointHistory.created_at.desc(), PointHistory.id.desc()).yield_per(batch_size)
+
+    def _apply_search(self, query, search: Optional[PointSearchParams]):
+        """검색 조건 적용"""
+        if not search:
+            return query
+
+        if search.user_id:
+            query = query.filter(PointHistory.user_id == search.user_id)
+        if search.type:
+            query = query.filter(PointHistory.type == search.type)
+        if search.reason:
+            query = query.filter(PointHistory.reason == search.reason)
+        if search.start_date:
+            query = query.filter(PointHistory.created_at >= search.start_date)
+        if search.end_date:
+            query = query.filter(PointHistory.created_at <= search.end_date)
+        return query
 
-        # 이력 생성
-        history = PointHistory(
+    def adjust_points(
+        self,
+        request: PointAdjustRequest,
+        admin_id: int,
+    ) -> PointHistoryResponse:
+        """포인트 조정 (관리자, 잔액 검사와 변경을 하나의 조건부 UPDATE로 처리)"""
+        history = change_balance(
+            self.db,
             user_id=request.user_id,
-            type=point_type,
-            reason=request.reason,
             amount=request.amount,
-            balance=new_balance,
+            point_type=self._adjust_type(request.amount),
+            reason=request.reason,
             description=request.description,
             admin_id=admin_id,
         )
-
-        self.db.add(history)
         self.db.commit()
         self.db.refresh(history)
 
         return PointHistoryResponse.model_validate(history)
 
-    def get_point_stats(self) -> dict:
-        """포인트 통계"""
-        total_points = (
-            self.db.query(sql_func.sum(User.point_balance)).scalar() or 0
+    def bulk_adjust_points(
+        self,
+        request: PointBulkAdjustRequest,
+        admin_id: int,
+    ) -> PointBulkAdjustResult:
+        """포인트 대량 조정 (이벤트/캠페인 지급, 사용자 묶음 단위로 처리/커밋)"""
+        if request.amount == 0:
+            raise BadRequestException(detail="조정 금액은 0일 수 없습니다")
+
+        return bulk_change_balance(
+            self.db,
+            request.user_ids,
+            amount=request.amount,
+            point_type=self._adjust_type(request.amount),
+            reason=request.reason,
+            description=request.description,
+            reference_id=request.reference_id,
+            admin_id=admin_id,
         )
 
-        total_earned = (
-            self.db.query(sql_func.sum(PointHistory.amount))
-            .filter(PointHistory.amount > 0)
-            .scalar()
-            or 0
-        )
+    @staticmethod
+    def _adjust_type(amount: int) -> str:
+        """관리자 조정 포인트 타입"""
+        return PointType.ADMIN_ADD.value if amount > 0 else PointType.ADMIN_DEDUCT.value
 
-        total_used = abs(
-            self.db.query(sql_func.sum(PointHistory.amount))
-            .filter(PointHistory.type == PointType.USE.value)
-            .scalar()
-            or 0
-        )
+    def get_point_stats(self) -> dict:
+        """포인트 통계 (대시보드 스냅샷에서 제공, 짧은 주기로 캐시됨)"""
+        from visitors.dashboard import get_dashboard_snapshot
 
-        return {
-            "total_circulation": total_points,
-            "total_earned": total_earned,
-            "total_used": total_used,
-        }
+        return get_dashboard_snapshot(self.db).points
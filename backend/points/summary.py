@@ -0,0 +1,236 @@
+"""
+사용자별 포인트 누계 (user_point_summaries)
+
+사용자 포인트 요약과 포인트 통계를 point_histories 전체 SUM 대신 사용자당 1행에서 읽는다.
+- 이력을 추가할 때 같은 트랜잭션에서 record_history()로 누계를 원자적으로 증감
+  (UPDATE ... SET total = total + :delta, 행이 없으면 생성, 동시 생성 시 갱신으로 재시도)
+- 집계 기준은 기존 SUM 쿼리와 같음: 적립 = 양수 금액 전체, 사용 = use 유형, 만료 = expire 유형
+  (사용/만료는 양수로 저장)
+
+재계산 (rebuild_point_summaries, scripts/rebuild_point_summaries.py):
+- user_id 구간 배치를 여러 스레드(각자 세션)로 병렬 처리
+- 배치의 누계 행을 먼저 잠근 뒤 이력을 집계하므로, 재계산 중 추가된 이력의 증감은
+  잠금이 풀린 뒤 재계산 값 위에 반영되어 누락되지 않는다
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Optional
+
+from sqlalchemy import case, func, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from core.database import SessionLocal, engine
+from .models import PointHistory, PointSummary, PointType
+from .schemas import PointSummaryRebuildResult
+
+TOTAL_COLUMNS = ("total_earned", "total_used", "total_expired")
+
+
+def history_deltas(point_type: str, amount: int) -> dict[str, int]:
+    """이력 1건이 누계에 더하는 값"""
+    return {
+        "total_earned": amount if amount > 0 else 0,
+        "total_used": -amount if point_type == PointType.USE.value else 0,
+        "total_expired": -amount if point_type == PointType.EXPIRE.value else 0,
+    }
+
+
+def _apply_deltas(db: Session, user_id: int, deltas: dict[str, int]) -> None:
+    """누계 행 증감, 없으면 생성 (동시 생성 시 증감으로 재시도)"""
+    changes = {name: delta for name, delta in deltas.items() if delta}
+    if not changes:
+        return
+
+    stmt = (
+        update(PointSummary)
+        .where(PointSummary.user_id == user_id)
+        .values({getattr(PointSummary, name): getattr(PointSummary, name) + delta for name, delta in changes.items()})
+    )
+    if db.execute(stmt, execution_options={"synchronize_session": False}).rowcount:
+        return
+    try:
+        with db.begin_nested():
+            db.add(PointSummary(user_id=user_id, **{name: deltas.get(name, 0) for name in TOTAL_COLUMNS}))
+    except IntegrityError:
+        db.execute(stmt, execution_options={"synchronize_session": False})
+
+
+def record_histories(db: Session, entries: Iterable[tuple[int, str, int]]) -> None:
+    """
+    이력 (user_id, type, amount) 목록을 누계에 반영 (커밋은 호출자가 수행)
+
+    이력 INSERT와 같은 트랜잭션에서 호출한다.
+    """
+    totals: dict[int, dict[str, int]] = {}
+    for user_id, point_type, amount in entries:
+        user_totals = totals.setdefault(user_id, dict.fromkeys(TOTAL_COLUMNS, 0))
+        for name, delta in history_deltas(point_type, amount).items():
+            user_totals[name] += delta
+    # 잠금 순서를 고정해 동시 반영 간 교착 방지
+    for user_id in sorted(totals):
+        _apply_deltas(db, user_id, totals[user_id])
+
+
+def record_history(db: Session, history: PointHistory) -> None:
+    """이력 1건을 누계에 반영 (커밋은 호출자가 수행)"""
+    record_histories(db, [(history.user_id, history.type, history.amount)])
+
+
+def record_uniform_histories(db: Session, user_ids: Iterable[int], point_type: str, amount: int) -> None:
+    """
+    사용자마다 같은 유형/금액의 이력 1건씩을 누계에 일괄 반영 (대량 지급용, 커밋은 호출자가 수행)
+
+    UPDATE ... WHERE user_id IN (...) 1회 + 없는 행 일괄 INSERT
+    """
+    deltas = history_deltas(point_type, amount)
+    changes = {name: delta for name, delta in deltas.items() if delta}
+    ids = sorted(set(user_ids))
+    if not changes or not ids:
+        return
+
+    stmt = (
+        update(PointSummary)
+        .where(PointSummary.user_id.in_(ids))
+        .values({getattr(PointSummary, name): getattr(PointSummary, name) + delta for name, delta in changes.items()})
+        .returning(PointSummary.user_id)
+    )
+    updated = set(db.execute(stmt, execution_options={"synchronize_session": False}).scalars())
+    missing = [user_id for user_id in ids if user_id not in updated]
+    if not missing:
+        return
+    try:
+        with db.begin_nested():
+            db.execute(insert(PointSummary), [{"user_id": user_id, **deltas} for user_id in missing])
+    except IntegrityError:
+        # 동시에 일부 행이 생성됨 -> 사용자별로 증감/생성
+        for user_id in missing:
+            _apply_deltas(db, user_id, deltas)
+
+
+def get_point_totals(db: Session, user_id: int) -> dict[str, int]:
+    """사용자 누계 (행이 없으면 0)"""
+    row = (
+        db.query(*(getattr(PointSummary, name) for name in TOTAL_COLUMNS))
+        .filter(PointSummary.user_id == user_id)
+        .first()
+    )
+    if row is None:
+        return dict.fromkeys(TOTAL_COLUMNS, 0)
+    return {name: value or 0 for name, value in zip(TOTAL_COLUMNS, row)}
+
+
+def _history_totals_query(db: Session):
+    return db.query(
+        PointHistory.user_id,
+        func.coalesce(func.sum(case((PointHistory.amount > 0, PointHistory.amount), else_=0)), 0),
+        func.coalesce(func.sum(case((PointHistory.type == PointType.USE.value, -PointHistory.amount), else_=0)), 0),
+        func.coalesce(func.sum(case((PointHistory.type == PointType.EXPIRE.value, -PointHistory.amount), else_=0)), 0),
+    ).group_by(PointHistory.user_id)
+
+
+def _rebuild_user(db: Session, user_id: int) -> None:
+    """사용자 1명 재계산 (누계 행 잠금 후 집계)"""
+    db.query(PointSummary.user_id).filter(PointSummary.user_id == user_id).with_for_update().first()
+    row = _history_totals_query(db).filter(PointHistory.user_id == user_id).first()
+    values = dict(zip(TOTAL_COLUMNS, row[1:])) if row else dict.fromkeys(TOTAL_COLUMNS, 0)
+    db.execute(
+        update(PointSummary).where(PointSummary.user_id == user_id).values(**values),
+        execution_options={"synchronize_session": False},
+    )
+
+
+def _rebuild_batch(bounds: tuple[int, int]) -> int:
+    """user_id [low, high) 구간 재계산, 재계산한 사용자 수 반환"""
+    low, high = bounds
+    db = SessionLocal()
+    try:
+        existing = set(
+            db.execute(
+                select(PointSummary.user_id)
+                .where(PointSummary.user_id >= low, PointSummary.user_id < high)
+                .with_for_update()
+            ).scalars()
+        )
+        rows = (
+            _history_totals_query(db)
+            .filter(PointHistory.user_id >= low, PointHistory.user_id < high)
+            .all()
+        )
+
+        updates, inserts = [], []
+        for user_id, *totals in rows:
+            values = {"user_id": user_id, **dict(zip(TOTAL_COLUMNS, totals))}
+            (updates if user_id in existing else inserts).append(values)
+        # 이력이 없는데 남아 있는 누계 행은 0으로
+        seen = {row[0] for row in rows}
+        updates.extend(
+            {"user_id": user_id, **dict.fromkeys(TOTAL_COLUMNS, 0)} for user_id in existing - seen
+        )
+
+        if updates:
+            # 기본 키 기준 ORM 일괄 UPDATE
+            db.execute(update(PointSummary), updates)
+        if inserts:
+            try:
+                with db.begin_nested():
+                    db.execute(insert(PointSummary), inserts)
+            except IntegrityError:
+                # 재계산 중 이력이 추가되어 같은 행이 먼저 생성됨 -> 사용자별로 다시 계산
+                for values in inserts:
+                    try:
+                        with db.begin_nested():
+                            db.execute(insert(PointSummary), [values])
+                    except IntegrityError:
+                        _rebuild_user(db, values["user_id"])
+
+        db.commit()
+        return len(rows)
+    finally:
+        db.close()
+
+
+def _user_id_bounds(db: Session) -> Optional[tuple[int, int]]:
+    from users.models import User
+
+    low, high = db.query(func.min(User.id), func.max(User.id)).one()
+    if low is None:
+        return None
+    return low, high
+
+
+def rebuild_point_summaries(workers: int = 4, batch_size: int = 1000) -> PointSummaryRebuildResult:
+    """
+    전체 사용자 누계 재계산
+
+    user_id를 batch_size 구간으로 나눈 배치를 workers개 스레드에서 병렬 처리한다.
+    SQLite는 동시 쓰기를 지원하지 않으므로 1개 스레드로 처리한다.
+    """
+    started = time.monotonic()
+    db = SessionLocal()
+    try:
+        bounds = _user_id_bounds(db)
+    finally:
+        db.close()
+
+    batches = []
+    if bounds is not None:
+        low, high = bounds
+        batches = [(start, start + batch_size) for start in range(low, high + 1, batch_size)]
+
+    if engine.dialect.name == "sqlite":
+        workers = 1
+
+    if workers <= 1 or len(batches) <= 1:
+        counts = [_rebuild_batch(batch) for batch in batches]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # 예외가 있으면 여기서 전파
+            counts = list(executor.map(_rebuild_batch, batches))
+
+    return PointSummaryRebuildResult(
+        users=sum(counts),
+        batches=len(batches),
+        elapsed_ms=int((time.monotonic() - started) * 1000),
+    )
@@ -0,0 +1,222 @@
+"""
+상품 비정규화 카운터 관리
+
+Product.sold_slot_count / bid_count는 product_slots에서 계산할 수 있는 값을
+조회 성능을 위해 상품 행에 저장해 둔 것이다.
+- 증감은 원자적 SQL 식(col = col + n)으로 처리해 동시 구매 시 갱신 손실을 막는다
+- 주기적으로 product_slots 기준으로 다시 계산해 어긋난 값을 보정한다
+
+기준 값:
+- sold_slot_count: 판매 완료(sold) 슬롯 수
+- bid_count: 판매 완료 슬롯의 서로 다른 결제(payment_id) 수
+"""
+
+from datetime import datetime, timezone
+from typing import Optional
+from sqlalchemy import case, distinct, exists, func, select, update
+from sqlalchemy.orm import Session
+
+from core.database import SessionLocal
+from .models import Product, ProductSlot, ProductStatus, SlotStatus
+from .schemas import CounterDrift, CounterReconcileResult
+
+# 결과에 포함할 최대 불일치 상세 건수
+MAX_REPORTED_DRIFTS = 100
+
+
+def _non_negative(expr):
+    return case((expr < 0, 0), else_=expr)
+
+
+def adjust_product_counters(
+    db: Session,
+    product_id: int,
+    sold_delta: int = 0,
+    bid_delta: int = 0,
+) -> None:
+    """
+    판매 슬롯 수/참여 수 원자적 증감 (커밋은 호출자가 수행)
+
+    판매 슬롯 수에 따라 상품 상태도 조건부 UPDATE로 맞춘다.
+    - 모든 슬롯 판매 시 active -> sold
+    - 판매 취소로 남은 슬롯이 생기면 sold -> active
+    """
+    values = {}
+    if sold_delta:
+        values["sold_slot_count"] = _non_negative(
+            func.coalesce(Product.sold_slot_count, 0) + sold_delta
+        )
+    if bid_delta:
+        values["bid_count"] = _non_negative(func.coalesce(Product.bid_count, 0) + bid_delta)
+    if not values:
+        return
+
+    db.execute(
+        update(Product).where(Product.id == product_id).values(**values),
+        execution_options={"synchronize_session": False},
+    )
+
+    if sold_delta > 0:
+        db.execute(
+            update(Product)
+            .where(
+                Product.id == product_id,
+                Product.status == ProductStatus.ACTIVE.value,
+                Product.sold_slot_count >= Product.slot_count,
+            )
+            .values(status=ProductStatus.SOLD.value),
+            execution_options={"synchronize_session": False},
+        )
+    elif sold_delta < 0:
+        db.execute(
+            update(Product)
+            .where(
+                Product.id == product_id,
+                Product.status == ProductStatus.SOLD.value,
+                Product.sold_slot_count < Product.slot_count,
+            )
+            .values(status=ProductStatus.ACTIVE.value),
+            execution_options={"synchronize_session": False},
+        )
+
+    # 세션에 로드된 상품은 DB 값으로 다시 읽도록 만료
+    product = db.identity_map.get(db.identity_key(Product, product_id))
+    if product is not None:
+        db.expire(product)
+
+
+def has_other_sold_slots(
+    db: Session,
+    product_id: int,
+    payment_id: Optional[int],
+    exclude_slot_id: int,
+) -> bool:
+    """같은 결제로 판매된 다른 슬롯이 있는지 (bid_count 증감 판단용)"""
+    if payment_id is None:
+        return False
+    return db.query(
+        exists().where(
+            ProductSlot.product_id == product_id,
+            ProductSlot.payment_id == payment_id,
+            ProductSlot.status == SlotStatus.SOLD.value,
+            ProductSlot.id != exclude_slot_id,
+        )
+    ).scalar()
+
+
+def _expected_counts(db: Session, product_ids: list[int]) -> dict[int, tuple[int, int]]:
+    """상품별 (판매 슬롯 수, 결제 수) 집계"""
+    rows = (
+        db.query(
+            ProductSlot.product_id,
+            func.count(ProductSlot.id),
+            func.count(distinct(ProductSlot.payment_id)),
+        )
+        .filter(
+            ProductSlot.product_id.in_(product_ids),
+            ProductSlot.status == SlotStatus.SOLD.value,
+        )
+        .group_by(ProductSlot.product_id)
+        .all()
+    )
+    return {product_id: (sold, bids) for product_id, sold, bids in rows}
+
+
+def reconcile_product_counters(
+    db: Session,
+    batch_size: int = 500,
+    dry_run: bool = False,
+) -> CounterReconcileResult:
+    """
+    product_slots 기준으로 카운터 재계산 및 보정
+
+    상품 ID 순서로 batch_size씩 나누어 처리한다.
+    보정은 상관 서브쿼리 UPDATE 한 번으로 수행해 계산과 반영 사이의
+    동시 구매도 반영되도록 한다.
+    """
+    from .service import invalidate_product_cache
+
+    started_at = datetime.now(timezone.utc)
+    result = CounterReconcileResult(dry_run=dry_run, started_at=started_at)
+
+    sold_subquery = (
+        select(func.count(ProductSlot.id))
+        .where(
+            ProductSlot.product_id == Product.id,
+            ProductSlot.status == SlotStatus.SOLD.value,
+        )
+        .scalar_subquery()
+    )
+    bid_subquery = (
+        select(func.count(distinct(ProductSlot.payment_id)))
+        .where(
+            ProductSlot.product_id == Product.id,
+            ProductSlot.status == SlotStatus.SOLD.value,
+        )
+        .scalar_subquery()
+    )
+
+    last_id = 0
+    while True:
+        rows = (
+            db.query(Product.id, Product.sold_slot_count, Product.bid_count)
+            .filter(Product.id > last_id)
+            .order_by(Product.id)
+            .limit(batch_size)
+            .all()
+        )
+        if not rows:
+            break
+        last_id = rows[-1].id
+        result.checked += len(rows)
+
+        expected = _expected_counts(db, [row.id for row in rows])
+        drifted_ids = []
+        for product_id, sold_slot_count, bid_count in rows:
+            expected_sold, expected_bids = expected.get(product_id, (0, 0))
+            if (sold_slot_count or 0) == expected_sold and (bid_count or 0) == expected_bids:
+                continue
+            drifted_ids.append(product_id)
+            if len(result.drifts) < MAX_REPORTED_DRIFTS:
+                result.drifts.append(
+                    CounterDrift(
+                        product_id=product_id,
+                        sold_slot_count=sold_slot_count or 0,
+                        expected_sold_slot_count=expected_sold,
+                        bid_count=bid_count or 0,
+                        expected_bid_count=expected_bids,
+                    )
+                )
+
+        result.drifted += len(drifted_ids)
+        if drifted_ids and not dry_run:
+            db.execute(
+                update(Product)
+                .where(Product.id.in_(drifted_ids))
+                .values(
+                    sold_slot_count=sold_subquery,
+                    bid_count=bid_subquery,
+                    updated_at=Product.updated_at,  # 보정은 수정 시각을 바꾸지 않음
+                ),
+                execution_options={"synchronize_session": False},
+            )
+            db.commit()
+            result.fixed += len(drifted_ids)
+            for product_id in drifted_ids:
+                invalidate_product_cache(product_id)
+
+    result.finished_at = datetime.now(timezone.utc)
+    return result
+
+
+def run_counter_reconciliation() -> None:
+    """백그라운드 작업용 진입점 (자체 세션 사용)"""
+    db = SessionLocal()
+    try:
+        result = reconcile_product_counters(db)
+        if result.drifted:
+            print(
+                f"[ProductCounters] {result.checked}개 상품 중 {result.drifted}개 불일치 보정"
+            )
+    finally:
+        db.close()
@@ -2,7 +2,7 @@
 상품 모델
 """
 
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, Numeric, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, Numeric, ForeignKey, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 import enum
@@ -85,6 +85,11 @@ class Product(Base):
     slots = relationship("ProductSlot", back_populates="product", cascade="all, delete-orphan")
     category_rel = relationship("Category", back_populates="products")
 
+    __table_args__ = (
+        # 커서 페이지네이션 (created_at, id) 키셋 인덱스
+        Index("ix_products_created_at_id", "created_at", "id"),
+    )
+
 
 class ProductImage(Base):
     """상품 이미지 테이블"""
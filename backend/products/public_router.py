@@ -3,27 +3,29 @@
 사용자 앱에서 사용하는 읽기 전용 엔드포인트
 """
 
-from fastapi import APIRouter, Depends, Query, HTTPException
+from fastapi import APIRouter, Depends, Query, HTTPException, Request
 from sqlalchemy.orm import Session
 from typing import Optional
 
 from core.database import get_db
-from common.responses import SuccessResponse, PaginatedResponse, PaginationMeta
+from core.cache import cached_response
+from common.responses import SuccessResponse, PaginationMeta
 from common.pagination import PaginationParams
 from .schemas import (
     ProductResponse,
-    ProductListResponse,
     ProductSearchParams,
+    ProductSearchResponse,
     SlotListResponse,
 )
-from .service import ProductService
+from .service import ProductService, product_cache_namespaces
 from .models import ProductStatus
 
 router = APIRouter(prefix="/public/products", tags=["상품 (공개)"])
 
 
-@router.get("", response_model=PaginatedResponse[ProductListResponse])
+@router.get("", response_model=ProductSearchResponse)
 async def get_public_product_list(
+    request: Request,
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
     title: Optional[str] = None,
@@ -31,16 +33,16 @@ async def get_public_product_list(
     category_id: Optional[int] = None,
     auction_type: Optional[str] = None,
     is_featured: Optional[bool] = None,
+    include_facets: bool = Query(False, description="카테고리/경매 유형별 개수 포함"),
     db: Session = Depends(get_db),
 ):
     """
     공개 상품 목록 조회 (활성 상품만)
-    인증 없이 접근 가능
+    인증 없이 접근 가능, title 검색 시 관련도순 정렬
     """
-    service = ProductService(db)
     pagination = PaginationParams(page=page, page_size=page_size)
     search = ProductSearchParams(
-        title=title,
+        title=title.strip() if title and title.strip() else None,
         category=category,
         category_id=category_id,
         status=ProductStatus.ACTIVE.value,  # 활성 상품만
@@ -49,23 +51,35 @@ async def get_public_product_list(
         seller_id=None,
     )
 
-    result = service.get_product_list(pagination, search)
-
-    return PaginatedResponse(
-        data=result.items,
-        meta=PaginationMeta(
-            page=result.page,
-            page_size=result.page_size,
-            total_count=result.total_count,
-            total_pages=result.total_pages,
-            has_next=result.has_next,
-            has_prev=result.has_prev,
-        ),
+    def build():
+        service = ProductService(db)
+        result = service.get_product_list(pagination, search)
+        facets = service.get_product_facets(search, include_status=False) if include_facets else None
+
+        return ProductSearchResponse(
+            data=result.items,
+            meta=PaginationMeta(
+                page=result.page,
+                page_size=result.page_size,
+                total_count=result.total_count,
+                total_pages=result.total_pages,
+                has_next=result.has_next,
+                has_prev=result.has_prev,
+            ),
+            facets=facets,
+        )
+
+    return cached_response(
+        request,
+        namespaces=product_cache_namespaces(),
+        params={**pagination.model_dump(), **search.model_dump(), "include_facets": include_facets},
+        build=build,
     )
 
 
 @router.get("/{product_id}", response_model=SuccessResponse[ProductResponse])
 async def get_public_product(
+    request: Request,
     product_id: int,
     db: Session = Depends(get_db),
 ):
@@ -73,18 +87,27 @@ async def get_public_product(
     공개 상품 상세 조회
     인증 없이 접근 가능, 활성 상품만 조회 가능
     """
-    service = ProductService(db)
-    product = service.get_product(product_id)
 
-    # 활성 상태가 아니면 404
-    if product.status != ProductStatus.ACTIVE.value:
-        raise HTTPException(status_code=404, detail="상품을 찾을 수 없습니다")
+    def build():
+        product = ProductService(db).get_product(product_id)
+
+        # 활성 상태가 아니면 404
+        if product.status != ProductStatus.ACTIVE.value:
+            raise HTTPException(status_code=404, detail="상품을 찾을 수 없습니다")
 
-    return SuccessResponse(data=product)
+        return SuccessResponse(data=product)
+
+    return cached_response(
+        request,
+        namespaces=product_cache_namespaces(product_id),
+        params={"view": "detail"},
+        build=build,
+    )
 
 
 @router.get("/{product_id}/slots", response_model=SuccessResponse[list[SlotListResponse]])
 async def get_public_product_slots(
+    request: Request,
     product_id: int,
     db: Session = Depends(get_db),
 ):
@@ -92,19 +115,29 @@ async def get_public_product_slots(
     공개 상품 슬롯 목록 조회
     인증 없이 접근 가능
     """
-    service = ProductService(db)
 
-    # 상품이 활성 상태인지 확인
-    product = service.get_product(product_id)
-    if product.status != ProductStatus.ACTIVE.value:
-        raise HTTPException(status_code=404, detail="상품을 찾을 수 없습니다")
+    def build():
+        service = ProductService(db)
+
+        # 상품이 활성 상태인지 확인
+        product = service.get_product(product_id)
+        if product.status != ProductStatus.ACTIVE.value:
+            raise HTTPException(status_code=404, detail="상품을 찾을 수 없습니다")
 
-    slots = service.get_product_slots(product_id)
-    return SuccessResponse(data=slots)
+        slots = service.get_product_slots(product_id)
+        return SuccessResponse(data=slots)
+
+    return cached_response(
+        request,
+        namespaces=product_cache_namespaces(product_id),
+        params={"view": "slots"},
+        build=build,
+    )
 
 
 @router.get("/{product_id}/slots/stats", response_model=SuccessResponse[dict])
 async def get_public_slot_stats(
+    request: Request,
     product_id: int,
     db: Session = Depends(get_db),
 ):
@@ -112,12 +145,21 @@ async def get_public_slot_stats(
     공개 상품 슬롯 통계
     인증 없이 접근 가능
     """
-    service = ProductService(db)
 
-    # 상품이 활성 상태인지 확인
-    product = service.get_product(product_id)
-    if product.status != ProductStatus.ACTIVE.value:
-        raise HTTPException(status_code=404, detail="상품을 찾을 수 없습니다")
+    def build():
+        service = ProductService(db)
+
+        # 상품이 활성 상태인지 확인
+        product = service.get_product(product_id)
+        if product.status != ProductStatus.ACTIVE.value:
+            raise HTTPException(status_code=404, detail="상품을 찾을 수 없습니다")
 
-    stats = service.get_slot_stats(product_id)
-    return SuccessResponse(data=stats)
+        stats = service.get_slot_stats(product_id)
+        return SuccessResponse(data=stats)
+
+    return cached_response(
+        request,
+        namespaces=product_cache_namespaces(product_id),
+        params={"view": "slot_stats"},
+        build=build,
+    )
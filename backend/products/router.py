@@ -8,8 +8,14 @@ from typing import Optional
 
 from core.database import get_db
 from core.security import get_current_admin
-from common.responses import SuccessResponse, PaginatedResponse, PaginationMeta
-from common.pagination import PaginationParams
+from common.responses import (
+    SuccessResponse,
+    PaginatedResponse,
+    PaginationMeta,
+    CursorPaginatedResponse,
+    CursorPaginationMeta,
+)
+from common.pagination import PaginationParams, CursorParams
 from .schemas import (
     ProductCreate,
     ProductUpdate,
@@ -20,8 +26,10 @@ from .schemas import (
     SlotListResponse,
     SlotPurchaseRequest,
     SlotUpdateRequest,
+    CounterReconcileResult,
 )
 from .service import ProductService
+from .counters import reconcile_product_counters
 
 router = APIRouter(prefix="/products", tags=["상품 관리"])
 
@@ -70,6 +78,56 @@ async def get_product_list(
     )
 
 
+@router.get("/cursor", response_model=CursorPaginatedResponse[ProductListResponse])
+async def get_product_cursor_list(
+    cursor: Optional[str] = None,
+    page_size: int = Query(20, ge=1, le=100),
+    include_total: bool = False,
+    approximate_total: bool = True,
+    title: Optional[str] = None,
+    category: Optional[str] = None,
+    category_id: Optional[int] = None,
+    status: Optional[str] = None,
+    auction_type: Optional[str] = None,
+    is_featured: Optional[bool] = None,
+    seller_id: Optional[int] = None,
+    current_admin: dict = Depends(get_current_admin),
+    db: Session = Depends(get_db),
+):
+    """
+    상품 목록 조회 (커서 기반)
+    """
+    service = ProductService(db)
+    params = CursorParams(
+        cursor=cursor,
+        page_size=page_size,
+        include_total=include_total,
+        approximate_total=approximate_total,
+    )
+    search = ProductSearchParams(
+        title=title,
+        category=category,
+        category_id=category_id,
+        status=status,
+        auction_type=auction_type,
+        is_featured=is_featured,
+        seller_id=seller_id,
+    )
+
+    result = service.get_product_cursor_list(params, search)
+
+    return CursorPaginatedResponse(
+        data=result.items,
+        meta=CursorPaginationMeta(
+            page_size=result.page_size,
+            next_cursor=result.next_cursor,
+            has_next=result.has_next,
+            total_count=result.total_count,
+            total_is_approximate=result.total_is_approximate,
+        ),
+    )
+
+
 @router.get("/stats", response_model=SuccessResponse[dict])
 async def get_product_stats(
     current_admin: dict = Depends(get_current_admin),
@@ -83,6 +141,19 @@ async def get_product_stats(
     return SuccessResponse(data=stats)
 
 
+@router.post("/counters/reconcile", response_model=SuccessResponse[CounterReconcileResult])
+async def reconcile_counters(
+    dry_run: bool = Query(False, description="불일치만 보고하고 보정하지 않음"),
+    current_admin: dict = Depends(get_current_admin),
+    db: Session = Depends(get_db),
+):
+    """
+    판매 슬롯 수/참여 수 카운터 재계산 (product_slots 기준)
+    """
+    result = reconcile_product_counters(db, dry_run=dry_run)
+    return SuccessResponse(data=result)
+
+
 @router.post("", response_model=SuccessResponse[ProductResponse])
 async def create_product(
     data: ProductCreate,
@@ -3,10 +3,12 @@
 """
 
 from pydantic import BaseModel
-from typing import Optional
+from typing import Optional, Union
 from datetime import datetime
 from decimal import Decimal
 
+from common.responses import PaginatedResponse
+
 
 class ProductCreate(BaseModel):
     """상품 생성"""
@@ -115,6 +117,28 @@ class ProductSearchParams(BaseModel):
     seller_id: Optional[int] = None
 
 
+class FacetCount(BaseModel):
+    """패싯 항목별 개수"""
+
+    value: Union[int, str]
+    label: Optional[str] = None  # 표시명 (카테고리명 등)
+    count: int
+
+
+class ProductFacets(BaseModel):
+    """상품 검색 패싯"""
+
+    categories: list[FacetCount] = []
+    auction_types: list[FacetCount] = []
+    statuses: list[FacetCount] = []
+
+
+class ProductSearchResponse(PaginatedResponse[ProductListResponse]):
+    """상품 검색 응답 (패싯 포함)"""
+
+    facets: Optional[ProductFacets] = None
+
+
 # ============================================
 # 슬롯 관련 스키마
 # ============================================
@@ -176,3 +200,30 @@ class SlotSearchParams(BaseModel):
     product_id: Optional[int] = None
     buyer_id: Optional[int] = None
     status: Optional[str] = None
+
+
+# ============================================
+# 카운터 정합성 관련 스키마
+# ============================================
+
+
+class CounterDrift(BaseModel):
+    """카운터 불일치 상품"""
+
+    product_id: int
+    sold_slot_count: int
+    expected_sold_slot_count: int
+    bid_count: int
+    expected_bid_count: int
+
+
+class CounterReconcileResult(BaseModel):
+    """카운터 재계산 결과"""
+
+    dry_run: bool = False
+    checked: int = 0  # 검사한 상품 수
+    drifted: int = 0  # 불일치 상품 수
+    fixed: int = 0  # 보정한 상품 수
+    drifts: list[CounterDrift] = []  # 불일치 상세 (최대 100건)
+    started_at: datetime
+    finished_at: Optional[datetime] = None
@@ -0,0 +1,121 @@
+"""
+상품 검색
+
+상품명 부분 일치 검색과 관련도 정렬을 제공한다.
+- PostgreSQL: pg_trgm GIN 인덱스를 사용하는 ILIKE 필터 + similarity() 정렬
+  (scripts/migrate_product_search.py로 확장/인덱스 생성)
+- 그 외(SQLite 등): 프로세스 내 n-gram 역색인 (common.search.NgramIndex)
+  + ILIKE 재확인, 색인은 백그라운드 작업(INDEX_TASK_NAME)에서 재생성
+"""
+
+from abc import ABC, abstractmethod
+from typing import Optional
+from sqlalchemy import func
+from sqlalchemy.orm import Query, Session
+
+from core.config import settings
+from common.search import BackgroundNgramIndex, NgramIndex, filter_by_candidates, order_by_candidates
+from .models import Product
+
+
+class ProductSearchBackend(ABC):
+    """상품 검색 백엔드 추상 베이스 클래스"""
+
+    @abstractmethod
+    def filter(self, query: Query, term: str) -> Query:
+        """검색어와 일치하는 상품만 남기도록 필터 적용"""
+        pass
+
+    @abstractmethod
+    def order_by_relevance(self, query: Query, term: str) -> Query:
+        """관련도 내림차순 정렬 추가"""
+        pass
+
+    def index_product(self, product_id: int, title: Optional[str]) -> None:
+        """상품 색인 갱신 (색인을 유지하는 백엔드만 구현)"""
+        pass
+
+    def remove_product(self, product_id: int) -> None:
+        """상품 색인 제거 (색인을 유지하는 백엔드만 구현)"""
+        pass
+
+
+class PostgresProductSearch(ProductSearchBackend):
+    """PostgreSQL pg_trgm 기반 상품 검색"""
+
+    def filter(self, query: Query, term: str) -> Query:
+        # gin_trgm_ops 인덱스가 있으면 '%term%' ILIKE도 인덱스를 사용한다
+        return query.filter(Product.title.ilike(f"%{term}%"))
+
+    def order_by_relevance(self, query: Query, term: str) -> Query:
+        return query.order_by(func.similarity(Product.title, term).desc())
+
+
+# 색인 재생성 백그라운드 작업 이름 (main.py에서 등록)
+INDEX_TASK_NAME = "product_search_index"
+
+
+def _build_product_index(db: Session) -> dict[str, NgramIndex]:
+    index = NgramIndex(n=2)
+    for product_id, title in db.query(Product.id, Product.title).yield_per(1000):
+        index.add(product_id, title)
+    return {"title": index}
+
+
+# 프로세스 공유 상품명 색인
+# 카운터 갱신 등 상품명 외 변경으로는 다시 만들지 않고, 같은 프로세스의 상품명 변경은
+# ProductService가 증분 반영, 다른 프로세스의 변경은 주기적 재생성으로 반영한다
+_product_ngram_index = BackgroundNgramIndex(INDEX_TASK_NAME, _build_product_index)
+
+
+def refresh_product_search_index_job() -> None:
+    """백그라운드 작업용 진입점 (검색이 있었을 때만 색인 재생성)"""
+    _product_ngram_index.refresh_if_requested()
+
+
+class NgramProductSearch(ProductSearchBackend):
+    """
+    인메모리 n-gram 역색인 기반 상품 검색 (SQLite 등)
+
+    색인으로 찾은 후보를 다른 조건(상태/카테고리 등)과 함께 거르고,
+    n-gram이 모두 들어 있지만 검색어를 그대로 포함하지 않는 상품은 ILIKE로 다시 확인해 제외한다.
+    색인이 아직 없거나 (첫 재생성 전) 후보가 너무 많으면 ILIKE만으로 검색한다
+    (common.search.filter_by_candidates).
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+        self._results: dict[str, Optional[list[tuple[int, float]]]] = {}
+
+    def _search(self, term: str) -> Optional[list[tuple[int, float]]]:
+        """색인 검색 결과 (점수 내림차순), 색인이 없으면 None"""
+        if term not in self._results:
+            indexes = _product_ngram_index.get()
+            self._results[term] = None if indexes is None else indexes["title"].search(term)
+        return self._results[term]
+
+    def filter(self, query: Query, term: str) -> Query:
+        return filter_by_candidates(query, Product.id, self._search(term), Product.title.ilike(f"%{term}%"))
+
+    def order_by_relevance(self, query: Query, term: str) -> Query:
+        return order_by_candidates(query, Product.id, self._search(term))
+
+    def index_product(self, product_id: int, title: Optional[str]) -> None:
+        _product_ngram_index.update(lambda indexes: indexes["title"].add(product_id, title))
+        self._results.clear()
+
+    def remove_product(self, product_id: int) -> None:
+        _product_ngram_index.update(lambda indexes: indexes["title"].remove(product_id))
+        self._results.clear()
+
+
+def get_product_search(db: Session) -> ProductSearchBackend:
+    """설정과 DB 종류에 따라 적절한 검색 백엔드 반환"""
+    backend = settings.SEARCH_BACKEND.lower()
+
+    if backend == "auto":
+        backend = "postgres" if db.get_bind().dialect.name == "postgresql" else "ngram"
+
+    if backend == "postgres":
+        return PostgresProductSearch()
+    return NgramProductSearch(db)
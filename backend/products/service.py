@@ -4,17 +4,24 @@
 
 from typing import Optional
 from datetime import datetime, timezone
-from sqlalchemy.orm import Session
+from sqlalchemy import func
+from sqlalchemy.orm import Session, joinedload
 
+from core.cache import response_cache
 from common.errors import NotFoundException, BadRequestException
-from common.pagination import Pagination, PaginationParams
+from common.pagination import Pagination, PaginationParams, CursorPagination, CursorParams
+from categories.models import Category
 from .models import Product, ProductSlot, ProductStatus, SlotStatus
+from .counters import adjust_product_counters, has_other_sold_slots
+from .search import ProductSearchBackend, get_product_search
 from .schemas import (
     ProductCreate,
     ProductUpdate,
     ProductResponse,
     ProductListResponse,
     ProductSearchParams,
+    FacetCount,
+    ProductFacets,
     SlotResponse,
     SlotListResponse,
     SlotPurchaseRequest,
@@ -23,11 +30,38 @@ from .schemas import (
 )
 
 
+def product_cache_namespaces(product_id: Optional[int] = None) -> list[str]:
+    """공개 상품 응답 캐시 네임스페이스 (product_id가 없으면 목록)"""
+    if product_id is None:
+        return ["products", "products:list"]
+    return ["products", f"products:{product_id}"]
+
+
+def invalidate_product_cache(product_id: Optional[int] = None) -> None:
+    """
+    공개 상품 응답 캐시 무효화
+
+    product_id가 있으면 목록과 해당 상품, 없으면 상품 캐시 전체를 무효화한다.
+    """
+    if product_id is None:
+        response_cache.invalidate("products")
+    else:
+        response_cache.invalidate("products:list", f"products:{product_id}")
+
+
 class ProductService:
     """상품 서비스"""
 
     def __init__(self, db: Session):
         self.db = db
+        self._search_backend: Optional[ProductSearchBackend] = None
+
+    @property
+    def search_backend(self) -> ProductSearchBackend:
+        """상품명 검색 백엔드 (pg_trgm 또는 인메모리 n-gram)"""
+        if self._search_backend is None:
+            self._search_backend = get_product_search(self.db)
+        return self._search_backend
 
     def create_product(self, data: ProductCreate) -> ProductResponse:
         """상품 생성 + 슬롯 자동 생성"""
@@ -64,8 +98,11 @@ class ProductService:
         self._create_slots(product.id, data.slot_count)
 
         self.db.commit()
+        invalidate_product_cache(product.id)
         self.db.refresh(product)
 
+        self.search_backend.index_product(product.id, product.title)
+
         return ProductResponse.model_validate(product)
 
     def _create_slots(self, product_id: int, slot_count: int) -> None:
@@ -82,18 +119,15 @@ class ProductService:
 
     def get_product(self, product_id: int) -> ProductResponse:
         """상품 상세 조회"""
-        product = self.db.query(Product).filter(Product.id == product_id).first()
+        product = (
+            self._query_with_category()
+            .filter(Product.id == product_id)
+            .first()
+        )
         if not product:
             raise NotFoundException(detail="상품을 찾을 수 없습니다")
 
-        # 카테고리명 조회
-        category_name = None
-        if product.category_id:
-            category_name = product.category_rel.name if product.category_rel else None
-
-        response = ProductResponse.model_validate(product)
-        response.category_name = category_name
-        return response
+        return self._to_response(product)
 
     def get_product_list(
         self,
@@ -101,46 +135,122 @@ class ProductService:
         search: Optional[ProductSearchParams] = None,
     ) -> Pagination[ProductListResponse]:
         """상품 목록 조회"""
-        query = self.db.query(Product)
-
-        # 검색 조건 적용
-        if search:
-            if search.title:
-                query = query.filter(Product.title.ilike(f"%{search.title}%"))
-            if search.category:
-                query = query.filter(Product.category == search.category)
-            if search.category_id:
-                query = query.filter(Product.category_id == search.category_id)
-            if search.status:
-                query = query.filter(Product.status == search.status)
-            if search.auction_type:
-                query = query.filter(Product.auction_type == search.auction_type)
-            if search.is_featured is not None:
-                query = query.filter(Product.is_featured == search.is_featured)
-            if search.seller_id:
-                query = query.filter(Product.seller_id == search.seller_id)
-
-        # 정렬 (최신순)
+        query = self._apply_search(self._query_with_category(), search)
+
+        # 정렬 (검색어가 있으면 관련도순, 그다음 최신순)
+        if search and search.title:
+            query = self.search_backend.order_by_relevance(query, search.title)
         query = query.order_by(Product.created_at.desc())
 
         # 페이지네이션
         result = Pagination.from_query(query, pagination)
 
-        # 카테고리명 포함한 응답 생성
-        items = []
-        for p in result.items:
-            item = ProductListResponse.model_validate(p)
-            if p.category_id and p.category_rel:
-                item.category_name = p.category_rel.name
-            items.append(item)
-
         return Pagination(
-            items=items,
+            items=[self._to_list_item(p) for p in result.items],
             total_count=result.total_count,
             page=result.page,
             page_size=result.page_size,
         )
 
+    def get_product_cursor_list(
+        self,
+        params: CursorParams,
+        search: Optional[ProductSearchParams] = None,
+    ) -> CursorPagination[ProductListResponse]:
+        """상품 목록 조회 (커서 기반, 최신순)"""
+        query = self._apply_search(self._query_with_category(), search)
+
+        result = CursorPagination.from_query(
+            query, params, sort_column=Product.created_at, id_column=Product.id
+        )
+        result.items = [self._to_list_item(p) for p in result.items]
+        return result
+
+    def get_product_facets(
+        self,
+        search: Optional[ProductSearchParams] = None,
+        include_status: bool = True,
+    ) -> ProductFacets:
+        """
+        상품 검색 패싯 (카테고리/경매 유형/상태별 개수)
+
+        각 패싯은 자기 자신의 필터를 제외한 나머지 조건으로 집계한다.
+        상태가 고정된 공개 목록은 include_status=False로 상태 패싯을 생략한다.
+        """
+        search = search or ProductSearchParams()
+
+        def facet_counts(column, exclude: dict) -> list:
+            query = self._apply_search(
+                self.db.query(column, func.count(Product.id)),
+                search.model_copy(update=exclude),
+            )
+            return query.group_by(column).order_by(func.count(Product.id).desc()).all()
+
+        category_rows = facet_counts(Product.category_id, {"category_id": None, "category": None})
+        category_ids = [category_id for category_id, _ in category_rows if category_id]
+        category_names = dict(
+            self.db.query(Category.id, Category.name).filter(Category.id.in_(category_ids)).all()
+        ) if category_ids else {}
+
+        return ProductFacets(
+            categories=[
+                FacetCount(value=category_id, label=category_names.get(category_id), count=count)
+                for category_id, count in category_rows
+                if category_id
+            ],
+            auction_types=[
+                FacetCount(value=value, count=count)
+                for value, count in facet_counts(Product.auction_type, {"auction_type": None})
+                if value
+            ],
+            statuses=[
+                FacetCount(value=value, count=count)
+                for value, count in facet_counts(Product.status, {"status": None})
+                if value
+            ] if include_status else [],
+        )
+
+    def _query_with_category(self):
+        """카테고리를 함께 로드하는 상품 쿼리 (행마다 지연 로딩 방지)"""
+        return self.db.query(Product).options(joinedload(Product.category_rel))
+
+    @staticmethod
+    def _to_response(product: Product) -> ProductResponse:
+        """카테고리명 포함 상세 응답 생성"""
+        response = ProductResponse.model_validate(product)
+        if product.category_id and product.category_rel:
+            response.category_name = product.category_rel.name
+        return response
+
+    @staticmethod
+    def _to_list_item(product: Product) -> ProductListResponse:
+        """카테고리명 포함 목록 응답 생성"""
+        item = ProductListResponse.model_validate(product)
+        if product.category_id and product.category_rel:
+            item.category_name = product.category_rel.name
+        return item
+
+    def _apply_search(self, query, search: Optional[ProductSearchParams]):
+        """검색 조건 적용"""
+        if not search:
+            return query
+
+        if search.title:
+            query = self.search_backend.filter(query, search.title)
+        if search.category:
+            query = query.filter(Product.category == search.category)
+        if search.category_id:
+            query = query.filter(Product.category_id == search.category_id)
+        if search.status:
+            query = query.filter(Product.status == search.status)
+        if search.auction_type:
+            query = query.filter(Product.auction_type == search.auction_type)
+        if search.is_featured is not None:
+            query = query.filter(Product.is_featured == search.is_featured)
+        if search.seller_id:
+            query = query.filter(Product.seller_id == search.seller_id)
+        return query
+
     def update_product(self, product_id: int, data: ProductUpdate) -> ProductResponse:
         """상품 수정"""
         product = self.db.query(Product).filter(Product.id == product_id).first()
@@ -159,16 +269,19 @@ class ProductService:
             setattr(product, field, value)
 
         self.db.commit()
-        self.db.refresh(product)
+        invalidate_product_cache(product_id)
 
-        # 카테고리명 포함 응답
-        category_name = None
-        if product.category_id and product.category_rel:
-            category_name = product.category_rel.name
+        if "title" in update_data:
+            self.search_backend.index_product(product_id, update_data["title"])
 
-        response = ProductResponse.model_validate(product)
-        response.category_name = category_name
-        return response
+        # 카테고리명 포함 응답 (카테고리와 함께 다시 로드)
+        product = (
+            self._query_with_category()
+            .filter(Product.id == product_id)
+            .populate_existing()
+            .first()
+        )
+        return self._to_response(product)
 
     def delete_product(self, product_id: int) -> bool:
         """상품 삭제"""
@@ -181,6 +294,9 @@ class ProductService:
 
         self.db.delete(product)
         self.db.commit()
+        invalidate_product_cache(product_id)
+
+        self.search_backend.remove_product(product_id)
 
         return True
 
@@ -195,6 +311,7 @@ class ProductService:
 
         product.status = ProductStatus.ACTIVE.value
         self.db.commit()
+        invalidate_product_cache(product_id)
         self.db.refresh(product)
 
         return ProductResponse.model_validate(product)
@@ -207,6 +324,7 @@ class ProductService:
 
         product.status = ProductStatus.CANCELLED.value
         self.db.commit()
+        invalidate_product_cache(product_id)
         self.db.refresh(product)
 
         return ProductResponse.model_validate(product)
@@ -219,29 +337,16 @@ class ProductService:
 
         product.is_featured = is_featured
         self.db.commit()
+        invalidate_product_cache(product_id)
         self.db.refresh(product)
 
         return ProductResponse.model_validate(product)
 
     def get_product_stats(self) -> dict:
-        """상품 통계"""
-        total = self.db.query(Product).count()
-        active = self.db.query(Product).filter(
-            Product.status == ProductStatus.ACTIVE.value
-        ).count()
-        pending = self.db.query(Product).filter(
-            Product.status == ProductStatus.PENDING.value
-        ).count()
-        sold = self.db.query(Product).filter(
-            Product.status == ProductStatus.SOLD.value
-        ).count()
+        """상품 통계 (대시보드 스냅샷에서 제공, 짧은 주기로 캐시됨)"""
+        from visitors.dashboard import get_dashboard_snapshot
 
-        return {
-            "total": total,
-            "active": active,
-            "pending": pending,
-            "sold": sold,
-        }
+        return get_dashboard_snapshot(self.db).products
 
     # ============================================
     # 슬롯 관련 메서드
@@ -308,6 +413,7 @@ class ProductService:
             slot.paid_price = product.slot_price
 
         self.db.commit()
+        invalidate_product_cache(product_id)
 
         # 슬롯 새로고침 및 반환
         result = []
@@ -326,19 +432,22 @@ class ProductService:
         if slot.status != SlotStatus.RESERVED.value:
             raise BadRequestException(detail="예약 상태의 슬롯만 구매 확정할 수 있습니다")
 
+        # 같은 결제의 첫 슬롯이면 참여 수도 증가
+        is_new_payment = not has_other_sold_slots(
+            self.db, slot.product_id, payment_id, exclude_slot_id=slot.id
+        )
+
         slot.status = SlotStatus.SOLD.value
         slot.payment_id = payment_id
         slot.purchased_at = datetime.now(timezone.utc)
 
-        # 상품의 판매 슬롯 수 업데이트
-        product = self.db.query(Product).filter(Product.id == slot.product_id).first()
-        product.sold_slot_count += 1
-
-        # 모든 슬롯이 판매되면 상품 상태 변경
-        if product.sold_slot_count >= product.slot_count:
-            product.status = ProductStatus.SOLD.value
+        # 상품의 판매 슬롯 수 업데이트 (모든 슬롯 판매 시 상태 변경)
+        adjust_product_counters(
+            self.db, slot.product_id, sold_delta=1, bid_delta=1 if is_new_payment else 0
+        )
 
         self.db.commit()
+        invalidate_product_cache(slot.product_id)
         self.db.refresh(slot)
 
         return SlotResponse.model_validate(slot)
@@ -358,12 +467,10 @@ class ProductService:
 
         # 판매된 슬롯이었으면 카운트 감소
         if was_sold:
-            product = self.db.query(Product).filter(Product.id == slot.product_id).first()
-            product.sold_slot_count = max(0, product.sold_slot_count - 1)
-            if product.status == ProductStatus.SOLD.value:
-                product.status = ProductStatus.ACTIVE.value
+            self._release_sold_slot(slot)
 
         self.db.commit()
+        invalidate_product_cache(slot.product_id)
         self.db.refresh(slot)
 
         return SlotResponse.model_validate(slot)
@@ -375,6 +482,8 @@ class ProductService:
             raise NotFoundException(detail="슬롯을 찾을 수 없습니다")
 
         was_sold = slot.status == SlotStatus.SOLD.value
+        if was_sold:
+            self._release_sold_slot(slot)
 
         slot.buyer_id = None
         slot.status = SlotStatus.AVAILABLE.value
@@ -385,17 +494,24 @@ class ProductService:
         slot.cancelled_at = None
         slot.buyer_note = None
 
-        if was_sold:
-            product = self.db.query(Product).filter(Product.id == slot.product_id).first()
-            product.sold_slot_count = max(0, product.sold_slot_count - 1)
-            if product.status == ProductStatus.SOLD.value:
-                product.status = ProductStatus.ACTIVE.value
-
         self.db.commit()
+        invalidate_product_cache(slot.product_id)
         self.db.refresh(slot)
 
         return SlotResponse.model_validate(slot)
 
+    def _release_sold_slot(self, slot: ProductSlot) -> None:
+        """판매 슬롯 취소/초기화 시 카운터 감소 (결제의 마지막 슬롯이면 참여 수도 감소)"""
+        is_last_of_payment = not has_other_sold_slots(
+            self.db, slot.product_id, slot.payment_id, exclude_slot_id=slot.id
+        )
+        adjust_product_counters(
+            self.db,
+            slot.product_id,
+            sold_delta=-1,
+            bid_delta=-1 if slot.payment_id is not None and is_last_of_payment else 0,
+        )
+
     def update_slot(self, slot_id: int, data: SlotUpdateRequest) -> SlotResponse:
         """슬롯 정보 수정 (관리자)"""
         slot = self.db.query(ProductSlot).filter(ProductSlot.id == slot_id).first()
@@ -408,6 +524,7 @@ class ProductService:
             slot.admin_note = data.admin_note
 
         self.db.commit()
+        invalidate_product_cache(slot.product_id)
         self.db.refresh(slot)
 
         return SlotResponse.model_validate(slot)
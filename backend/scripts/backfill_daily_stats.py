@@ -0,0 +1,31 @@
+"""
+일별 통계(daily_stats) 기간 재집계 스크립트
+
+Usage:
+    python scripts/backfill_daily_stats.py 2025-01-01 2025-12-31 --workers 4
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+from datetime import date
+
+from visitors.rollup import backfill_daily_stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="일별 통계 기간 재집계")
+    parser.add_argument("start_date", type=date.fromisoformat, help="시작일 (YYYY-MM-DD)")
+    parser.add_argument("end_date", type=date.fromisoformat, help="종료일 (YYYY-MM-DD, 포함)")
+    parser.add_argument("--workers", type=int, default=4, help="병렬 처리 스레드 수")
+    parser.add_argument("--chunk-days", type=int, default=7, help="스레드 하나가 처리할 날짜 묶음 크기")
+    args = parser.parse_args()
+
+    result = backfill_daily_stats(args.start_date, args.end_date, args.workers, args.chunk_days)
+    print(f"{len(result.updated_dates)}일 재집계 완료 ({result.elapsed_ms}ms)")
+
+
+if __name__ == "__main__":
+    main()
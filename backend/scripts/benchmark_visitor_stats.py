@@ -0,0 +1,171 @@
+"""
+방문자 통계 쿼리 벤치마크 스크립트
+
+visitors 테이블에 방문 기록을 채운 뒤(기본 100만 건, 최근 1년에 분산)
+기존 방식(date(visited_at) = 오늘, 지표별 쿼리 3개)과
+현재 방식(UTC 반개구간 + 단일 집계 쿼리, 대시보드 스냅샷의 방문자 집계와 같은 형태)의
+실행 시간과 실행 계획을 비교한다.
+
+운영 DB가 아닌 별도 DB에서 실행할 것 (기본: SQLite 파일)
+
+Usage:
+    python scripts/benchmark_visitor_stats.py
+    python scripts/benchmark_visitor_stats.py --database-url postgresql://.../bench --rows 1000000
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import random
+import statistics
+import time
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import case, create_engine, func, insert, text
+from sqlalchemy.orm import Session
+
+from common.dates import business_today, day_range
+from visitors.models import Visitor
+
+DEVICES = ["desktop", "mobile", "tablet"]
+
+
+def seed(engine, rows: int, batch_size: int = 10000) -> None:
+    """방문 기록이 rows건이 되도록 채움 (이미 있으면 부족한 만큼만)"""
+    Visitor.__table__.create(engine, checkfirst=True)
+    with engine.connect() as conn:
+        existing = conn.execute(text("SELECT COUNT(*) FROM visitors")).scalar()
+    remaining = rows - existing
+    if remaining <= 0:
+        print(f"기존 방문 기록 {existing:,}건 사용")
+        return
+
+    print(f"방문 기록 {remaining:,}건 생성 중...")
+    rng = random.Random(42)
+    now = datetime.now(timezone.utc)
+    started = time.perf_counter()
+    with engine.begin() as conn:
+        while remaining > 0:
+            count = min(batch_size, remaining)
+            conn.execute(
+                insert(Visitor.__table__),
+                [
+                    {
+                        "ip_address": f"10.0.{rng.randint(0, 255)}.{rng.randint(0, 255)}",
+                        "device_type": rng.choice(DEVICES),
+                        "page_url": "/",
+                        "session_id": f"s{rng.randint(0, 200000)}",
+                        "visited_at": now - timedelta(seconds=rng.randint(0, 365 * 86400)),
+                    }
+                    for _ in range(count)
+                ],
+            )
+            remaining -= count
+    print(f"생성 완료 ({time.perf_counter() - started:.1f}s)")
+
+
+def legacy_stats(db: Session) -> dict:
+    """
+    기존 방식: date() 비교, 지표별 쿼리
+
+    DB에 저장된 UTC 시각의 날짜와 비교하므로 업무 시간대 기준인 현재 방식과 집계 값이 다를 수 있다.
+    """
+    today = business_today()
+    today_count = db.query(Visitor).filter(func.date(Visitor.visited_at) == today).count()
+    today_unique = (
+        db.query(func.count(func.distinct(Visitor.session_id)))
+        .filter(func.date(Visitor.visited_at) == today)
+        .scalar()
+    )
+    devices = (
+        db.query(Visitor.device_type, func.count(Visitor.id))
+        .filter(func.date(Visitor.visited_at) == today)
+        .group_by(Visitor.device_type)
+        .all()
+    )
+    return {"today_visits": today_count, "today_unique": today_unique, "devices": dict(devices)}
+
+
+def current_stats(db: Session) -> dict:
+    """현재 방식: UTC 반개구간, 단일 조건부 집계"""
+    start, end = day_range(business_today())
+
+    def device_count(device_type: str):
+        return func.coalesce(func.sum(case((Visitor.device_type == device_type, 1), else_=0)), 0)
+
+    today_count, today_unique, desktop, mobile, tablet = (
+        db.query(
+            func.count(Visitor.id),
+            func.count(func.distinct(Visitor.session_id)),
+            device_count("desktop"),
+            device_count("mobile"),
+            device_count("tablet"),
+        )
+        .filter(Visitor.visited_at >= start, Visitor.visited_at < end)
+        .one()
+    )
+    return {
+        "today_visits": today_count,
+        "today_unique": today_unique,
+        "devices": {"desktop": desktop, "mobile": mobile, "tablet": tablet},
+    }
+
+
+def measure(name: str, fn, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - started) * 1000)
+    median = statistics.median(timings)
+    print(f"{name:<10} median {median:9.2f}ms  (min {min(timings):.2f}ms, max {max(timings):.2f}ms)")
+    return median
+
+
+def explain(engine, label: str, where: str, params: dict) -> None:
+    prefix = "EXPLAIN QUERY PLAN" if engine.dialect.name == "sqlite" else "EXPLAIN"
+    sql = f"{prefix} SELECT COUNT(*) FROM visitors WHERE {where}"
+    with engine.connect() as conn:
+        plan = [" ".join(str(col) for col in row) for row in conn.execute(text(sql), params)]
+    print(f"[{label}]")
+    for line in plan:
+        print(f"  {line}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="방문자 통계 쿼리 벤치마크")
+    parser.add_argument("--database-url", default="sqlite:///./benchmark_visitors.db")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    engine = create_engine(args.database_url)
+    seed(engine, args.rows)
+    with engine.connect() as conn:
+        if engine.dialect.name == "postgresql":
+            conn.execute(text("ANALYZE visitors"))
+        else:
+            conn.execute(text("ANALYZE"))
+        conn.commit()
+
+    with Session(engine) as db:
+        legacy = legacy_stats(db)
+        current = current_stats(db)
+        print(f"legacy  : {legacy}")
+        print(f"current : {current}")
+        print()
+
+        legacy_ms = measure("legacy", lambda: legacy_stats(db), args.repeat)
+        current_ms = measure("current", lambda: current_stats(db), args.repeat)
+        print(f"speedup    {legacy_ms / current_ms:.1f}x")
+        print()
+
+    start, end = day_range(business_today())
+    explain(engine, "legacy", "date(visited_at) = :today", {"today": business_today()})
+    explain(engine, "current", "visited_at >= :start AND visited_at < :end", {"start": start, "end": end})
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+포인트 만료 처리 스크립트
+
+백그라운드 작업(POINT_EXPIRY_INTERVAL)과 같은 처리를 직접 실행한다.
+작업이 POINT_EXPIRY_LOOKBACK_DAYS보다 오래 멈춰 있었으면 --since로 조회 기간을 넓혀 실행한다.
+
+Usage:
+    python scripts/expire_points.py --dry-run
+    python scripts/expire_points.py --since 2025-01-01 --workers 4
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+from datetime import datetime, timezone
+
+from points.expiry import run_point_expiry
+
+
+def _parse_datetime(value: str) -> datetime:
+    parsed = datetime.fromisoformat(value)
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="포인트 만료 처리")
+    parser.add_argument("--dry-run", action="store_true", help="기록하지 않고 만료 예정 합계만 출력")
+    parser.add_argument("--since", type=_parse_datetime, help="만료 시각이 이 시각 이후인 적립만 처리 (ISO 형식, 기본: 조회 기간 설정)")
+    parser.add_argument("--as-of", type=_parse_datetime, help="기준 시각 (ISO 형식, 기본: 현재)")
+    parser.add_argument("--workers", type=int, help="병렬 처리 스레드 수")
+    parser.add_argument("--chunk-size", type=int, help="트랜잭션 하나가 처리할 사용자 수")
+    args = parser.parse_args()
+
+    result = run_point_expiry(
+        as_of=args.as_of,
+        since=args.since,
+        dry_run=args.dry_run,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+    )
+    label = "만료 예정 (dry-run)" if result.dry_run else "만료 처리"
+    print(
+        f"{label}: 사용자 {result.users}명, {result.entries}건, {result.amount}포인트 "
+        f"({result.chunks}개 묶음, {result.elapsed_ms}ms)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+게시글 검색용 pg_trgm 확장/인덱스 마이그레이션 스크립트 (PostgreSQL 전용)
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+from core.database import engine
+
+
+def migrate():
+    """pg_trgm 확장 및 게시글 제목/본문/댓글 trigram GIN 인덱스 추가"""
+
+    if engine.dialect.name != "postgresql":
+        print("PostgreSQL이 아니므로 건너뜁니다 (인메모리 n-gram 검색 사용)")
+        return
+
+    # (인덱스명, 테이블, 컬럼)
+    indexes_to_add = [
+        ("ix_posts_title_trgm", "posts", "title"),
+        ("ix_posts_content_trgm", "posts", "content"),
+        ("ix_comments_content_trgm", "comments", "content"),
+    ]
+
+    with engine.connect() as conn:
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        print("Enabled extension: pg_trgm")
+
+        for index_name, table_name, column in indexes_to_add:
+            try:
+                conn.execute(text(
+                    f"CREATE INDEX IF NOT EXISTS {index_name} "
+                    f"ON {table_name} USING gin ({column} gin_trgm_ops)"
+                ))
+                print(f"Added index: {index_name}")
+            except Exception as e:
+                print(f"Index {index_name} may already exist or error: {e}")
+
+        conn.commit()
+        print("\nMigration completed!")
+
+
+if __name__ == "__main__":
+    migrate()
@@ -0,0 +1,37 @@
+"""
+커서(키셋) 페이지네이션용 복합 인덱스 마이그레이션 스크립트
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+from core.database import engine
+
+
+def migrate():
+    """(정렬 컬럼, id) 복합 인덱스 추가"""
+
+    # (인덱스명, 테이블, 컬럼)
+    indexes_to_add = [
+        ("ix_visitors_visited_at_id", "visitors", "visited_at, id"),
+        ("ix_point_histories_created_at_id", "point_histories", "created_at, id"),
+        ("ix_payments_created_at_id", "payments", "created_at, id"),
+        ("ix_products_created_at_id", "products", "created_at, id"),
+    ]
+
+    with engine.connect() as conn:
+        for index_name, table_name, columns in indexes_to_add:
+            try:
+                conn.execute(text(f"CREATE INDEX IF NOT EXISTS {index_name} ON {table_name} ({columns})"))
+                print(f"Added index: {index_name}")
+            except Exception as e:
+                print(f"Index {index_name} may already exist or error: {e}")
+
+        conn.commit()
+        print("\nMigration completed!")
+
+
+if __name__ == "__main__":
+    migrate()
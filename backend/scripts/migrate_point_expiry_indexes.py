@@ -0,0 +1,61 @@
+"""
+포인트 만료 처리용 컬럼/인덱스 마이그레이션 스크립트
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+from core.database import engine
+
+
+def migrate():
+    """만료 처리 시각 컬럼과 미처리 적립 조회용 부분 인덱스 추가"""
+
+    # (컬럼명, 타입)
+    columns_to_add = [
+        ("expiry_processed_at", "TIMESTAMP WITH TIME ZONE"),
+    ]
+
+    # (인덱스명, 테이블, 컬럼, 조건)
+    indexes_to_add = [
+        (
+            "ix_point_histories_expiry_pending",
+            "point_histories",
+            "expires_at",
+            "expires_at IS NOT NULL AND expiry_processed_at IS NULL",
+        ),
+    ]
+
+    # 미처리 적립 부분 인덱스로 대체된 인덱스
+    indexes_to_drop = ["ix_point_histories_expires_at"]
+
+    with engine.connect() as conn:
+        for column_name, column_type in columns_to_add:
+            try:
+                conn.execute(text(f"ALTER TABLE point_histories ADD COLUMN IF NOT EXISTS {column_name} {column_type}"))
+                print(f"Added column: {column_name}")
+            except Exception as e:
+                print(f"Column {column_name} may already exist or error: {e}")
+
+        for index_name, table_name, columns, where in indexes_to_add:
+            try:
+                conn.execute(text(f"CREATE INDEX IF NOT EXISTS {index_name} ON {table_name} ({columns}) WHERE {where}"))
+                print(f"Added index: {index_name}")
+            except Exception as e:
+                print(f"Index {index_name} may already exist or error: {e}")
+
+        for index_name in indexes_to_drop:
+            try:
+                conn.execute(text(f"DROP INDEX IF EXISTS {index_name}"))
+                print(f"Dropped index: {index_name}")
+            except Exception as e:
+                print(f"Index {index_name} may not exist or error: {e}")
+
+        conn.commit()
+        print("\nMigration completed!")
+
+
+if __name__ == "__main__":
+    migrate()
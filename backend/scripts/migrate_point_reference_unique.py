@@ -0,0 +1,54 @@
+"""
+포인트 이력 중복 반영 방지 유니크 인덱스 마이그레이션 스크립트
+
+(user_id, reason, reference_id) 유니크 인덱스 (reference_id가 있는 행만)를 추가한다.
+이미 중복된 이력이 있으면 인덱스를 만들 수 없으므로 목록을 출력하고 중단한다.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+from core.database import engine
+
+INDEX_NAME = "uq_point_histories_reference"
+
+
+def find_duplicates(conn) -> list:
+    return conn.execute(text("""
+        SELECT user_id, reason, reference_id, COUNT(*) AS count
+        FROM point_histories
+        WHERE reference_id IS NOT NULL
+        GROUP BY user_id, reason, reference_id
+        HAVING COUNT(*) > 1
+        ORDER BY user_id
+    """)).all()
+
+
+def migrate():
+    """reference_id 유니크 인덱스 추가"""
+
+    with engine.connect() as conn:
+        duplicates = find_duplicates(conn)
+        if duplicates:
+            print(f"Duplicate point histories found ({len(duplicates)}), resolve them before adding {INDEX_NAME}:")
+            for user_id, reason, reference_id, count in duplicates[:100]:
+                print(f"  user_id={user_id} reason={reason} reference_id={reference_id} count={count}")
+            return
+
+        try:
+            conn.execute(text(
+                f"CREATE UNIQUE INDEX IF NOT EXISTS {INDEX_NAME} "
+                "ON point_histories (user_id, reason, reference_id) WHERE reference_id IS NOT NULL"
+            ))
+            print(f"Added index: {INDEX_NAME}")
+        except Exception as e:
+            print(f"Index {INDEX_NAME} may already exist or error: {e}")
+
+        conn.commit()
+        print("\nMigration completed!")
+
+
+if __name__ == "__main__":
+    migrate()
@@ -0,0 +1,35 @@
+"""
+상품명 검색용 pg_trgm 확장/인덱스 마이그레이션 스크립트 (PostgreSQL 전용)
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+from core.database import engine
+
+
+def migrate():
+    """pg_trgm 확장 및 상품명 trigram GIN 인덱스 추가"""
+
+    if engine.dialect.name != "postgresql":
+        print("PostgreSQL이 아니므로 건너뜁니다 (인메모리 n-gram 검색 사용)")
+        return
+
+    with engine.connect() as conn:
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        print("Enabled extension: pg_trgm")
+
+        conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_products_title_trgm "
+            "ON products USING gin (title gin_trgm_ops)"
+        ))
+        print("Added index: ix_products_title_trgm")
+
+        conn.commit()
+        print("\nMigration completed!")
+
+
+if __name__ == "__main__":
+    migrate()
@@ -0,0 +1,36 @@
+"""
+일별 통계 집계용 인덱스 마이그레이션 스크립트
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+from core.database import engine
+
+
+def migrate():
+    """날짜 범위 집계/워터마크 조회용 인덱스 추가"""
+
+    # (인덱스명, 테이블, 컬럼)
+    indexes_to_add = [
+        ("ix_users_created_at", "users", "created_at"),
+        ("ix_payments_paid_at", "payments", "paid_at"),
+        ("ix_payments_updated_at", "payments", "updated_at"),
+    ]
+
+    with engine.connect() as conn:
+        for index_name, table_name, columns in indexes_to_add:
+            try:
+                conn.execute(text(f"CREATE INDEX IF NOT EXISTS {index_name} ON {table_name} ({columns})"))
+                print(f"Added index: {index_name}")
+            except Exception as e:
+                print(f"Index {index_name} may already exist or error: {e}")
+
+        conn.commit()
+        print("\nMigration completed!")
+
+
+if __name__ == "__main__":
+    migrate()
@@ -0,0 +1,162 @@
+"""
+visitors 테이블 월별 파티션 전환 스크립트 (PostgreSQL 전용)
+
+기존 visitors를 visitors_legacy로 이름을 바꾸고, 같은 컬럼의 RANGE(visited_at) 파티션 테이블을
+새로 만든 뒤 한 달씩 옮긴다 (DELETE ... RETURNING -> INSERT, 달마다 커밋).
+- 전환 직후부터 새 방문 기록은 파티션 테이블에 저장됨
+- 옮기는 도중 중단되어도 다시 실행하면 남은 분량부터 이어서 옮김
+- 기본 키는 파티션 키를 포함해야 하므로 (id, visited_at)
+
+SQLite 등은 유지보수 작업(visitors/partitions.py)이 월별 테이블 방식으로 자동 처리하므로 필요 없다.
+
+Usage:
+    python scripts/migrate_visitors_partitioning.py
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from core.config import settings
+from core.database import engine
+from common.dates import add_months, business_today, month_range, month_start, to_business_date
+from visitors.partitions import (
+    DEFAULT_PARTITION,
+    PARENT_TABLE,
+    PostgresVisitorPartitions,
+    partition_name,
+)
+from visitors.models import Visitor
+
+LEGACY_TABLE = "visitors_legacy"
+
+COLUMNS = [column.name for column in Visitor.__table__.columns]
+COLUMN_LIST = ", ".join(COLUMNS)
+NULL_SAFE_SELECT = ", ".join(
+    "COALESCE(visited_at, now())" if name == "visited_at" else name for name in COLUMNS
+)
+
+# (인덱스명, 컬럼) - 부모에 만들면 모든 파티션에 생성됨
+INDEXES = [
+    ("ix_visitors_id", "id"),
+    ("ix_visitors_visited_at", "visited_at"),
+    ("ix_visitors_visited_at_id", "visited_at, id"),
+    ("ix_visitors_session_id", "session_id"),
+    ("ix_visitors_user_id", "user_id"),
+]
+
+
+def _table_exists(db: Session, name: str) -> bool:
+    return db.execute(text("SELECT to_regclass(:name) IS NOT NULL"), {"name": name}).scalar()
+
+
+def convert(db: Session, partitions: PostgresVisitorPartitions) -> None:
+    """visitors -> visitors_legacy 이름 변경 후 파티션 테이블 생성 (한 트랜잭션)"""
+    db.execute(text(f"ALTER TABLE {PARENT_TABLE} RENAME TO {LEGACY_TABLE}"))
+
+    # 새 테이블과 이름이 겹치지 않도록 기존 인덱스/제약 이름 변경
+    index_names = db.execute(text(
+        "SELECT indexname FROM pg_indexes WHERE tablename = :table"
+    ), {"table": LEGACY_TABLE}).scalars().all()
+    for index_name in index_names:
+        if index_name == f"{PARENT_TABLE}_pkey":
+            db.execute(text(
+                f"ALTER TABLE {LEGACY_TABLE} RENAME CONSTRAINT {index_name} TO {LEGACY_TABLE}_pkey"
+            ))
+        else:
+            db.execute(text(f"ALTER INDEX {index_name} RENAME TO {index_name}_legacy"))
+
+    db.execute(text(
+        f"CREATE TABLE {PARENT_TABLE} (LIKE {LEGACY_TABLE} INCLUDING DEFAULTS) "
+        f"PARTITION BY RANGE (visited_at)"
+    ))
+    db.execute(text(f"ALTER TABLE {PARENT_TABLE} ALTER COLUMN visited_at SET NOT NULL"))
+    db.execute(text(f"ALTER TABLE {PARENT_TABLE} ADD PRIMARY KEY (id, visited_at)"))
+    for index_name, columns in INDEXES:
+        db.execute(text(f"CREATE INDEX {index_name} ON {PARENT_TABLE} ({columns})"))
+
+    # id 시퀀스 소유권을 새 테이블로 이전 (legacy 삭제 시 함께 삭제되지 않도록)
+    sequence = db.execute(
+        text("SELECT pg_get_serial_sequence(:table, 'id')"), {"table": LEGACY_TABLE}
+    ).scalar()
+    if sequence:
+        db.execute(text(f"ALTER SEQUENCE {sequence} OWNED BY {PARENT_TABLE}.id"))
+
+    db.execute(text(f"CREATE TABLE {DEFAULT_PARTITION} PARTITION OF {PARENT_TABLE} DEFAULT"))
+
+    current = month_start(business_today())
+    for offset in range(settings.VISITOR_PARTITION_MONTHS_AHEAD + 1):
+        partitions.create_partition(add_months(current, offset))
+    db.commit()
+    print(f"Converted: {PARENT_TABLE} -> partitioned ({LEGACY_TABLE} kept for copying)")
+
+
+def copy_legacy(db: Session, partitions: PostgresVisitorPartitions) -> None:
+    """visitors_legacy의 행을 한 달씩 파티션 테이블로 이동"""
+    oldest, newest = db.execute(text(
+        f"SELECT MIN(visited_at), MAX(visited_at) FROM {LEGACY_TABLE}"
+    )).one()
+
+    if oldest is not None:
+        month = month_start(to_business_date(oldest))
+        last = month_start(to_business_date(newest))
+        while month <= last:
+            start, end = month_range(month)
+            partitions.create_partition(month)
+            moved = db.execute(text(
+                f"WITH moved AS (DELETE FROM {LEGACY_TABLE} "
+                f"WHERE visited_at >= :start AND visited_at < :end RETURNING *) "
+                f"INSERT INTO {PARENT_TABLE} ({COLUMN_LIST}) SELECT {COLUMN_LIST} FROM moved"
+            ), {"start": start, "end": end}).rowcount
+            db.commit()
+            print(f"Moved {moved} rows -> {partition_name(month)}")
+            month = add_months(month, 1)
+
+    # 시각이 없는 행은 파티션 키가 필요하므로 현재 시각으로 채워 옮김
+    moved = db.execute(text(
+        f"WITH moved AS (DELETE FROM {LEGACY_TABLE} WHERE visited_at IS NULL RETURNING *) "
+        f"INSERT INTO {PARENT_TABLE} ({COLUMN_LIST}) SELECT {NULL_SAFE_SELECT} FROM moved"
+    )).rowcount
+    db.commit()
+    if moved:
+        print(f"Moved {moved} rows without visited_at")
+
+    remaining = db.execute(text(f"SELECT COUNT(*) FROM {LEGACY_TABLE}")).scalar()
+    if remaining:
+        print(f"{LEGACY_TABLE}에 옮기지 못한 행 {remaining}건이 남아 있어 테이블을 유지합니다")
+        return
+
+    db.execute(text(f"DROP TABLE {LEGACY_TABLE}"))
+    db.commit()
+    print(f"Dropped {LEGACY_TABLE}")
+
+
+def migrate():
+    """visitors 월별 RANGE 파티션 전환"""
+
+    if engine.dialect.name != "postgresql":
+        print("PostgreSQL이 아니므로 건너뜁니다 (월별 테이블 방식은 유지보수 작업이 자동 처리)")
+        return
+
+    with Session(engine) as db:
+        partitions = PostgresVisitorPartitions(db)
+        if not partitions.is_partitioned():
+            convert(db, partitions)
+        else:
+            print(f"{PARENT_TABLE} is already partitioned")
+
+        if _table_exists(db, LEGACY_TABLE):
+            copy_legacy(db, partitions)
+
+        created = partitions.prepare(business_today())
+        for name in created:
+            print(f"Created partition: {name}")
+
+        print("\nMigration completed!")
+
+
+if __name__ == "__main__":
+    migrate()
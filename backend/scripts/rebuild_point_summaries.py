@@ -0,0 +1,35 @@
+"""
+사용자별 포인트 누계(user_point_summaries) 재계산 스크립트
+
+누계 테이블 도입 직후 한 번 실행해 기존 이력을 채우고, 이후에는 불일치가 의심될 때 실행한다.
+서비스 운영 중에 실행해도 된다 (배치 단위로 누계 행을 잠그고 재계산).
+
+Usage:
+    python scripts/rebuild_point_summaries.py --workers 4 --batch-size 1000
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+
+from core.database import init_db
+from points.summary import rebuild_point_summaries
+
+
+def main():
+    parser = argparse.ArgumentParser(description="사용자별 포인트 누계 재계산")
+    parser.add_argument("--workers", type=int, default=4, help="병렬 처리 스레드 수")
+    parser.add_argument("--batch-size", type=int, default=1000, help="배치 하나가 처리할 user_id 구간 크기")
+    args = parser.parse_args()
+
+    # 누계 테이블이 없으면 생성
+    init_db()
+
+    result = rebuild_point_summaries(args.workers, args.batch_size)
+    print(f"사용자 {result.users}명 재계산 완료 ({result.batches}개 배치, {result.elapsed_ms}ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+테스트 공통 설정
+
+core.database가 import 시점에 엔진을 만들므로, 앱 모듈을 import하기 전에 임시 SQLite 파일로
+DATABASE_URL을 지정한다. 테스트마다 테이블을 새로 만든다.
+"""
+
+import os
+import tempfile
+
+_db_dir = tempfile.mkdtemp(prefix="auction-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_db_dir, 'test.db')}"
+
+import pytest
+from sqlalchemy import event
+
+from core.database import Base, SessionLocal, engine, init_db
+
+
+@pytest.fixture
+def db():
+    """빈 테이블로 시작하는 세션"""
+    init_db()
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+        Base.metadata.drop_all(bind=engine)
+
+
+class StatementCounter:
+    """실행된 SQL 문 수 집계"""
+
+    def __init__(self):
+        self.statements: list[str] = []
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def reset(self) -> None:
+        self.statements = []
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+
+@pytest.fixture
+def statement_counter():
+    """before_cursor_execute로 실행 SQL 문 수를 세는 카운터"""
+    counter = StatementCounter()
+    event.listen(engine, "before_cursor_execute", counter._on_execute)
+    try:
+        yield counter
+    finally:
+        event.remove(engine, "before_cursor_execute", counter._on_execute)
@@ -0,0 +1,66 @@
+"""
+게시글 본문(HTML) 금칙어 처리 (태그/속성은 검사하거나 바꾸지 않고 텍스트 노드만)
+"""
+
+import pytest
+
+from boards.config import BoardsPluginConfig
+from boards.models import Board, Post
+from boards.schemas import PostCreate
+from boards.service import BoardService
+from common.errors import BadRequestException
+from forbidden_words.matcher import invalidate_matchers
+from forbidden_words.models import ForbiddenWord, ForbiddenWordType, ModerationMatch
+from forbidden_words.moderation import run_moderation_scan
+from users.models import User
+
+CONTENT = '<p class="note">a pass &amp; <b>bass</b></p><img src="/static/uploads/images/glass.png">'
+HARMLESS = '<p class="note">hello</p><img src="/static/uploads/images/glass.png">'
+
+
+def _seed(db) -> int:
+    db.add(User(id=1, email="writer@example.com", name="writer"))
+    board = Board(name="free", title="자유게시판")
+    db.add(board)
+    db.add(ForbiddenWord(word="ass", match_type=ForbiddenWordType.CONTAINS.value))
+    db.commit()
+    invalidate_matchers()
+    return board.id
+
+
+def _create(db, board_id: int, content: str, action: str = "filter") -> Post:
+    service = BoardService(db, config=BoardsPluginConfig(forbidden_word_action=action))
+    response = service.create_post(PostCreate(board_id=board_id, title="제목", content=content), author_id=1)
+    return db.get(Post, response.id)
+
+
+def test_filter_replaces_only_text_nodes(db):
+    board_id = _seed(db)
+
+    post = _create(db, board_id, CONTENT)
+
+    assert post.content == (
+        '<p class="note">a p*** &amp; <b>b***</b></p><img src="/static/uploads/images/glass.png">'
+    )
+
+
+def test_reject_ignores_markup(db):
+    board_id = _seed(db)
+
+    post = _create(db, board_id, HARMLESS, action="reject")
+    assert post.content == HARMLESS
+
+    with pytest.raises(BadRequestException):
+        _create(db, board_id, CONTENT, action="reject")
+
+
+def test_rescan_ignores_markup(db):
+    board_id = _seed(db)
+    _create(db, board_id, HARMLESS, action="off")
+    matched = _create(db, board_id, CONTENT, action="off")
+
+    run_moderation_scan(db, throttle=0, max_seconds=0)
+
+    rows = db.query(ModerationMatch.content_id, ModerationMatch.field).all()
+    # 제목은 일치 없음, 태그 속성에만 일치가 있는 게시글은 결과에 없음
+    assert rows == [(matched.id, "content")]
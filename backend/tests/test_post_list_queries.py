@@ -0,0 +1,61 @@
+"""
+게시글 목록 조회 SQL 문 수 (작성자/이미지/첨부/좋아요 여부로 행마다 쿼리가 늘지 않는지)
+"""
+
+from boards.models import Board, Post, PostAttachment, PostImage, PostLike
+from boards.schemas import PostSearchParams
+from boards.service import BoardService
+from common.pagination import PaginationParams
+from users.models import User
+
+
+def _seed(db, count: int) -> tuple[int, int]:
+    board = Board(name="free", title="자유게시판")
+    db.add(board)
+    # 게시글마다 다른 작성자 -> 작성자를 지연 로딩하면 행 수만큼 쿼리가 늘어남
+    users = [User(email=f"user{i}@example.com", name=f"작성자{i}") for i in range(count)]
+    db.add_all(users)
+    db.flush()
+
+    posts = [
+        Post(board_id=board.id, author_id=users[i].id, title=f"안녕하세요 {i}", content=f"<p>본문 {i}</p>")
+        for i in range(count)
+    ]
+    db.add_all(posts)
+    db.flush()
+    for post in posts:
+        db.add(PostImage(post_id=post.id, image_url=f"/static/uploads/images/{post.id}.png"))
+        db.add(PostAttachment(post_id=post.id, file_url=f"/static/uploads/attachments/{post.id}.txt",
+                              original_filename=f"{post.id}.txt", file_size=10))
+        db.add(PostLike(post_id=post.id, user_id=users[0].id))
+    db.commit()
+    return board.id, users[0].id
+
+
+def _count_list_statements(db, statement_counter, board_id: int, page_size: int, **kwargs) -> int:
+    db.expunge_all()
+    statement_counter.reset()
+    result = BoardService(db).get_post_list(board_id, PaginationParams(page=1, page_size=page_size), **kwargs)
+    assert len(result.items) == page_size
+    assert all(item.author_name and item.has_images and item.has_attachments for item in result.items)
+    return statement_counter.count
+
+
+def test_post_list_statement_count_is_constant(db, statement_counter):
+    board_id, user_id = _seed(db, 50)
+
+    small = _count_list_statements(db, statement_counter, board_id, 5, current_user_id=user_id)
+    large = _count_list_statements(db, statement_counter, board_id, 50, current_user_id=user_id)
+
+    assert small == large
+
+
+def test_post_search_statement_count_is_constant(db, statement_counter):
+    # 검색 요청 안에서 색인을 만들지 않으므로 첫 검색도 같은 SQL 문 수
+    board_id, _ = _seed(db, 50)
+    search = PostSearchParams(q="안녕")
+
+    small = _count_list_statements(db, statement_counter, board_id, 5, search=search)
+    large = _count_list_statements(db, statement_counter, board_id, 50, search=search)
+
+    assert small == large
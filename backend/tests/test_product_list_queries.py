@@ -0,0 +1,46 @@
+"""
+상품 목록 조회 SQL 문 수 (카테고리 지연 로딩으로 행마다 쿼리가 늘지 않는지)
+"""
+
+from categories.models import Category
+from common.pagination import PaginationParams
+from products.models import Product
+from products.service import ProductService
+from users.models import User
+
+
+def _seed(db, count: int) -> None:
+    db.add(User(id=1, email="seller@example.com", name="seller"))
+    # 상품마다 다른 카테고리 -> 지연 로딩이면 행 수만큼 쿼리가 늘어남
+    categories = [Category(name=f"카테고리{i}", slug=f"category-{i}") for i in range(count)]
+    db.add_all(categories)
+    db.flush()
+    db.add_all([
+        Product(
+            seller_id=1,
+            title=f"상품 {i}",
+            starting_price=1000,
+            current_price=1000,
+            category_id=categories[i].id,
+        )
+        for i in range(count)
+    ])
+    db.commit()
+
+
+def _count_list_statements(db, statement_counter, page_size: int) -> int:
+    db.expunge_all()
+    statement_counter.reset()
+    result = ProductService(db).get_product_list(PaginationParams(page=1, page_size=page_size))
+    assert len(result.items) == page_size
+    assert all(item.category_name for item in result.items)
+    return statement_counter.count
+
+
+def test_product_list_statement_count_is_constant(db, statement_counter):
+    _seed(db, 100)
+
+    small = _count_list_statements(db, statement_counter, 10)
+    large = _count_list_statements(db, statement_counter, 100)
+
+    assert small == large
@@ -88,7 +88,7 @@ class User(Base):
 
     # === 타임스탬프 ===
     last_login_at = Column(DateTime(timezone=True), nullable=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)  # 일별 가입 통계
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
     # === 관계 ===
@@ -137,27 +137,7 @@ class UserService:
         return True
 
     def get_user_count(self) -> dict:
-        """사용자 통계"""
-        total = self.db.query(User).filter(
-            User.status != UserStatus.DELETED.value
-        ).count()
-        active = self.db.query(User).filter(
-            User.status == UserStatus.ACTIVE.value
-        ).count()
-        inactive = self.db.query(User).filter(
-            User.status == UserStatus.INACTIVE.value
-        ).count()
-        suspended = self.db.query(User).filter(
-            User.status == UserStatus.SUSPENDED.value
-        ).count()
-        banned = self.db.query(User).filter(
-            User.status == UserStatus.BANNED.value
-        ).count()
-
-        return {
-            "total": total,
-            "active": active,
-            "inactive": inactive,
-            "suspended": suspended,
-            "banned": banned,
-        }
+        """사용자 통계 (대시보드 스냅샷에서 제공, 짧은 주기로 캐시됨)"""
+        from visitors.dashboard import get_dashboard_snapshot
+
+        return get_dashboard_snapshot(self.db).users
@@ -0,0 +1,299 @@
+"""
+관리자 대시보드 스냅샷
+
+대시보드 요약과 각 모듈의 관리자 통계(회원/상품/결제/포인트/게시판/방문자)를 한 번에 계산해 캐시한다.
+- 테이블별 조건부 집계 서브쿼리를 하나의 SELECT로 묶어 한 번의 왕복으로 조회
+  (+ 오늘/어제 daily_stats, 오늘 고유 방문자 스케치)
+- 캐시 (프로세스별):
+  - DASHBOARD_SNAPSHOT_TTL 이내: 캐시된 스냅샷 그대로 반환
+  - 그 후 DASHBOARD_SNAPSHOT_STALE_TTL까지: 이전 스냅샷을 반환하고 백그라운드 작업으로 갱신
+    (stale-while-revalidate, 동시에 여러 요청이 와도 갱신은 한 번)
+  - 그 이후 또는 스냅샷이 없으면: 요청 안에서 계산 (동시 요청은 잠금으로 한 번만 계산)
+- 대시보드를 보는 사람이 없으면 갱신하지 않는다
+
+Example:
+    snapshot = get_dashboard_snapshot(db)
+    snapshot.users["total"]
+"""
+
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy import case, func, select, true
+from sqlalchemy.orm import Session
+
+from core.config import settings
+from core.database import SessionLocal
+from common.dates import business_today, day_range
+from .models import DailyStats, Visitor
+from .schemas import DashboardSnapshot, DashboardSummary
+from .sketches import count_unique_visitors
+
+# 백그라운드 작업 이름 (main.py에서 등록)
+SNAPSHOT_TASK_NAME = "dashboard_snapshot"
+
+
+def _count_if(condition):
+    return func.coalesce(func.sum(case((condition, 1), else_=0)), 0)
+
+
+def _sum_if(condition, column):
+    return func.coalesce(func.sum(case((condition, column), else_=0)), 0)
+
+
+def _change(today_val, yesterday_val) -> float:
+    if yesterday_val == 0:
+        return 100.0 if today_val > 0 else 0.0
+    return round((today_val - yesterday_val) / yesterday_val * 100, 1)
+
+
+def _aggregate_row(db: Session, start: datetime, end: datetime):
+    """테이블별 집계를 하나의 SELECT로 조회 (집계 서브쿼리 1행끼리 결합)"""
+    from users.models import User, UserStatus
+    from products.models import Product, ProductStatus
+    from payments.models import Payment, PaymentStatus
+    from points.models import PointSummary
+    from boards.models import Board, Post, PostStatus
+
+    users = select(
+        _count_if(User.status != UserStatus.DELETED.value).label("users_total"),
+        _count_if(User.status == UserStatus.ACTIVE.value).label("users_active"),
+        _count_if(User.status == UserStatus.INACTIVE.value).label("users_inactive"),
+        _count_if(User.status == UserStatus.SUSPENDED.value).label("users_suspended"),
+        _count_if(User.status == UserStatus.BANNED.value).label("users_banned"),
+        func.coalesce(func.sum(User.point_balance), 0).label("points_circulation"),
+    ).subquery()
+
+    products = select(
+        func.count(Product.id).label("products_total"),
+        _count_if(Product.status == ProductStatus.ACTIVE.value).label("products_active"),
+        _count_if(Product.status == ProductStatus.PENDING.value).label("products_pending"),
+        _count_if(Product.status == ProductStatus.SOLD.value).label("products_sold"),
+    ).subquery()
+
+    completed = Payment.status == PaymentStatus.COMPLETED.value
+    paid_today = completed & (Payment.paid_at >= start) & (Payment.paid_at < end)
+    payments = (
+        select(
+            _sum_if(completed, Payment.paid_amount).label("payments_total_amount"),
+            _sum_if(paid_today, Payment.paid_amount).label("payments_today_amount"),
+            _count_if(completed).label("payments_total_count"),
+            _count_if(Payment.status == PaymentStatus.PENDING.value).label("payments_pending_count"),
+        )
+        .where(Payment.status.in_([PaymentStatus.COMPLETED.value, PaymentStatus.PENDING.value]))
+        .subquery()
+    )
+
+    # 포인트 누계는 이력 전체 대신 사용자별 누계 테이블에서 합산
+    points = select(
+        func.coalesce(func.sum(PointSummary.total_earned), 0).label("points_earned"),
+        func.coalesce(func.sum(PointSummary.total_used), 0).label("points_used"),
+    ).subquery()
+
+    boards = select(
+        func.count(Board.id).label("boards_total"),
+        _count_if(Board.is_active == True).label("boards_active"),
+    ).subquery()
+
+    published = Post.status == PostStatus.PUBLISHED.value
+    posts = (
+        select(
+            func.count(Post.id).label("posts_total"),
+            _count_if((Post.created_at >= start) & (Post.created_at < end)).label("posts_today"),
+        )
+        .where(published)
+        .subquery()
+    )
+
+    visitors = (
+        select(
+            func.count(Visitor.id).label("visits_today"),
+            _count_if(Visitor.device_type == "desktop").label("visits_desktop"),
+            _count_if(Visitor.device_type == "mobile").label("visits_mobile"),
+            _count_if(Visitor.device_type == "tablet").label("visits_tablet"),
+        )
+        .where(Visitor.visited_at >= start, Visitor.visited_at < end)
+        .subquery()
+    )
+
+    parts = [users, products, payments, points, boards, posts, visitors]
+    joined = parts[0]
+    for part in parts[1:]:
+        joined = joined.join(part, true())
+    columns = [column for part in parts for column in part.c]
+    return db.execute(select(*columns).select_from(joined)).one()
+
+
+def build_dashboard_snapshot(db: Session) -> DashboardSnapshot:
+    """스냅샷 계산 (캐시 없이)"""
+    today = business_today()
+    yesterday = today - timedelta(days=1)
+    start, end = day_range(today)
+
+    row = _aggregate_row(db, start, end)
+
+    stats_by_date = {
+        s.date: s for s in db.query(DailyStats).filter(DailyStats.date.in_([today, yesterday]))
+    }
+    today_stats = stats_by_date.get(today)
+    yesterday_stats = stats_by_date.get(yesterday)
+
+    def daily(stats: Optional[DailyStats], field: str) -> int:
+        return (getattr(stats, field) or 0) if stats else 0
+
+    today_unique = count_unique_visitors(db, today, today) if row.visits_today else None
+
+    summary = DashboardSummary(
+        today_visits=daily(today_stats, "total_visits"),
+        today_unique_visitors=daily(today_stats, "unique_visitors"),
+        today_signups=daily(today_stats, "new_signups"),
+        today_revenue=daily(today_stats, "total_revenue"),
+        visits_change=_change(daily(today_stats, "total_visits"), daily(yesterday_stats, "total_visits")),
+        visitors_change=_change(
+            daily(today_stats, "unique_visitors"), daily(yesterday_stats, "unique_visitors")
+        ),
+        signups_change=_change(daily(today_stats, "new_signups"), daily(yesterday_stats, "new_signups")),
+        revenue_change=_change(daily(today_stats, "total_revenue"), daily(yesterday_stats, "total_revenue")),
+        total_users=row.users_total,
+        total_products=row.products_total,
+        total_orders=row.payments_total_count,
+    )
+
+    return DashboardSnapshot(
+        generated_at=datetime.now(timezone.utc),
+        summary=summary,
+        users={
+            "total": row.users_total,
+            "active": row.users_active,
+            "inactive": row.users_inactive,
+            "suspended": row.users_suspended,
+            "banned": row.users_banned,
+        },
+        products={
+            "total": row.products_total,
+            "active": row.products_active,
+            "pending": row.products_pending,
+            "sold": row.products_sold,
+        },
+        payments={
+            "total_amount": float(row.payments_total_amount),
+            "today_amount": float(row.payments_today_amount),
+            "total_count": row.payments_total_count,
+            "pending_count": row.payments_pending_count,
+        },
+        points={
+            "total_circulation": row.points_circulation,
+            "total_earned": row.points_earned,
+            "total_used": row.points_used,
+        },
+        boards={
+            "total": row.boards_total,
+            "active": row.boards_active,
+            "inactive": row.boards_total - row.boards_active,
+            "total_posts": row.posts_total,
+            "today_posts": row.posts_today,
+        },
+        visitors={
+            "today_visits": row.visits_today,
+            "today_unique": today_unique.unique_visitors if today_unique else 0,
+            "today_unique_is_approximate": today_unique.is_approximate if today_unique else False,
+            "devices": {
+                "desktop": row.visits_desktop,
+                "mobile": row.visits_mobile,
+                "tablet": row.visits_tablet,
+            },
+        },
+    )
+
+
+class _SnapshotCache:
+    """스냅샷 캐시 (TTL + stale-while-revalidate)"""
+
+    def __init__(self):
+        self._snapshot: Optional[DashboardSnapshot] = None
+        self._built_at = 0.0
+        self._refresh_requested = False
+        self._lock = threading.Lock()
+
+    def _age(self) -> float:
+        return time.monotonic() - self._built_at
+
+    def _build(self, db: Session) -> DashboardSnapshot:
+        snapshot = build_dashboard_snapshot(db)
+        self._snapshot = snapshot
+        self._built_at = time.monotonic()
+        self._refresh_requested = False
+        return snapshot
+
+    def get(self, db: Session, refresh: bool = False) -> DashboardSnapshot:
+        ttl = settings.DASHBOARD_SNAPSHOT_TTL
+        if ttl <= 0:
+            return build_dashboard_snapshot(db)
+
+        snapshot = self._snapshot
+        if snapshot is not None and not refresh:
+            age = self._age()
+            if age < ttl:
+                return snapshot
+            if age < ttl + settings.DASHBOARD_SNAPSHOT_STALE_TTL:
+                self._request_refresh()
+                return snapshot
+
+        with self._lock:
+            # 기다리는 동안 다른 요청이 계산했으면 그 결과 사용
+            if not refresh and self._snapshot is not None and self._age() < ttl:
+                return self._snapshot
+            return self._build(db)
+
+    def _request_refresh(self) -> None:
+        if self._refresh_requested:
+            return
+        self._refresh_requested = True
+        from core.background import background_tasks
+
+        background_tasks.trigger(SNAPSHOT_TASK_NAME)
+
+    def refresh_if_requested(self) -> None:
+        """갱신 요청이 있었으면 새로 계산 (자체 세션 사용)"""
+        if not self._refresh_requested:
+            return
+        with self._lock:
+            if self._snapshot is not None and self._age() < settings.DASHBOARD_SNAPSHOT_TTL:
+                self._refresh_requested = False
+                return
+            db = SessionLocal()
+            try:
+                self._build(db)
+            finally:
+                db.close()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._snapshot = None
+            self._built_at = 0.0
+            self._refresh_requested = False
+
+
+_cache = _SnapshotCache()
+
+
+def get_dashboard_snapshot(db: Session, refresh: bool = False) -> DashboardSnapshot:
+    """
+    캐시된 대시보드 스냅샷 (사본 반환)
+
+    Args:
+        refresh: True이면 캐시를 무시하고 새로 계산
+    """
+    return _cache.get(db, refresh).model_copy(deep=True)
+
+
+def invalidate_dashboard_snapshot() -> None:
+    """캐시된 스냅샷 폐기 (다음 조회 시 새로 계산)"""
+    _cache.clear()
+
+
+def refresh_dashboard_snapshot_job() -> None:
+    """백그라운드 작업용 진입점 (오래된 스냅샷 조회가 있었을 때만 갱신)"""
+    _cache.refresh_if_requested()
@@ -0,0 +1,45 @@
+"""
+방문 기록 미들웨어
+
+설정한 경로(VISITOR_TRACK_PATHS)로 들어온 GET 요청을 방문 이벤트 큐에 기록한다.
+DB 작업 없이 큐에 넣기만 하므로 응답 지연이 거의 없다.
+(BaseHTTPMiddleware 대신 ASGI 미들웨어로 구현해 요청/응답 본문을 감싸지 않음)
+"""
+
+from typing import Iterable
+
+from jose import JWTError, jwt
+from starlette.requests import Request
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from core.config import settings
+from core.security import USER_TOKEN_COOKIE
+from .tracker import visitor_tracker
+
+
+class VisitorTrackingMiddleware:
+    """GET 요청 방문 기록 미들웨어"""
+
+    def __init__(self, app: ASGIApp, paths: Iterable[str]):
+        self.app = app
+        self.paths = tuple(paths)
+
+    def _user_id(self, request: Request):
+        token = request.cookies.get(USER_TOKEN_COOKIE)
+        if not token:
+            return None
+        try:
+            payload = jwt.decode(token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM])
+            return int(payload["sub"])
+        except (JWTError, KeyError, TypeError, ValueError):
+            return None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] == "http"
+            and scope["method"] == "GET"
+            and scope["path"].startswith(self.paths)
+        ):
+            request = Request(scope)
+            visitor_tracker.track_request(request, user_id=self._user_id(request))
+        await self.app(scope, receive, send)
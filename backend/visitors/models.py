@@ -2,14 +2,16 @@
 방문자/통계 모델
 """
 
-from sqlalchemy import Column, Integer, String, Date, DateTime, Text
+from sqlalchemy import (
+    Column, Integer, String, Date, DateTime, Text, Index, LargeBinary, UniqueConstraint,
+)
 from sqlalchemy.sql import func
 
 from core.database import Base
 
 
 class Visitor(Base):
-    """방문자 로그 테이블"""
+    """방문자 로그 테이블 (월별 파티션, visitors/partitions.py 참고)"""
 
     __tablename__ = "visitors"
 
@@ -35,6 +37,45 @@ class Visitor(Base):
     # 타임스탬프
     visited_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
 
+    __table_args__ = (
+        # 커서 페이지네이션 (visited_at, id) 키셋 인덱스
+        Index("ix_visitors_visited_at_id", "visited_at", "id"),
+    )
+
+
+class VisitorSketch(Base):
+    """일별 고유 방문자 HyperLogLog 스케치 (날짜 x 기기 유형)"""
+
+    __tablename__ = "visitor_sketches"
+
+    id = Column(Integer, primary_key=True, index=True)
+    date = Column(Date, nullable=False)  # 업무 기준 날짜
+    device_type = Column(String(20), nullable=False)  # all(전체), desktop, mobile, tablet, unknown
+    registers = Column(LargeBinary, nullable=False)  # HyperLogLog.to_bytes() 결과 (session_id 기준)
+
+    updated_at = Column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+
+    __table_args__ = (
+        UniqueConstraint("date", "device_type", name="uq_visitor_sketches_date_device"),
+    )
+
+
+class StatsWatermark(Base):
+    """일별 통계 집계 워터마크 (원본 테이블별 마지막 처리 위치)"""
+
+    __tablename__ = "stats_watermarks"
+
+    source = Column(String(50), primary_key=True)  # visitors, users, payments
+    last_id = Column(Integer, default=0)  # 마지막으로 처리한 ID (추가만 되는 테이블)
+    last_updated_at = Column(DateTime(timezone=True), nullable=True)  # 마지막으로 처리한 수정 시각 (수정되는 테이블)
+    last_run_date = Column(Date, nullable=True)  # 마지막 집계 실행일 (업무 기준)
+
+    updated_at = Column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+
 
 class DailyStats(Base):
     """일별 통계 테이블"""
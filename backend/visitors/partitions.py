@@ -0,0 +1,384 @@
+"""
+방문 기록(visitors) 월별 파티션 관리
+
+visitors는 추가만 되는 로그 테이블이므로 업무 시간대 기준 월 단위로 나누어
+조회 기간에 해당하는 달만 읽고, 보관 기간이 지난 달은 통째로 내보낸 뒤 삭제한다.
+
+- PostgreSQL: 네이티브 RANGE 파티션 (visitors_pYYYY_MM, 범위 밖 시각은 visitors_default)
+  - 기존 테이블은 scripts/migrate_visitors_partitioning.py로 전환
+  - visited_at 범위 조건이 있으면 플래너가 해당 파티션만 읽음 (파티션 프루닝)
+  - 유지보수 작업이 다음 VISITOR_PARTITION_MONTHS_AHEAD개월 파티션을 미리 생성
+- 그 외(SQLite 등): 월별 테이블 방식
+  - 최근 VISITOR_PARTITION_HOT_MONTHS개월(이번 달 포함)은 visitors에 두고,
+    그 이전 달은 유지보수 작업이 visitors_pYYYY_MM 테이블로 옮김
+  - 조회 시 기간에 걸친 월 테이블만 visitors와 UNION ALL로 합쳐 읽음 (visitor_source)
+- 보관 기간(VISITOR_RETENTION_MONTHS, 이번 달 포함) 이전 달은 VISITOR_ARCHIVE_DIR에
+  gzip NDJSON(한 줄에 방문 기록 1건)으로 내보낸 뒤 삭제
+  (일별 통계/고유 방문자 스케치는 별도 테이블이므로 남음)
+
+Example:
+    entity = visitor_source(db, start, end)
+    db.query(entity).filter(entity.visited_at >= start, entity.visited_at < end)
+"""
+
+import gzip
+import json
+import os
+import re
+import threading
+import time
+from abc import ABC, abstractmethod
+from datetime import date, datetime
+from pathlib import Path
+from typing import Optional
+
+from sqlalchemy import Column, Index, MetaData, Table, func, inspect, insert, select, text, union_all
+from sqlalchemy.orm import Session, aliased
+
+from core.config import settings
+from core.database import SessionLocal
+from common.dates import add_months, business_today, month_range, month_start, to_business_date
+from .models import Visitor
+from .schemas import VisitorPartitionMaintenanceResult, VisitorPartitionResponse, VisitorPartitionStatus
+
+PARENT_TABLE = "visitors"
+DEFAULT_PARTITION = "visitors_default"
+_PARTITION_NAME = re.compile(r"^visitors_p(\d{4})_(\d{2})$")
+
+# 내보내기 시 한 번에 읽을 행 수
+ARCHIVE_BATCH_SIZE = 5000
+
+
+def partition_name(month: date) -> str:
+    """달의 파티션(테이블) 이름"""
+    return f"visitors_p{month.year:04d}_{month.month:02d}"
+
+
+def parse_partition_name(name: str) -> Optional[date]:
+    """파티션 이름의 달 (형식이 다르면 None)"""
+    match = _PARTITION_NAME.match(name)
+    if not match:
+        return None
+    return date(int(match.group(1)), int(match.group(2)), 1)
+
+
+_month_tables: dict[str, Table] = {}
+_month_tables_lock = threading.Lock()
+
+
+def month_table(month: date) -> Table:
+    """달의 파티션/월 테이블 (visitors와 같은 컬럼, 별도 MetaData)"""
+    name = partition_name(month)
+    with _month_tables_lock:
+        table = _month_tables.get(name)
+        if table is None:
+            table = Table(
+                name,
+                MetaData(),
+                *[
+                    Column(c.name, c.type, primary_key=c.primary_key, nullable=c.nullable)
+                    for c in Visitor.__table__.columns
+                ],
+                Index(f"ix_{name}_visited_at_id", "visited_at", "id"),
+            )
+            _month_tables[name] = table
+        return table
+
+
+def retention_cutoff(today: date) -> Optional[date]:
+    """이 달보다 이전 달은 보관 기간 경과 (보관 기간 무기한이면 None)"""
+    if settings.VISITOR_RETENTION_MONTHS <= 0:
+        return None
+    return add_months(month_start(today), -(settings.VISITOR_RETENTION_MONTHS - 1))
+
+
+def archive_table(db: Session, table: Table, path: Path) -> int:
+    """
+    테이블 전체를 gzip NDJSON 파일로 내보내기
+
+    임시 파일에 쓴 뒤 이름을 바꾸므로 중간에 실패해도 불완전한 파일이 남지 않는다.
+
+    Returns:
+        내보낸 행 수
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(path.name + ".tmp")
+    count = 0
+    rows = db.execute(
+        select(table).order_by(table.c.id).execution_options(yield_per=ARCHIVE_BATCH_SIZE)
+    )
+    with gzip.open(temp_path, "wt", encoding="utf-8") as f:
+        for row in rows:
+            f.write(json.dumps(dict(row._mapping), ensure_ascii=False, default=str) + "\n")
+            count += 1
+    os.replace(temp_path, path)
+    return count
+
+
+class VisitorPartitionBackend(ABC):
+    """방문 기록 파티션 백엔드 추상 베이스 클래스"""
+
+    name: str = ""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    @abstractmethod
+    def is_partitioned(self) -> bool:
+        """파티션 방식 사용 여부"""
+        pass
+
+    @abstractmethod
+    def list_months(self) -> list[date]:
+        """분리된 달 목록 (오래된 순)"""
+        pass
+
+    @abstractmethod
+    def prepare(self, today: date) -> list[str]:
+        """파티션 준비 (생성/이동), 처리한 파티션 이름 반환"""
+        pass
+
+    @abstractmethod
+    def detach(self, month: date) -> None:
+        """달 파티션을 부모에서 분리 (이후 독립 테이블로 내보내기/삭제)"""
+        pass
+
+    @abstractmethod
+    def tables_for_range(self, start: Optional[datetime], end: Optional[datetime]) -> list[Table]:
+        """기간 [start, end)에 해당하는 방문 기록을 읽기 위한 테이블 목록"""
+        pass
+
+    def apply_retention(self, today: date) -> tuple[list[str], list[str]]:
+        """보관 기간이 지난 달 내보내기 + 삭제, (내보낸 이름, 삭제한 이름) 반환"""
+        cutoff = retention_cutoff(today)
+        if cutoff is None or not self.is_partitioned():
+            return [], []
+
+        archived, dropped = [], []
+        archive_dir = settings.VISITOR_ARCHIVE_DIR
+        for month in self.list_months():
+            if month >= cutoff:
+                continue
+            table = month_table(month)
+            # 보관 기간이 지난 달에는 새 행이 들어오지 않으므로 내보낸 뒤 분리/삭제
+            # (내보내기에 실패하면 파티션을 그대로 두고 다음 실행에서 재시도)
+            if archive_dir:
+                count = archive_table(self.db, table, Path(archive_dir) / f"{table.name}.ndjson.gz")
+                archived.append(table.name)
+                print(f"[VisitorPartitions] {table.name} 내보내기 완료 ({count}건)")
+
+            self.detach(month)
+            table.drop(bind=self.db.connection(), checkfirst=True)
+            self.db.commit()
+            dropped.append(table.name)
+        _invalidate_month_cache()
+        return archived, dropped
+
+
+class PostgresVisitorPartitions(VisitorPartitionBackend):
+    """PostgreSQL 네이티브 RANGE 파티션"""
+
+    name = "postgresql"
+
+    def is_partitioned(self) -> bool:
+        return bool(self.db.execute(text(
+            "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table pt "
+            "JOIN pg_class c ON c.oid = pt.partrelid WHERE c.relname = :name)"
+        ), {"name": PARENT_TABLE}).scalar())
+
+    def list_months(self) -> list[date]:
+        names = self.db.execute(text(
+            "SELECT child.relname FROM pg_inherits i "
+            "JOIN pg_class parent ON parent.oid = i.inhparent "
+            "JOIN pg_class child ON child.oid = i.inhrelid "
+            "WHERE parent.relname = :name"
+        ), {"name": PARENT_TABLE}).scalars()
+        return sorted(month for month in map(parse_partition_name, names) if month)
+
+    def create_partition(self, month: date) -> None:
+        start, end = month_range(month)
+        # DDL은 바인드 파라미터를 받지 않으므로 ISO 형식 리터럴 사용
+        self.db.execute(text(
+            f"CREATE TABLE IF NOT EXISTS {partition_name(month)} PARTITION OF {PARENT_TABLE} "
+            f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+        ))
+
+    def prepare(self, today: date) -> list[str]:
+        if not self.is_partitioned():
+            return []
+        existing = set(self.list_months())
+        current = month_start(today)
+        created = []
+        for offset in range(settings.VISITOR_PARTITION_MONTHS_AHEAD + 1):
+            month = add_months(current, offset)
+            if month not in existing:
+                self.create_partition(month)
+                created.append(partition_name(month))
+        self.db.commit()
+        return created
+
+    def detach(self, month: date) -> None:
+        self.db.execute(text(f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {partition_name(month)}"))
+
+    def tables_for_range(self, start: Optional[datetime], end: Optional[datetime]) -> list[Table]:
+        # 부모 테이블 하나로 조회하고 파티션 선택은 플래너에 맡김
+        return [Visitor.__table__]
+
+
+class MonthlyTableVisitorPartitions(VisitorPartitionBackend):
+    """월별 테이블 방식 (네이티브 파티션이 없는 DB용)"""
+
+    name = "monthly_tables"
+
+    def is_partitioned(self) -> bool:
+        return True
+
+    def list_months(self) -> list[date]:
+        return _cached_months(self.db)
+
+    def _hot_start(self, today: date) -> date:
+        """visitors에 남겨 둘 가장 오래된 달 (보관 기간이 더 짧으면 보관 기간 기준)"""
+        hot_start = add_months(month_start(today), -(max(settings.VISITOR_PARTITION_HOT_MONTHS, 1) - 1))
+        cutoff = retention_cutoff(today)
+        return max(hot_start, cutoff) if cutoff else hot_start
+
+    def prepare(self, today: date) -> list[str]:
+        """visitors에서 오래된 달의 방문 기록을 월 테이블로 이동 (한 달씩 커밋)"""
+        boundary = self._hot_start(today)
+        boundary_at, _ = month_range(boundary)
+        oldest = (
+            self.db.query(func.min(Visitor.visited_at))
+            .filter(Visitor.visited_at < boundary_at)
+            .scalar()
+        )
+        if oldest is None:
+            return []
+
+        moved = []
+        month = month_start(to_business_date(oldest))
+        source = Visitor.__table__
+        while month < boundary:
+            start, end = month_range(month)
+            in_month = (source.c.visited_at >= start, source.c.visited_at < end)
+            table = month_table(month)
+            table.create(bind=self.db.connection(), checkfirst=True)
+            self.db.execute(
+                insert(table).from_select(
+                    [c.name for c in source.columns], select(*source.columns).where(*in_month)
+                )
+            )
+            self.db.execute(source.delete().where(*in_month))
+            self.db.commit()
+            moved.append(table.name)
+            month = add_months(month, 1)
+
+        _invalidate_month_cache()
+        return moved
+
+    def detach(self, month: date) -> None:
+        # 이미 독립 테이블
+        pass
+
+    def tables_for_range(self, start: Optional[datetime], end: Optional[datetime]) -> list[Table]:
+        tables = [Visitor.__table__]
+        for month in self.list_months():
+            month_begin, month_end = month_range(month)
+            if (start is None or month_end > start) and (end is None or month_begin < end):
+                tables.append(month_table(month))
+        return tables
+
+
+# 월 테이블 목록 캐시 (조회마다 테이블 목록을 읽지 않도록, 유지보수 시 무효화)
+_MONTH_CACHE_TTL = 60
+_month_cache: tuple[float, list[date]] = (0.0, [])
+
+
+def _cached_months(db: Session) -> list[date]:
+    global _month_cache
+    loaded_at, months = _month_cache
+    if time.monotonic() - loaded_at < _MONTH_CACHE_TTL:
+        return months
+    names = inspect(db.connection()).get_table_names()
+    months = sorted(month for month in map(parse_partition_name, names) if month)
+    _month_cache = (time.monotonic(), months)
+    return months
+
+
+def _invalidate_month_cache() -> None:
+    global _month_cache
+    _month_cache = (0.0, [])
+
+
+def get_visitor_partitions(db: Session) -> VisitorPartitionBackend:
+    """DB 종류에 맞는 파티션 백엔드"""
+    if db.get_bind().dialect.name == "postgresql":
+        return PostgresVisitorPartitions(db)
+    return MonthlyTableVisitorPartitions(db)
+
+
+def visitor_source(db: Session, start: Optional[datetime] = None, end: Optional[datetime] = None):
+    """
+    기간 [start, end)의 방문 기록을 조회할 엔티티 (Visitor 별칭)
+
+    읽을 테이블이 visitors 하나면 그대로, 월 테이블이 걸쳐 있으면 UNION ALL 서브쿼리에 매핑한다.
+    필터/정렬은 반환된 엔티티의 컬럼으로 지정해야 한다.
+    """
+    tables = get_visitor_partitions(db).tables_for_range(start, end)
+    if len(tables) == 1:
+        return aliased(Visitor)
+    union = union_all(*[select(*table.columns) for table in tables]).subquery()
+    return aliased(Visitor, union)
+
+
+def get_partition_status(db: Session) -> VisitorPartitionStatus:
+    """파티션/보관 현황"""
+    backend = get_visitor_partitions(db)
+    partitioned = backend.is_partitioned()
+    partitions = []
+    if partitioned:
+        for month in backend.list_months():
+            start, end = month_range(month)
+            partitions.append(VisitorPartitionResponse(
+                name=partition_name(month), month=month, start=start, end=end
+            ))
+
+    archives = []
+    if settings.VISITOR_ARCHIVE_DIR and os.path.isdir(settings.VISITOR_ARCHIVE_DIR):
+        archives = sorted(
+            name for name in os.listdir(settings.VISITOR_ARCHIVE_DIR) if name.endswith(".ndjson.gz")
+        )
+
+    return VisitorPartitionStatus(
+        backend=backend.name,
+        partitioned=partitioned,
+        partitions=partitions,
+        retention_months=settings.VISITOR_RETENTION_MONTHS,
+        retention_cutoff=retention_cutoff(business_today()),
+        archives=archives,
+    )
+
+
+def run_partition_maintenance(db: Session) -> VisitorPartitionMaintenanceResult:
+    """파티션 준비 + 보관 기간 정리"""
+    started = time.monotonic()
+    backend = get_visitor_partitions(db)
+    today = business_today()
+
+    prepared = backend.prepare(today)
+    archived, dropped = backend.apply_retention(today)
+
+    return VisitorPartitionMaintenanceResult(
+        prepared=prepared,
+        archived=archived,
+        dropped=dropped,
+        elapsed_ms=int((time.monotonic() - started) * 1000),
+    )
+
+
+def run_partition_maintenance_job() -> None:
+    """백그라운드 작업용 진입점 (자체 세션 사용)"""
+    db = SessionLocal()
+    try:
+        run_partition_maintenance(db)
+    finally:
+        db.close()
@@ -0,0 +1,35 @@
+"""
+방문 기록 공개 API 라우터 (인증 불필요)
+"""
+
+from fastapi import APIRouter, Depends, Request, Response
+from typing import Optional
+
+from core.config import settings
+from core.security import get_current_user_from_cookie_optional
+from .schemas import VisitorTrackRequest
+from .tracker import visitor_tracker
+
+router = APIRouter(prefix="/public/visitors", tags=["방문자 (공개)"])
+
+
+@router.post("/track", status_code=204)
+async def track_visit(
+    data: VisitorTrackRequest,
+    request: Request,
+    current_user: Optional[dict] = Depends(get_current_user_from_cookie_optional),
+):
+    """
+    페이지 방문 기록
+
+    이벤트를 큐에 넣고 바로 응답한다 (DB 저장은 백그라운드에서 일괄 처리).
+    """
+    if settings.VISITOR_TRACKING_ENABLED:
+        visitor_tracker.track_request(
+            request,
+            page_url=data.page_url,
+            referrer=data.referrer,
+            session_id=data.session_id,
+            user_id=current_user.get("id") if current_user else None,
+        )
+    return Response(status_code=204)
@@ -0,0 +1,311 @@
+"""
+일별 통계(daily_stats) 집계
+
+visitors / users / payments 원본을 업무 기준 날짜(BUSINESS_TIMEZONE)별로 집계해 daily_stats에 저장한다.
+
+증분 집계 (run_rollup, 백그라운드 작업):
+- 원본별 워터마크(stats_watermarks) 이후에 추가/수정된 행만 조회해 영향받은 날짜를 찾고,
+  그 날짜의 해당 원본 지표만 다시 계산한다 (세션 고유 방문자 수처럼 더할 수 없는 지표가 있어
+  증감 대신 날짜 단위 재계산, 날짜 범위 조건은 인덱스를 타는 반개구간)
+- visitors/users는 ID 워터마크, 상태가 바뀌는 payments는 updated_at 워터마크 사용
+- 날짜가 바뀐 뒤 첫 실행에서 직전 실행일을 한 번 더 계산해 늦게 커밋된 행을 반영
+- 최초 실행 시 워터마크는 현재 위치에서 시작하고 오늘만 계산 (과거 기간은 backfill로 처리)
+
+기간 재집계 (backfill_daily_stats):
+- 과거 기간을 날짜 청크로 나누어 여러 스레드(각자 세션)로 병렬 처리
+- 고유 방문자 스케치(visitor_sketches)도 원본 방문 기록으로 재구성
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from typing import Iterable
+
+from sqlalchemy import case, distinct, exists, func, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from common.dates import business_today, day_range, iter_dates, to_business_date
+from core.database import SessionLocal, engine
+from .models import DailyStats, StatsWatermark, Visitor
+from .partitions import visitor_source
+from .schemas import DailyStatsRollupResult
+from .sketches import rebuild_sketches
+
+VISITORS = "visitors"
+USERS = "users"
+PAYMENTS = "payments"
+SOURCES = (VISITORS, USERS, PAYMENTS)
+
+# updated_at 워터마크 겹침 구간 (같은 시각에 늦게 커밋된 행 보정, 재계산은 멱등)
+UPDATED_AT_OVERLAP = timedelta(seconds=5)
+
+
+# ============================================
+# 날짜별 지표 계산
+# ============================================
+
+def _visitor_metrics(db: Session, day: date) -> dict:
+    start, end = day_range(day)
+    # 월 파티션으로 옮겨진 날짜도 계산할 수 있도록 기간에 맞는 엔티티 사용
+    visits_in_day = visitor_source(db, start, end)
+    in_day = (visits_in_day.visited_at >= start, visits_in_day.visited_at < end)
+
+    def device_count(device_type: str):
+        return func.coalesce(func.sum(case((visits_in_day.device_type == device_type, 1), else_=0)), 0)
+
+    visits, unique_visitors, active_users, desktop, mobile, tablet = (
+        db.query(
+            func.count(visits_in_day.id),
+            func.count(distinct(visits_in_day.session_id)),
+            func.count(distinct(visits_in_day.user_id)),
+            device_count("desktop"),
+            device_count("mobile"),
+            device_count("tablet"),
+        )
+        .filter(*in_day)
+        .one()
+    )
+
+    # 신규 방문자: 그날 이전에 방문 기록이 없는 세션
+    earlier = visitor_source(db, None, start)
+    new_visitors = (
+        db.query(func.count(distinct(visits_in_day.session_id)))
+        .filter(
+            *in_day,
+            ~exists().where(earlier.session_id == visits_in_day.session_id, earlier.visited_at < start),
+        )
+        .scalar()
+        or 0
+    )
+
+    return {
+        "total_visits": visits,
+        "page_views": visits,
+        "unique_visitors": unique_visitors,
+        "new_visitors": new_visitors,
+        "returning_visitors": max(unique_visitors - new_visitors, 0),
+        "avg_pages_per_session": visits // unique_visitors if unique_visitors else 0,
+        "desktop_visits": desktop,
+        "mobile_visits": mobile,
+        "tablet_visits": tablet,
+        "active_users": active_users,
+    }
+
+
+def _user_metrics(db: Session, day: date) -> dict:
+    from users.models import User
+
+    start, end = day_range(day)
+    signups = (
+        db.query(func.count(User.id))
+        .filter(User.created_at >= start, User.created_at < end)
+        .scalar()
+    )
+    return {"new_signups": signups or 0}
+
+
+def _payment_metrics(db: Session, day: date) -> dict:
+    from payments.models import Payment, PaymentStatus
+
+    start, end = day_range(day)
+    orders, revenue = (
+        db.query(func.count(Payment.id), func.coalesce(func.sum(Payment.amount), 0))
+        .filter(
+            Payment.status == PaymentStatus.COMPLETED.value,
+            Payment.paid_at >= start,
+            Payment.paid_at < end,
+        )
+        .one()
+    )
+    return {"total_orders": orders, "total_revenue": int(revenue)}
+
+
+_METRICS = {
+    VISITORS: _visitor_metrics,
+    USERS: _user_metrics,
+    PAYMENTS: _payment_metrics,
+}
+
+
+def _save_daily_stats(db: Session, day: date, values: dict) -> None:
+    """날짜 행 갱신, 없으면 생성 (동시 생성 시 갱신으로 재시도)"""
+    stmt = update(DailyStats).where(DailyStats.date == day).values(**values)
+    if db.execute(stmt, execution_options={"synchronize_session": False}).rowcount:
+        return
+    try:
+        with db.begin_nested():
+            db.add(DailyStats(date=day, **values))
+    except IntegrityError:
+        db.execute(stmt, execution_options={"synchronize_session": False})
+
+
+def refresh_daily_stats(db: Session, day: date, sources: Iterable[str] = SOURCES) -> None:
+    """한 날짜의 지정한 원본 지표 재계산 (커밋은 호출자가 수행)"""
+    values = {}
+    for source in sources:
+        values.update(_METRICS[source](db, day))
+    if values:
+        _save_daily_stats(db, day, values)
+
+
+# ============================================
+# 증분 집계
+# ============================================
+
+def _current_position(db: Session, source: str) -> dict:
+    """원본 테이블의 현재 마지막 위치 (최초 워터마크)"""
+    from users.models import User
+    from payments.models import Payment
+
+    if source == VISITORS:
+        return {"last_id": db.query(func.max(Visitor.id)).scalar() or 0}
+    if source == USERS:
+        return {"last_id": db.query(func.max(User.id)).scalar() or 0}
+    return {"last_updated_at": db.query(func.max(Payment.updated_at)).scalar()}
+
+
+def _get_watermark(db: Session, source: str) -> tuple[StatsWatermark, bool]:
+    """(워터마크, 새로 만들었는지 여부)"""
+    watermark = db.get(StatsWatermark, source)
+    if watermark is not None:
+        return watermark, False
+
+    position = {"last_id": 0}
+    position.update(_current_position(db, source))
+    watermark = StatsWatermark(source=source, **position)
+    try:
+        with db.begin_nested():
+            db.add(watermark)
+    except IntegrityError:
+        return db.get(StatsWatermark, source), False
+    return watermark, True
+
+
+def _visitor_changes(db: Session, watermark: StatsWatermark) -> set[date]:
+    max_id, min_at, max_at = (
+        db.query(func.max(Visitor.id), func.min(Visitor.visited_at), func.max(Visitor.visited_at))
+        .filter(Visitor.id > (watermark.last_id or 0))
+        .one()
+    )
+    if max_id is None:
+        return set()
+    watermark.last_id = max_id
+    # 새 방문 기록은 대부분 최근 날짜에 몰려 있으므로 최소~최대 날짜 범위로 판단
+    return set(iter_dates(to_business_date(min_at), to_business_date(max_at)))
+
+
+def _user_changes(db: Session, watermark: StatsWatermark) -> set[date]:
+    from users.models import User
+
+    rows = db.query(User.id, User.created_at).filter(User.id > (watermark.last_id or 0)).all()
+    if not rows:
+        return set()
+    watermark.last_id = max(row.id for row in rows)
+    return {to_business_date(row.created_at) for row in rows if row.created_at}
+
+
+def _payment_changes(db: Session, watermark: StatsWatermark) -> set[date]:
+    from payments.models import Payment
+
+    query = db.query(Payment.paid_at, Payment.updated_at)
+    if watermark.last_updated_at is not None:
+        query = query.filter(Payment.updated_at >= watermark.last_updated_at - UPDATED_AT_OVERLAP)
+    rows = query.all()
+    if not rows:
+        return set()
+    latest = max(row.updated_at for row in rows if row.updated_at)
+    if watermark.last_updated_at is None or latest > watermark.last_updated_at:
+        watermark.last_updated_at = latest
+    return {to_business_date(row.paid_at) for row in rows if row.paid_at}
+
+
+_CHANGES = {
+    VISITORS: _visitor_changes,
+    USERS: _user_changes,
+    PAYMENTS: _payment_changes,
+}
+
+
+def run_rollup(db: Session) -> DailyStatsRollupResult:
+    """워터마크 이후 변경분이 있는 날짜만 재계산"""
+    started = time.monotonic()
+    today = business_today()
+    updated: set[date] = set()
+
+    for source in SOURCES:
+        watermark, created = _get_watermark(db, source)
+        days = {today} if created else _CHANGES[source](db, watermark)
+        # 날짜가 바뀐 뒤 첫 실행이면 직전 실행일을 마감 집계
+        if watermark.last_run_date and watermark.last_run_date < today:
+            days.add(watermark.last_run_date)
+        watermark.last_run_date = today
+
+        for day in sorted(days):
+            refresh_daily_stats(db, day, (source,))
+        # 지표와 워터마크를 같은 트랜잭션으로 커밋
+        db.commit()
+        updated |= days
+
+    return DailyStatsRollupResult(
+        updated_dates=sorted(updated),
+        elapsed_ms=int((time.monotonic() - started) * 1000),
+    )
+
+
+def run_rollup_job() -> None:
+    """백그라운드 작업용 진입점 (자체 세션 사용)"""
+    db = SessionLocal()
+    try:
+        run_rollup(db)
+    finally:
+        db.close()
+
+
+# ============================================
+# 기간 재집계 (병렬)
+# ============================================
+
+def _backfill_chunk(days: list[date]) -> int:
+    db = SessionLocal()
+    try:
+        for day in days:
+            refresh_daily_stats(db, day)
+            rebuild_sketches(db, day)
+        db.commit()
+        return len(days)
+    finally:
+        db.close()
+
+
+def backfill_daily_stats(
+    start_date: date,
+    end_date: date,
+    workers: int = 4,
+    chunk_days: int = 7,
+) -> DailyStatsRollupResult:
+    """
+    기간 전체 재집계 (모든 원본 지표 + 고유 방문자 스케치)
+
+    chunk_days 단위로 나눈 날짜 묶음을 workers개 스레드에서 병렬 처리한다.
+    SQLite는 동시 쓰기를 지원하지 않으므로 1개 스레드로 처리한다.
+    """
+    started = time.monotonic()
+    days = list(iter_dates(start_date, end_date))
+    chunks = [days[i:i + chunk_days] for i in range(0, len(days), chunk_days)]
+
+    if engine.dialect.name == "sqlite":
+        workers = 1
+
+    if workers <= 1 or len(chunks) <= 1:
+        for chunk in chunks:
+            _backfill_chunk(chunk)
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # 예외가 있으면 여기서 전파
+            list(executor.map(_backfill_chunk, chunks))
+
+    return DailyStatsRollupResult(
+        updated_dates=days,
+        elapsed_ms=int((time.monotonic() - started) * 1000),
+    )
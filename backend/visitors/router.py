@@ -2,6 +2,8 @@
 방문자/통계 라우터
 """
 
+import asyncio
+
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 from typing import Optional
@@ -9,15 +11,32 @@ from datetime import date, datetime, timedelta
 
 from core.database import get_db
 from core.security import get_current_admin
-from common.responses import SuccessResponse, PaginatedResponse, PaginationMeta
-from common.pagination import PaginationParams
+from common.responses import (
+    SuccessResponse,
+    PaginatedResponse,
+    PaginationMeta,
+    CursorPaginatedResponse,
+    CursorPaginationMeta,
+)
+from common.dates import business_today
+from common.errors import BadRequestException
+from common.export import ExportFormat, export_response
+from common.pagination import PaginationParams, CursorParams
 from .schemas import (
     VisitorListResponse,
     DailyStatsResponse,
     VisitorSearchParams,
     DashboardSummary,
+    DashboardSnapshot,
+    DailyStatsRollupResult,
+    UniqueVisitorsResponse,
+    VisitorPartitionStatus,
+    VisitorPartitionMaintenanceResult,
 )
-from .service import VisitorService
+from .dashboard import get_dashboard_snapshot
+from .partitions import get_partition_status, run_partition_maintenance
+from .rollup import run_rollup, backfill_daily_stats
+from .service import EXPORT_COLUMNS, VisitorService
 
 router = APIRouter(prefix="/visitors", tags=["방문자/통계"])
 
@@ -62,6 +81,84 @@ async def get_visitor_list(
     )
 
 
+@router.get("/cursor", response_model=CursorPaginatedResponse[VisitorListResponse])
+async def get_visitor_cursor_list(
+    cursor: Optional[str] = None,
+    page_size: int = Query(20, ge=1, le=100),
+    include_total: bool = False,
+    approximate_total: bool = True,
+    ip_address: Optional[str] = None,
+    device_type: Optional[str] = None,
+    user_id: Optional[int] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    current_admin: dict = Depends(get_current_admin),
+    db: Session = Depends(get_db),
+):
+    """
+    방문자 로그 목록 조회 (커서 기반)
+    대용량 로그에서 OFFSET 없이 다음 페이지를 조회
+    """
+    service = VisitorService(db)
+    params = CursorParams(
+        cursor=cursor,
+        page_size=page_size,
+        include_total=include_total,
+        approximate_total=approximate_total,
+    )
+    search = VisitorSearchParams(
+        ip_address=ip_address,
+        device_type=device_type,
+        user_id=user_id,
+        start_date=start_date,
+        end_date=end_date,
+    )
+
+    result = service.get_visitor_cursor_list(params, search)
+
+    return CursorPaginatedResponse(
+        data=result.items,
+        meta=CursorPaginationMeta(
+            page_size=result.page_size,
+            next_cursor=result.next_cursor,
+            has_next=result.has_next,
+            total_count=result.total_count,
+            total_is_approximate=result.total_is_approximate,
+        ),
+    )
+
+
+@router.get("/export")
+async def export_visitors(
+    format: ExportFormat = "csv",
+    gzip: bool = False,
+    ip_address: Optional[str] = None,
+    device_type: Optional[str] = None,
+    user_id: Optional[int] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    current_admin: dict = Depends(get_current_admin),
+):
+    """
+    방문자 로그 내보내기 (CSV/NDJSON 스트리밍, 목록과 같은 검색 조건)
+    """
+    search = VisitorSearchParams(
+        ip_address=ip_address,
+        device_type=device_type,
+        user_id=user_id,
+        start_date=start_date,
+        end_date=end_date,
+    )
+
+    return export_response(
+        lambda db: VisitorService(db).iter_export_rows(search),
+        columns=EXPORT_COLUMNS,
+        filename="visitors",
+        format=format,
+        gzip=gzip,
+    )
+
+
 @router.get("/stats", response_model=SuccessResponse[dict])
 async def get_visitor_stats(
     current_admin: dict = Depends(get_current_admin),
@@ -75,6 +172,34 @@ async def get_visitor_stats(
     return SuccessResponse(data=stats)
 
 
+@router.get("/unique", response_model=SuccessResponse[UniqueVisitorsResponse])
+async def get_unique_visitors(
+    start_date: date = Query(default=None),
+    end_date: date = Query(default=None),
+    device_type: Optional[str] = Query(None, pattern="^(desktop|mobile|tablet|unknown)$"),
+    exact: bool = False,
+    current_admin: dict = Depends(get_current_admin),
+    db: Session = Depends(get_db),
+):
+    """
+    기간 고유 방문자 수 (세션 기준)
+    기본은 일별 HyperLogLog 스케치를 합친 추정값 (표준 오차 약 0.81%), exact=true이면 정확한 계산
+    """
+    # 기본값: 최근 7일
+    if not end_date:
+        end_date = business_today()
+    if not start_date:
+        start_date = end_date - timedelta(days=6)
+    if start_date > end_date:
+        raise BadRequestException(detail="시작일이 종료일보다 늦습니다")
+    if (end_date - start_date).days > 366:
+        raise BadRequestException(detail="한 번에 최대 1년까지 조회할 수 있습니다")
+
+    service = VisitorService(db)
+    result = service.get_unique_visitors(start_date, end_date, device_type, exact)
+    return SuccessResponse(data=result)
+
+
 @router.get("/daily", response_model=SuccessResponse[list[DailyStatsResponse]])
 async def get_daily_stats(
     start_date: date = Query(default=None),
@@ -87,7 +212,7 @@ async def get_daily_stats(
     """
     # 기본값: 최근 30일
     if not end_date:
-        end_date = date.today()
+        end_date = business_today()
     if not start_date:
         start_date = end_date - timedelta(days=30)
 
@@ -96,14 +221,93 @@ async def get_daily_stats(
     return SuccessResponse(data=stats)
 
 
+@router.post("/daily/rollup", response_model=SuccessResponse[DailyStatsRollupResult])
+async def rollup_daily_stats(
+    current_admin: dict = Depends(get_current_admin),
+    db: Session = Depends(get_db),
+):
+    """
+    일별 통계 증분 집계 즉시 실행 (마지막 집계 이후 변경된 날짜만)
+    """
+    result = await asyncio.to_thread(run_rollup, db)
+    return SuccessResponse(data=result)
+
+
+@router.post("/daily/backfill", response_model=SuccessResponse[DailyStatsRollupResult])
+async def backfill_daily_stats_range(
+    start_date: date,
+    end_date: date,
+    workers: int = Query(4, ge=1, le=16),
+    current_admin: dict = Depends(get_current_admin),
+):
+    """
+    기간 일별 통계 재집계 (날짜 묶음 단위 병렬 처리)
+    """
+    if start_date > end_date:
+        raise BadRequestException(detail="시작일이 종료일보다 늦습니다")
+    if (end_date - start_date).days > 3660:
+        raise BadRequestException(detail="한 번에 최대 10년까지 재집계할 수 있습니다")
+
+    result = await asyncio.to_thread(backfill_daily_stats, start_date, end_date, workers)
+    return SuccessResponse(data=result)
+
+
+@router.get("/partitions", response_model=SuccessResponse[VisitorPartitionStatus])
+async def get_visitor_partitions(
+    current_admin: dict = Depends(get_current_admin),
+    db: Session = Depends(get_db),
+):
+    """
+    방문 기록 월 파티션/보관 현황
+    """
+    return SuccessResponse(data=get_partition_status(db))
+
+
+@router.post("/partitions/maintenance", response_model=SuccessResponse[VisitorPartitionMaintenanceResult])
+async def run_visitor_partition_maintenance(
+    current_admin: dict = Depends(get_current_admin),
+    db: Session = Depends(get_db),
+):
+    """
+    방문 기록 파티션 유지보수 즉시 실행 (파티션 생성/이동, 보관 기간이 지난 달 내보내기 후 삭제)
+    """
+    result = await asyncio.to_thread(run_partition_maintenance, db)
+    return SuccessResponse(data=result)
+
+
 @router.get("/dashboard", response_model=SuccessResponse[DashboardSummary])
 async def get_dashboard_summary(
+    refresh: bool = False,
     current_admin: dict = Depends(get_current_admin),
     db: Session = Depends(get_db),
 ):
     """
-    대시보드 요약 통계
+    대시보드 요약 통계 (refresh=true이면 캐시를 무시하고 새로 계산)
     """
-    service = VisitorService(db)
-    summary = service.get_dashboard_summary()
-    return SuccessResponse(data=summary)
+    snapshot = get_dashboard_snapshot(db, refresh=refresh)
+    return SuccessResponse(data=snapshot.summary)
+
+
+@router.get("/dashboard/snapshot", response_model=SuccessResponse[DashboardSnapshot])
+async def get_dashboard_snapshot_all(
+    refresh: bool = False,
+    current_admin: dict = Depends(get_current_admin),
+    db: Session = Depends(get_db),
+):
+    """
+    대시보드 전체 스냅샷 (요약 + 회원/상품/결제/포인트/게시판/방문자 통계를 한 번에)
+    """
+    snapshot = get_dashboard_snapshot(db, refresh=refresh)
+    return SuccessResponse(data=snapshot)
+
+
+@router.get("/tracking/status", response_model=SuccessResponse[dict])
+async def get_tracking_status(
+    current_admin: dict = Depends(get_current_admin),
+):
+    """
+    방문 기록 수집 큐 상태 (대기/저장/버림 건수)
+    """
+    from .tracker import visitor_tracker
+
+    return SuccessResponse(data=visitor_tracker.get_status())
@@ -2,7 +2,7 @@
 방문자/통계 스키마
 """
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Optional
 from datetime import date, datetime
 
@@ -92,3 +92,71 @@ class DashboardSummary(BaseModel):
     total_users: int
     total_products: int
     total_orders: int
+
+
+class VisitorTrackRequest(BaseModel):
+    """방문 기록 요청 (프론트엔드 페이지 이동 시 전송)"""
+
+    page_url: Optional[str] = Field(None, max_length=500)
+    referrer: Optional[str] = Field(None, max_length=500)
+    session_id: Optional[str] = Field(None, max_length=100)
+
+
+class DailyStatsRollupResult(BaseModel):
+    """일별 통계 집계 결과"""
+
+    updated_dates: list[date]
+    elapsed_ms: int
+
+
+class UniqueVisitorsResponse(BaseModel):
+    """기간 고유 방문자 수"""
+
+    start_date: date
+    end_date: date
+    device_type: Optional[str] = None  # None이면 전체 기기
+    unique_visitors: int
+    is_approximate: bool  # HyperLogLog 추정값 여부
+    standard_error: float  # 추정값의 상대 표준 오차 (정확한 값이면 0)
+
+
+class DashboardSnapshot(BaseModel):
+    """관리자 대시보드 스냅샷 (요약 + 모듈별 관리자 통계)"""
+
+    generated_at: datetime
+    summary: DashboardSummary
+    users: dict
+    products: dict
+    payments: dict
+    points: dict
+    boards: dict
+    visitors: dict
+
+
+class VisitorPartitionResponse(BaseModel):
+    """방문 기록 월 파티션"""
+
+    name: str
+    month: date
+    start: datetime  # 포함 (UTC)
+    end: datetime  # 미포함 (UTC)
+
+
+class VisitorPartitionStatus(BaseModel):
+    """방문 기록 파티션/보관 현황"""
+
+    backend: str  # postgresql, monthly_tables
+    partitioned: bool  # PostgreSQL에서 파티션 전환 전이면 False
+    partitions: list[VisitorPartitionResponse]
+    retention_months: int  # 0이면 무기한
+    retention_cutoff: Optional[date] = None  # 이 달 이전은 보관 기간 경과
+    archives: list[str]  # 내보낸 파일 이름
+
+
+class VisitorPartitionMaintenanceResult(BaseModel):
+    """방문 기록 파티션 유지보수 결과"""
+
+    prepared: list[str]  # 생성(PostgreSQL)/이동(월별 테이블)한 파티션
+    archived: list[str]  # 내보낸 파티션
+    dropped: list[str]  # 삭제한 파티션
+    elapsed_ms: int
@@ -5,9 +5,9 @@
 from typing import Optional
 from datetime import date, datetime, timedelta, timezone
 from sqlalchemy.orm import Session
-from sqlalchemy import func as sql_func
 
-from common.pagination import Pagination, PaginationParams
+from common.export import EXPORT_BATCH_SIZE
+from common.pagination import Pagination, PaginationParams, CursorPagination, CursorParams
 from .models import Visitor, DailyStats
 from .schemas import (
     VisitorResponse,
@@ -15,7 +15,14 @@ from .schemas import (
     DailyStatsResponse,
     VisitorSearchParams,
     DashboardSummary,
+    UniqueVisitorsResponse,
 )
+from .dashboard import get_dashboard_snapshot
+from .partitions import visitor_source
+from .sketches import count_unique_visitors
+
+# 내보내기 컬럼 (목록 응답과 같은 필드)
+EXPORT_COLUMNS = list(VisitorListResponse.model_fields)
 
 
 class VisitorService:
@@ -30,25 +37,11 @@ class VisitorService:
         search: Optional[VisitorSearchParams] = None,
     ) -> Pagination[VisitorListResponse]:
         """방문자 로그 목록 조회"""
-        query = self.db.query(Visitor)
-
-        # 검색 조건 적용
-        if search:
-            if search.ip_address:
-                query = query.filter(
-                    Visitor.ip_address.ilike(f"%{search.ip_address}%")
-                )
-            if search.device_type:
-                query = query.filter(Visitor.device_type == search.device_type)
-            if search.user_id:
-                query = query.filter(Visitor.user_id == search.user_id)
-            if search.start_date:
-                query = query.filter(Visitor.visited_at >= search.start_date)
-            if search.end_date:
-                query = query.filter(Visitor.visited_at <= search.end_date)
+        entity = self._source(search)
+        query = self._apply_search(self.db.query(entity), search, entity)
 
         # 정렬 (최신순)
-        query = query.order_by(Visitor.visited_at.desc())
+        query = query.order_by(entity.visited_at.desc())
 
         # 페이지네이션
         result = Pagination.from_query(query, pagination)
@@ -60,6 +53,58 @@ class VisitorService:
             page_size=result.page_size,
         )
 
+    def get_visitor_cursor_list(
+        self,
+        params: CursorParams,
+        search: Optional[VisitorSearchParams] = None,
+    ) -> CursorPagination[VisitorListResponse]:
+        """방문자 로그 목록 조회 (커서 기반, 최신순)"""
+        entity = self._source(search)
+        query = self._apply_search(self.db.query(entity), search, entity)
+
+        result = CursorPagination.from_query(
+            query, params, sort_column=entity.visited_at, id_column=entity.id
+        )
+        result.items = [VisitorListResponse.model_validate(v) for v in result.items]
+        return result
+
+    def iter_export_rows(
+        self,
+        search: Optional[VisitorSearchParams] = None,
+        batch_size: int = EXPORT_BATCH_SIZE,
+    ):
+        """내보내기용 방문 기록 행 (EXPORT_COLUMNS 순서, 최신순, 서버 측 커서로 배치 단위 조회)"""
+        entity = self._source(search)
+        columns = [getattr(entity, name) for name in EXPORT_COLUMNS]
+        query = self._apply_search(self.db.query(*columns), search, entity)
+        return query.order_by(entity.visited_at.desc(), entity.id.desc()).yield_per(batch_size)
+
+    def _source(self, search: Optional[VisitorSearchParams]):
+        """검색 기간에 해당하는 파티션만 읽는 방문 기록 엔티티"""
+        start = search.start_date if search else None
+        # 종료 시각은 포함 조건이므로 같은 시각까지 포함되도록 범위 끝을 살짝 넓힘
+        end = search.end_date + timedelta(microseconds=1) if search and search.end_date else None
+        return visitor_source(self.db, start, end)
+
+    def _apply_search(self, query, search: Optional[VisitorSearchParams], entity=Visitor):
+        """검색 조건 적용 (기간 조건은 visited_at 범위로 두어 파티션 프루닝에 사용)"""
+        if not search:
+            return query
+
+        if search.ip_address:
+            query = query.filter(
+                entity.ip_address.ilike(f"%{search.ip_address}%")
+            )
+        if search.device_type:
+            query = query.filter(entity.device_type == search.device_type)
+        if search.user_id:
+            query = query.filter(entity.user_id == search.user_id)
+        if search.start_date:
+            query = query.filter(entity.visited_at >= search.start_date)
+        if search.end_date:
+            query = query.filter(entity.visited_at <= search.end_date)
+        return query
+
     def get_daily_stats(
         self,
         start_date: date,
@@ -79,105 +124,19 @@ class VisitorService:
         return [DailyStatsResponse.model_validate(s) for s in stats]
 
     def get_dashboard_summary(self) -> DashboardSummary:
-        """대시보드 요약 통계"""
-        today = date.today()
-        yesterday = today - timedelta(days=1)
-
-        # 오늘 통계
-        today_stats = (
-            self.db.query(DailyStats).filter(DailyStats.date == today).first()
-        )
-        yesterday_stats = (
-            self.db.query(DailyStats).filter(DailyStats.date == yesterday).first()
-        )
-
-        # 기본값 설정
-        today_visits = today_stats.total_visits if today_stats else 0
-        today_unique = today_stats.unique_visitors if today_stats else 0
-        today_signups = today_stats.new_signups if today_stats else 0
-        today_revenue = today_stats.total_revenue if today_stats else 0
-
-        yesterday_visits = yesterday_stats.total_visits if yesterday_stats else 0
-        yesterday_unique = yesterday_stats.unique_visitors if yesterday_stats else 0
-        yesterday_signups = yesterday_stats.new_signups if yesterday_stats else 0
-        yesterday_revenue = yesterday_stats.total_revenue if yesterday_stats else 0
-
-        # 변화율 계산
-        def calc_change(today_val: int, yesterday_val: int) -> float:
-            if yesterday_val == 0:
-                return 100.0 if today_val > 0 else 0.0
-            return round((today_val - yesterday_val) / yesterday_val * 100, 1)
-
-        # 전체 통계 (다른 모듈에서 가져와야 함, 여기서는 예시)
-        # 실제로는 users, products, payments 모듈 연동 필요
-        from users.models import User, UserStatus
-        from products.models import Product
-        from payments.models import Payment, PaymentStatus
-
-        total_users = (
-            self.db.query(User)
-            .filter(User.status != UserStatus.DELETED.value)
-            .count()
-        )
-        total_products = self.db.query(Product).count()
-        total_orders = (
-            self.db.query(Payment)
-            .filter(Payment.status == PaymentStatus.COMPLETED.value)
-            .count()
-        )
-
-        return DashboardSummary(
-            today_visits=today_visits,
-            today_unique_visitors=today_unique,
-            today_signups=today_signups,
-            today_revenue=today_revenue,
-            visits_change=calc_change(today_visits, yesterday_visits),
-            visitors_change=calc_change(today_unique, yesterday_unique),
-            signups_change=calc_change(today_signups, yesterday_signups),
-            revenue_change=calc_change(today_revenue, yesterday_revenue),
-            total_users=total_users,
-            total_products=total_products,
-            total_orders=total_orders,
-        )
+        """대시보드 요약 통계 (대시보드 스냅샷에서 제공, 짧은 주기로 캐시됨)"""
+        return get_dashboard_snapshot(self.db).summary
 
     def get_visitor_stats(self) -> dict:
-        """방문자 통계 요약"""
-        today = date.today()
-
-        # 오늘 방문자 수
-        today_count = (
-            self.db.query(Visitor)
-            .filter(sql_func.date(Visitor.visited_at) == today)
-            .count()
-        )
-
-        # 오늘 고유 방문자 수
-        today_unique = (
-            self.db.query(sql_func.count(sql_func.distinct(Visitor.session_id)))
-            .filter(sql_func.date(Visitor.visited_at) == today)
-            .scalar()
-            or 0
-        )
+        """방문자 통계 요약 (오늘 업무 시간대 기준, 대시보드 스냅샷에서 제공)"""
+        return get_dashboard_snapshot(self.db).visitors
 
-        # 기기별 통계 (오늘)
-        device_stats = (
-            self.db.query(
-                Visitor.device_type,
-                sql_func.count(Visitor.id).label("count"),
-            )
-            .filter(sql_func.date(Visitor.visited_at) == today)
-            .group_by(Visitor.device_type)
-            .all()
-        )
-
-        devices = {d.device_type: d.count for d in device_stats if d.device_type}
-
-        return {
-            "today_visits": today_count,
-            "today_unique": today_unique,
-            "devices": {
-                "desktop": devices.get("desktop", 0),
-                "mobile": devices.get("mobile", 0),
-                "tablet": devices.get("tablet", 0),
-            },
-        }
+    def get_unique_visitors(
+        self,
+        start_date: date,
+        end_date: date,
+        device_type: Optional[str] = None,
+        exact: bool = False,
+    ) -> UniqueVisitorsResponse:
+        """기간 고유 방문자 수 (기본: HyperLogLog 스케치 병합 추정)"""
+        return count_unique_visitors(self.db, start_date, end_date, device_type, exact)
@@ -0,0 +1,213 @@
+"""
+고유 방문자 HyperLogLog 스케치
+
+업무 기준 날짜 x 기기 유형(전체 포함)별로 session_id의 HyperLogLog 스케치를 visitor_sketches에 저장한다.
+- 방문 기록 저장(tracker.flush)과 같은 트랜잭션에서 스케치를 갱신하므로 행과 스케치가 어긋나지 않는다
+- 스케치 병합은 레지스터별 최댓값이라 같은 방문을 여러 번 반영해도 결과가 같다 (재처리/재구성 안전)
+- 기간 고유 방문자 수는 날짜별 스케치를 합쳐 추정 (COUNT(DISTINCT) 없이 주/월 단위 집계 가능)
+- 스케치가 없는 날짜에 방문 기록이 있으면(스케치 도입 이전 데이터 등) 정확한 COUNT(DISTINCT)로 대체
+
+오차 범위는 common.hyperloglog 참고 (p=14, 표준 오차 약 0.81%)
+"""
+
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from typing import Iterable, Optional
+
+from sqlalchemy import distinct, func, or_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from common.dates import date_range, day_range, iter_dates, to_business_date
+from common.hyperloglog import HyperLogLog
+from .models import VisitorSketch
+from .partitions import visitor_source
+from .schemas import UniqueVisitorsResponse
+
+# 전체 기기 스케치 키
+ALL_DEVICES = "all"
+# 기기 유형을 알 수 없는 방문
+UNKNOWN_DEVICE = "unknown"
+
+
+def _device_key(device_type: Optional[str]) -> str:
+    return device_type or UNKNOWN_DEVICE
+
+
+def _group_sessions(rows: Iterable[tuple[date, Optional[str], Optional[str]]]) -> dict[tuple[date, str], set[str]]:
+    """(날짜, 기기 키)별 session_id 묶음 (전체 키 포함)"""
+    groups: dict[tuple[date, str], set[str]] = defaultdict(set)
+    for day, device_type, session_id in rows:
+        if not session_id:
+            continue
+        groups[(day, ALL_DEVICES)].add(session_id)
+        groups[(day, _device_key(device_type))].add(session_id)
+    return groups
+
+
+def _merge_sessions(db: Session, day: date, device_key: str, session_ids: set[str]) -> None:
+    """스케치 행에 session_id 반영 (행 잠금 후 갱신, 없으면 생성)"""
+    for _ in range(2):
+        sketch = (
+            db.query(VisitorSketch)
+            .filter(VisitorSketch.date == day, VisitorSketch.device_type == device_key)
+            .with_for_update()
+            .first()
+        )
+        if sketch is not None:
+            hll = HyperLogLog.from_bytes(sketch.registers)
+            hll.update(session_ids)
+            sketch.registers = hll.to_bytes()
+            return
+
+        hll = HyperLogLog()
+        hll.update(session_ids)
+        try:
+            with db.begin_nested():
+                db.add(VisitorSketch(date=day, device_type=device_key, registers=hll.to_bytes()))
+            return
+        except IntegrityError:
+            # 동시에 같은 행이 생성됨 -> 잠금 후 갱신으로 재시도
+            continue
+
+
+def record_visits(db: Session, events: Iterable[dict]) -> None:
+    """
+    방문 이벤트(visitors 행 값)를 스케치에 반영 (커밋은 호출자가 수행)
+
+    방문 기록 INSERT와 같은 트랜잭션에서 호출한다.
+    """
+    groups = _group_sessions(
+        (to_business_date(event["visited_at"]), event.get("device_type"), event.get("session_id"))
+        for event in events
+        if event.get("visited_at") is not None
+    )
+    # 잠금 순서를 고정해 동시 저장 간 교착 방지
+    for (day, device_key) in sorted(groups):
+        _merge_sessions(db, day, device_key, groups[(day, device_key)])
+
+
+def rebuild_sketches(db: Session, day: date, batch_size: int = 5000) -> None:
+    """
+    하루치 방문 기록으로 스케치 재구성 (기존 스케치에 합침, 커밋은 호출자가 수행)
+
+    스케치 도입 이전 날짜를 채우거나 누락을 보정할 때 사용한다.
+    기존 값을 지우지 않고 합치므로 보존 기간이 지나 원본이 삭제된 방문도 스케치에 남는다.
+    """
+    start, end = day_range(day)
+    visits = visitor_source(db, start, end)
+    rows = (
+        db.query(visits.device_type, visits.session_id)
+        .filter(visits.visited_at >= start, visits.visited_at < end)
+        .yield_per(batch_size)
+    )
+    groups = _group_sessions((day, device_type, session_id) for device_type, session_id in rows)
+    for (_, device_key) in sorted(groups):
+        _merge_sessions(db, day, device_key, groups[(day, device_key)])
+
+
+def _missing_day_ranges(days: list[date]) -> list[tuple[datetime, datetime]]:
+    """연속된 날짜를 묶은 UTC 반개구간 목록"""
+    ranges = []
+    run_start = prev = None
+    for day in days:
+        if prev is not None and day == prev + timedelta(days=1):
+            prev = day
+            continue
+        if run_start is not None:
+            ranges.append(date_range(run_start, prev))
+        run_start = prev = day
+    if run_start is not None:
+        ranges.append(date_range(run_start, prev))
+    return ranges
+
+
+def _has_unsketched_visits(db: Session, start_date: date, end_date: date) -> bool:
+    """스케치가 없는 날짜에 방문 기록이 있는지"""
+    sketched = {
+        day
+        for (day,) in db.query(VisitorSketch.date).filter(
+            VisitorSketch.date >= start_date,
+            VisitorSketch.date <= end_date,
+            VisitorSketch.device_type == ALL_DEVICES,
+        )
+    }
+    missing = [day for day in iter_dates(start_date, end_date) if day not in sketched]
+    if not missing:
+        return False
+    ranges = _missing_day_ranges(missing)
+    visits = visitor_source(db, ranges[0][0], ranges[-1][1])
+    conditions = [(visits.visited_at >= start) & (visits.visited_at < end) for start, end in ranges]
+    return db.query(visits.id).filter(or_(*conditions)).first() is not None
+
+
+def merge_sketches(
+    db: Session,
+    start_date: date,
+    end_date: date,
+    device_type: Optional[str] = None,
+) -> HyperLogLog:
+    """기간(양 끝 포함) 스케치 병합 결과"""
+    device_key = device_type or ALL_DEVICES
+    merged = HyperLogLog()
+    rows = db.query(VisitorSketch.registers).filter(
+        VisitorSketch.date >= start_date,
+        VisitorSketch.date <= end_date,
+        VisitorSketch.device_type == device_key,
+    )
+    for (registers,) in rows:
+        merged.merge(HyperLogLog.from_bytes(registers))
+    return merged
+
+
+def count_exact(
+    db: Session,
+    start_date: date,
+    end_date: date,
+    device_type: Optional[str] = None,
+) -> int:
+    """기간 고유 방문자 수 정확한 계산 (COUNT(DISTINCT session_id))"""
+    start, end = date_range(start_date, end_date)
+    visits = visitor_source(db, start, end)
+    query = db.query(func.count(distinct(visits.session_id))).filter(
+        visits.visited_at >= start, visits.visited_at < end
+    )
+    if device_type == UNKNOWN_DEVICE:
+        query = query.filter(visits.device_type.is_(None))
+    elif device_type:
+        query = query.filter(visits.device_type == device_type)
+    return query.scalar() or 0
+
+
+def count_unique_visitors(
+    db: Session,
+    start_date: date,
+    end_date: date,
+    device_type: Optional[str] = None,
+    exact: bool = False,
+) -> UniqueVisitorsResponse:
+    """
+    기간 고유 방문자 수
+
+    exact=False이면 스케치 병합으로 추정하고, 스케치가 없는 날짜에 방문 기록이 있으면
+    정확한 계산으로 대체한다.
+    """
+    if not exact and not _has_unsketched_visits(db, start_date, end_date):
+        hll = merge_sketches(db, start_date, end_date, device_type)
+        return UniqueVisitorsResponse(
+            start_date=start_date,
+            end_date=end_date,
+            device_type=device_type,
+            unique_visitors=hll.count(),
+            is_approximate=True,
+            standard_error=round(hll.standard_error, 4),
+        )
+
+    return UniqueVisitorsResponse(
+        start_date=start_date,
+        end_date=end_date,
+        device_type=device_type,
+        unique_visitors=count_exact(db, start_date, end_date, device_type),
+        is_approximate=False,
+        standard_error=0.0,
+    )
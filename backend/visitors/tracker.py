@@ -0,0 +1,269 @@
+"""
+방문 기록 수집기
+
+요청 처리 중에는 방문 이벤트를 메모리 큐에 넣기만 하고,
+백그라운드 작업이 일정 주기(VISITOR_FLUSH_INTERVAL_MS) 또는
+일정 건수(VISITOR_FLUSH_BATCH_SIZE)가 쌓였을 때 다중 행 INSERT로 visitors 테이블에 저장한다.
+- 큐는 최대 크기(VISITOR_QUEUE_MAX_SIZE)를 넘으면 새 이벤트를 버린다 (요청을 막지 않음)
+- 저장 실패 시 이벤트를 큐 앞쪽으로 되돌려 다음 주기에 재시도
+  - 앞쪽 묶음이 max_attempts(VISITOR_FLUSH_MAX_ATTEMPTS)번 연속 실패하면 반씩 나누어 저장하고
+    저장되지 않는 행(잘못된 값 등)이 든 쪽만 버려 뒤의 이벤트가 계속 막히지 않게 한다
+- 방문 시각은 이벤트 발생 시각으로 기록
+- 저장과 같은 트랜잭션에서 고유 방문자 스케치(visitor_sketches) 갱신
+
+Example:
+    visitor_tracker.track_request(request, page_url="/products/1")
+    visitor_tracker.flush(db)   # 백그라운드 작업에서 호출
+"""
+
+import hashlib
+from collections import deque
+from datetime import datetime, timezone
+from typing import Callable, Optional
+
+from fastapi import Request
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from core.config import settings
+from core.database import SessionLocal
+from .models import Visitor
+from .sketches import record_visits
+from .user_agent import parse_user_agent
+
+# 백그라운드 작업 이름 (main.py에서 등록)
+FLUSH_TASK_NAME = "visitor_events"
+
+# 세션 ID 쿠키 이름 (프론트엔드에서 발급)
+SESSION_COOKIE = "visitor_session_id"
+
+
+def _truncate(value: Optional[str], length: int) -> Optional[str]:
+    if value is None:
+        return None
+    return value[:length]
+
+
+def get_client_ip(request: Request) -> str:
+    """클라이언트 IP 추출 (프록시 헤더 우선)"""
+    forwarded = request.headers.get("x-forwarded-for")
+    if forwarded:
+        return forwarded.split(",")[0].strip()
+    real_ip = request.headers.get("x-real-ip")
+    if real_ip:
+        return real_ip
+    return request.client.host if request.client else "unknown"
+
+
+class VisitorEventQueue:
+    """방문 이벤트 큐 (여러 스레드에서 사용 가능)"""
+
+    def __init__(
+        self,
+        max_size: int = 50000,
+        batch_size: int = 500,
+        on_batch_ready: Optional[Callable[[], None]] = None,
+        max_attempts: int = 3,
+    ):
+        self.max_size = max_size
+        self.batch_size = batch_size
+        self.on_batch_ready = on_batch_ready
+        self.max_attempts = max_attempts
+        # 앞쪽 묶음이 연속으로 저장에 실패한 횟수
+        self._failed_attempts = 0
+        # deque의 append/popleft는 원자적이므로 별도 잠금 없이 사용
+        self._queue: deque[dict] = deque()
+        self._flush_requested = False
+        self.dropped_count = 0
+        self.flushed_count = 0
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def track(
+        self,
+        ip_address: Optional[str] = None,
+        user_agent: Optional[str] = None,
+        page_url: Optional[str] = None,
+        referrer: Optional[str] = None,
+        session_id: Optional[str] = None,
+        user_id: Optional[int] = None,
+    ) -> bool:
+        """
+        방문 이벤트 추가
+
+        Returns:
+            큐에 들어가면 True, 큐가 가득 차서 버려지면 False
+        """
+        if len(self._queue) >= self.max_size:
+            self.dropped_count += 1
+            return False
+
+        device_type, browser, os = parse_user_agent(user_agent)
+        self._queue.append({
+            "ip_address": _truncate(ip_address, 45),
+            "user_agent": user_agent,
+            "device_type": device_type,
+            "browser": _truncate(browser, 50),
+            "os": _truncate(os, 50),
+            "page_url": _truncate(page_url, 500),
+            "referrer": _truncate(referrer, 500),
+            "session_id": _truncate(session_id, 100),
+            "user_id": user_id,
+            "visited_at": datetime.now(timezone.utc),
+        })
+
+        if len(self._queue) >= self.batch_size and not self._flush_requested:
+            self._flush_requested = True
+            if self.on_batch_ready:
+                self.on_batch_ready()
+        return True
+
+    def track_request(
+        self,
+        request: Request,
+        page_url: Optional[str] = None,
+        referrer: Optional[str] = None,
+        session_id: Optional[str] = None,
+        user_id: Optional[int] = None,
+    ) -> bool:
+        """요청 정보로 방문 이벤트 추가 (값을 주지 않으면 요청 헤더/쿠키에서 채움)"""
+        ip_address = get_client_ip(request)
+        user_agent = request.headers.get("user-agent")
+        if not session_id:
+            session_id = request.cookies.get(SESSION_COOKIE)
+        if not session_id:
+            # 세션 쿠키가 없으면 IP + User-Agent로 방문자 구분
+            digest = hashlib.sha1(f"{ip_address}|{user_agent}".encode("utf-8")).hexdigest()[:16]
+            session_id = f"anon:{digest}"
+
+        return self.track(
+            ip_address=ip_address,
+            user_agent=user_agent,
+            page_url=page_url or request.url.path,
+            referrer=referrer or request.headers.get("referer"),
+            session_id=session_id,
+            user_id=user_id,
+        )
+
+    def _save(self, db: Session, batch: list[dict]) -> None:
+        """묶음 저장 (실패하면 롤백 후 예외 전파)"""
+        try:
+            # executemany 형태로 실행 (PostgreSQL 드라이버는 다중 행 VALUES로 묶어 전송,
+            # 거대한 INSERT ... VALUES 문을 직접 만드는 것보다 컴파일 비용이 적음)
+            db.execute(insert(Visitor.__table__), batch)
+            # 고유 방문자 스케치도 같은 트랜잭션에서 갱신
+            record_visits(db, batch)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+
+    def _save_isolating(self, db: Session, batch: list[dict]) -> int:
+        """
+        계속 실패하는 묶음을 반씩 나누어 저장하고 실패하는 쪽만 더 나눔 (저장한 수 반환)
+
+        두 쪽이 모두 실패하면 (DB 장애, 잘못된 행이 여러 개 등) 더 나누지 않고 버린다.
+        """
+        if len(batch) <= 1:
+            self.dropped_count += len(batch)
+            return 0
+
+        middle = len(batch) // 2
+        failed = []
+        saved = 0
+        for half in (batch[:middle], batch[middle:]):
+            try:
+                self._save(db, half)
+                saved += len(half)
+            except Exception:
+                failed.append(half)
+
+        if len(failed) == 2:
+            self.dropped_count += len(batch)
+            return 0
+        for half in failed:
+            saved += self._save_isolating(db, half)
+        return saved
+
+    def flush(self, db: Session) -> int:
+        """
+        쌓인 이벤트를 batch_size 단위로 묶어 저장
+
+        호출 시점에 쌓여 있던 분량까지만 처리한다 (계속 유입되어도 끝없이 돌지 않음).
+
+        Returns:
+            저장한 이벤트 수
+        """
+        self._flush_requested = False
+        remaining = len(self._queue)
+        saved = 0
+
+        while remaining > 0:
+            batch = []
+            while len(batch) < min(self.batch_size, remaining):
+                try:
+                    batch.append(self._queue.popleft())
+                except IndexError:
+                    break
+            if not batch:
+                break
+            remaining -= len(batch)
+
+            try:
+                self._save(db, batch)
+            except Exception as e:
+                self._failed_attempts += 1
+                if self._failed_attempts < self.max_attempts:
+                    # 저장하지 못한 이벤트를 앞쪽으로 되돌림 (최대 크기를 넘는 분량은 버림)
+                    room = max(self.max_size - len(self._queue), 0)
+                    restored = batch[:room]
+                    self._queue.extendleft(reversed(restored))
+                    self.dropped_count += len(batch) - len(restored)
+                    raise
+
+                # 같은 묶음이 계속 실패 -> 저장되지 않는 행을 골라 버리고 다음 묶음으로 진행
+                self._failed_attempts = 0
+                stored = self._save_isolating(db, batch)
+                print(f"[Visitors] 저장 {self.max_attempts}회 실패, {len(batch) - stored}건 버림 ({type(e).__name__})")
+                saved += stored
+                self.flushed_count += stored
+                continue
+
+            self._failed_attempts = 0
+            saved += len(batch)
+            self.flushed_count += len(batch)
+
+        return saved
+
+    def get_status(self) -> dict:
+        """큐 상태"""
+        return {
+            "queued": len(self._queue),
+            "max_size": self.max_size,
+            "flushed": self.flushed_count,
+            "dropped": self.dropped_count,
+        }
+
+
+def _request_flush() -> None:
+    from core.background import background_tasks
+
+    background_tasks.trigger(FLUSH_TASK_NAME)
+
+
+visitor_tracker = VisitorEventQueue(
+    max_size=settings.VISITOR_QUEUE_MAX_SIZE,
+    batch_size=settings.VISITOR_FLUSH_BATCH_SIZE,
+    on_batch_ready=_request_flush,
+    max_attempts=settings.VISITOR_FLUSH_MAX_ATTEMPTS,
+)
+
+
+def flush_visitor_events() -> None:
+    """백그라운드 작업용 진입점 (자체 세션 사용)"""
+    db = SessionLocal()
+    try:
+        visitor_tracker.flush(db)
+    finally:
+        db.close()
@@ -0,0 +1,73 @@
+"""
+User-Agent 파싱
+
+방문 기록용으로 기기 종류/브라우저/OS만 간단히 판별한다.
+같은 User-Agent가 반복되므로 결과를 캐시해 요청마다 정규식을 다시 돌리지 않는다.
+"""
+
+import re
+from functools import lru_cache
+from typing import NamedTuple, Optional
+
+# (패턴, 이름) - 앞에서부터 먼저 일치하는 항목 사용 (Chrome 계열 UA에 Safari가 함께 들어있으므로 순서 중요)
+_BROWSERS = [
+    (re.compile(r"KAKAOTALK", re.I), "KakaoTalk"),
+    (re.compile(r"NAVER\(inapp", re.I), "Naver App"),
+    (re.compile(r"SamsungBrowser", re.I), "Samsung Internet"),
+    (re.compile(r"Whale/", re.I), "Whale"),
+    (re.compile(r"Edg(e|A|iOS)?/", re.I), "Edge"),
+    (re.compile(r"OPR/|Opera", re.I), "Opera"),
+    (re.compile(r"Firefox/|FxiOS/", re.I), "Firefox"),
+    (re.compile(r"Chrome/|CriOS/", re.I), "Chrome"),
+    (re.compile(r"Safari/", re.I), "Safari"),
+    (re.compile(r"MSIE |Trident/", re.I), "Internet Explorer"),
+]
+
+_OPERATING_SYSTEMS = [
+    (re.compile(r"iPhone|iPad|iPod", re.I), "iOS"),
+    (re.compile(r"Android", re.I), "Android"),
+    (re.compile(r"Windows", re.I), "Windows"),
+    (re.compile(r"Mac OS X|Macintosh", re.I), "macOS"),
+    (re.compile(r"CrOS", re.I), "Chrome OS"),
+    (re.compile(r"Linux", re.I), "Linux"),
+]
+
+_BOT_RE = re.compile(r"bot|crawler|spider|slurp|curl|wget|python-requests|headless", re.I)
+_TABLET_RE = re.compile(r"iPad|Tablet|PlayBook|Silk|(Android(?!.*Mobile))", re.I)
+_MOBILE_RE = re.compile(r"Mobi|iPhone|iPod|Android.*Mobile|Windows Phone", re.I)
+
+
+class UserAgentInfo(NamedTuple):
+    """User-Agent 판별 결과"""
+    device_type: Optional[str]  # desktop, mobile, tablet, bot
+    browser: Optional[str]
+    os: Optional[str]
+
+
+def _match(rules, user_agent: str) -> Optional[str]:
+    for pattern, name in rules:
+        if pattern.search(user_agent):
+            return name
+    return None
+
+
+@lru_cache(maxsize=4096)
+def parse_user_agent(user_agent: Optional[str]) -> UserAgentInfo:
+    """User-Agent 문자열에서 기기 종류/브라우저/OS 판별"""
+    if not user_agent:
+        return UserAgentInfo(None, None, None)
+
+    if _BOT_RE.search(user_agent):
+        device_type = "bot"
+    elif _TABLET_RE.search(user_agent):
+        device_type = "tablet"
+    elif _MOBILE_RE.search(user_agent):
+        device_type = "mobile"
+    else:
+        device_type = "desktop"
+
+    return UserAgentInfo(
+        device_type=device_type,
+        browser=_match(_BROWSERS, user_agent),
+        os=_match(_OPERATING_SYSTEMS, user_agent),
+    )